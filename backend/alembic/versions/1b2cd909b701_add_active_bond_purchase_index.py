@@ -0,0 +1,32 @@
+"""Add partial covering index for active bond purchases
+
+Revision ID: 1b2cd909b701
+Revises: b0cdf5e18bf0
+Create Date: 2025-11-25 15:03:27.118440
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b2cd909b701'
+down_revision = 'b0cdf5e18bf0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_bp_active_user_type', 'bond_purchases', ['user_id', 'bond_type_id'], unique=False,
+            postgresql_include=['bond_shares', 'face_value'],
+            postgresql_where=sa.text("purchase_status = 'ACTIVE'"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_bp_active_user_type', table_name='bond_purchases', postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""Add monthly_summary_mv materialized view over coupon payments
+
+Revision ID: 2a77cc512e86
+Revises: 4609f23a4ad6
+Create Date: 2025-11-24 14:02:51.660218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2a77cc512e86'
+down_revision = '4609f23a4ad6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Amounts are stored as BIGINT cents; the view exposes them as NUMERIC(15, 2)
+    op.execute("""
+        CREATE MATERIALIZED VIEW monthly_summary_mv AS
+        SELECT
+            date_trunc('month', payment_date)::date AS summary_month,
+            (SUM(gross_coupon_amount) / 100.0)::NUMERIC(15, 2) AS total_gross,
+            (SUM(withholding_tax) / 100.0)::NUMERIC(15, 2) AS total_wht,
+            (SUM(boz_fees) / 100.0)::NUMERIC(15, 2) AS total_boz,
+            (SUM(coop_fees) / 100.0)::NUMERIC(15, 2) AS total_coop_fees,
+            (SUM(net_payment_amount) / 100.0)::NUMERIC(15, 2) AS total_net,
+            COUNT(*) AS payment_count,
+            COUNT(DISTINCT user_id) AS members_paid
+        FROM coupon_payments
+        GROUP BY 1
+    """)
+    # A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute("CREATE UNIQUE INDEX ix_monthly_summary_mv_month ON monthly_summary_mv (summary_month)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS monthly_summary_mv")
@@ -0,0 +1,30 @@
+"""Add unique keys for coupon payment periods and vouchers
+
+Revision ID: 3e5f0a7c2d41
+Revises: 1b2cd909b701
+Create Date: 2025-11-25 16:20:41.503218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e5f0a7c2d41'
+down_revision = '1b2cd909b701'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Sequence-numbered references no longer stop a period or voucher being created twice
+    op.create_unique_constraint(
+        'uk_coupon_purchase_period', 'coupon_payments',
+        ['purchase_id', 'payment_period_start', 'payment_period_end']
+    )
+    op.create_unique_constraint('uk_voucher_payment', 'payment_vouchers', ['payment_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uk_voucher_payment', 'payment_vouchers', type_='unique')
+    op.drop_constraint('uk_coupon_purchase_period', 'coupon_payments', type_='unique')
@@ -0,0 +1,65 @@
+"""Store monetary columns as BIGINT cents
+
+Revision ID: 4609f23a4ad6
+Revises: cfbb3e186ea9
+Create Date: 2025-11-24 11:26:05.317904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4609f23a4ad6'
+down_revision = 'cfbb3e186ea9'
+branch_labels = None
+depends_on = None
+
+
+MONEY_COLUMNS = {
+    'coupon_payments': [
+        'gross_coupon_amount', 'withholding_tax', 'boz_fees', 'coop_fees', 'net_payment_amount'
+    ],
+    'payment_vouchers': ['total_amount'],
+    'payment_events': [
+        'boz_award_amount', 'expected_total_net_maturity', 'expected_total_net_coupon'
+    ],
+    'member_payments': [
+        'boz_award_value', 'base_amount', 'coop_discount_fee', 'net_discount_value',
+        'gross_coupon_from_boz', 'withholding_tax', 'boz_fee', 'coop_fee_on_coupon',
+        'net_maturity_coupon', 'net_coupon_payment'
+    ],
+}
+
+
+def _existing_tables() -> set:
+    # payment_events / member_payments are created by scripts/migrate_add_bond_issues.py
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    tables = _existing_tables()
+    for table, columns in MONEY_COLUMNS.items():
+        if table not in tables:
+            continue
+        for column in columns:
+            op.alter_column(
+                table, column,
+                type_=sa.BigInteger(),
+                existing_type=sa.Numeric(15, 2),
+                postgresql_using=f'round({column} * 100)::BIGINT'
+            )
+
+
+def downgrade() -> None:
+    tables = _existing_tables()
+    for table, columns in MONEY_COLUMNS.items():
+        if table not in tables:
+            continue
+        for column in columns:
+            op.alter_column(
+                table, column,
+                type_=sa.Numeric(15, 2),
+                existing_type=sa.BigInteger(),
+                postgresql_using=f'({column} / 100.0)::NUMERIC(15, 2)'
+            )
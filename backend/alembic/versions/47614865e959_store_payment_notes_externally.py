@@ -0,0 +1,36 @@
+"""Store payment and purchase notes with EXTERNAL storage
+
+Revision ID: 47614865e959
+Revises: 52bcb7052566
+Create Date: 2025-11-24 16:55:08.418736
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '47614865e959'
+down_revision = '52bcb7052566'
+branch_labels = None
+depends_on = None
+
+
+# Free-text columns on tables scanned by listing and payment runs
+NOTES_COLUMNS = [
+    ('coupon_payments', 'notes'),
+    ('payment_vouchers', 'notes'),
+    ('bond_purchases', 'notes'),
+]
+
+
+def upgrade() -> None:
+    # EXTERNAL moves long values out of line without trying to compress them inline first,
+    # keeping heap rows narrow for scans that never read the notes
+    for table, column in NOTES_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    for table, column in NOTES_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTENDED")
@@ -0,0 +1,40 @@
+"""Stamp coupon and member payment rows with statement_timestamp()
+
+Revision ID: 52bcb7052566
+Revises: 9c9c15d31d4c
+Create Date: 2025-11-24 16:18:33.271950
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '52bcb7052566'
+down_revision = '9c9c15d31d4c'
+branch_labels = None
+depends_on = None
+
+
+def _tables() -> list:
+    # member_payments is created by scripts/migrate_add_bond_issues.py
+    existing = sa.inspect(op.get_bind()).get_table_names()
+    return [t for t in ('coupon_payments', 'member_payments') if t in existing]
+
+
+def upgrade() -> None:
+    for table in _tables():
+        op.alter_column(
+            table, 'created_at',
+            existing_type=sa.DateTime(timezone=True),
+            server_default=sa.text('statement_timestamp()')
+        )
+
+
+def downgrade() -> None:
+    for table in _tables():
+        op.alter_column(
+            table, 'created_at',
+            existing_type=sa.DateTime(timezone=True),
+            server_default=sa.text('now()')
+        )
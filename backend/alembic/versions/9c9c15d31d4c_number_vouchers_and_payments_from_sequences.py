@@ -0,0 +1,47 @@
+"""Number vouchers and coupon payments from database sequences
+
+Revision ID: 9c9c15d31d4c
+Revises: 2a77cc512e86
+Create Date: 2025-11-24 15:40:12.904571
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c9c15d31d4c'
+down_revision = '2a77cc512e86'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence('voucher_number_seq')))
+    op.execute(sa.schema.CreateSequence(sa.Sequence('payment_reference_seq')))
+
+    # Existing numbers end in the payment / purchase id, so start past those to avoid collisions
+    op.execute(
+        "SELECT setval('voucher_number_seq', COALESCE((SELECT MAX(payment_id) FROM coupon_payments), 0) + 1, false)"
+    )
+    op.execute(
+        "SELECT setval('payment_reference_seq', COALESCE((SELECT MAX(purchase_id) FROM bond_purchases), 0) + 1, false)"
+    )
+
+    op.alter_column(
+        'payment_vouchers', 'voucher_number',
+        existing_type=sa.String(length=50),
+        server_default=sa.text("('VOC' || to_char(CURRENT_DATE, 'YYYY') || to_char(nextval('voucher_number_seq'), 'FM000000'))")
+    )
+    op.alter_column(
+        'coupon_payments', 'payment_reference',
+        existing_type=sa.String(length=50),
+        server_default=sa.text("('PAY' || to_char(CURRENT_DATE, 'YYYYMMDD') || to_char(nextval('payment_reference_seq'), 'FM000000'))")
+    )
+
+
+def downgrade() -> None:
+    op.alter_column('coupon_payments', 'payment_reference', existing_type=sa.String(length=50), server_default=None)
+    op.alter_column('payment_vouchers', 'voucher_number', existing_type=sa.String(length=50), server_default=None)
+    op.execute(sa.schema.DropSequence(sa.Sequence('payment_reference_seq')))
+    op.execute(sa.schema.DropSequence(sa.Sequence('voucher_number_seq')))
@@ -0,0 +1,35 @@
+"""Add monthly_purchases_mv materialized view over bond purchases
+
+Revision ID: b0cdf5e18bf0
+Revises: fd558952bd03
+Create Date: 2025-11-25 14:12:08.531862
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b0cdf5e18bf0'
+down_revision = 'fd558952bd03'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW monthly_purchases_mv AS
+        SELECT
+            date_trunc('month', purchase_date)::date AS summary_month,
+            SUM(purchase_price) AS total_purchases,
+            SUM(coop_discount_fee) AS coop_discount_fees,
+            COUNT(*) AS new_purchases
+        FROM bond_purchases
+        GROUP BY 1
+    """)
+    # A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute("CREATE UNIQUE INDEX ix_monthly_purchases_mv_month ON monthly_purchases_mv (summary_month)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS monthly_purchases_mv")
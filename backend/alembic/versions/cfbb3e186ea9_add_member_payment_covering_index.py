@@ -0,0 +1,46 @@
+"""Add covering index on member_payments for per-event reports
+
+Revision ID: cfbb3e186ea9
+Revises: e09db0c4fd38
+Create Date: 2025-11-24 10:03:17.882415
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cfbb3e186ea9'
+down_revision = 'e09db0c4fd38'
+branch_labels = None
+depends_on = None
+
+
+def _has_member_payments() -> bool:
+    # member_payments is created by scripts/migrate_add_bond_issues.py, which
+    # builds the index from the model metadata itself
+    return 'member_payments' in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    if not _has_member_payments():
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_mp_event_member_cover', 'member_payments', ['payment_event_id', 'member_id'], unique=False,
+            postgresql_include=['net_coupon_payment', 'net_maturity_coupon', 'gross_coupon_from_boz', 'withholding_tax'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    if not _has_member_payments():
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_mp_event_member_cover', table_name='member_payments',
+            postgresql_concurrently=True, if_exists=True
+        )
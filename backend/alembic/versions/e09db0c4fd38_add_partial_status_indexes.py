@@ -0,0 +1,37 @@
+"""Add partial indexes for pending payments and open vouchers
+
+Revision ID: e09db0c4fd38
+Revises: 2c1dd196fdd7
+Create Date: 2025-11-24 09:12:41.503112
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e09db0c4fd38'
+down_revision = '2c1dd196fdd7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_coupon_pending', 'coupon_payments', ['payment_date'], unique=False,
+            postgresql_where=sa.text("payment_status = 'PENDING'"),
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_voucher_open', 'payment_vouchers', ['voucher_date'], unique=False,
+            postgresql_where=sa.text("voucher_status IN ('DRAFT', 'ISSUED')"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_voucher_open', table_name='payment_vouchers', postgresql_concurrently=True)
+        op.drop_index('ix_coupon_pending', table_name='coupon_payments', postgresql_concurrently=True)
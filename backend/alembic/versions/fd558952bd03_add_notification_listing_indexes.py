@@ -0,0 +1,36 @@
+"""Add notification listing indexes
+
+Revision ID: fd558952bd03
+Revises: 47614865e959
+Create Date: 2025-11-25 09:31:44.207516
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'fd558952bd03'
+down_revision = '47614865e959'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notif_user_created', 'notifications', ['user_id', sa.text('created_at DESC')], unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_notif_unread', 'notifications', ['user_id', sa.text('created_at DESC')], unique=False,
+            postgresql_where=sa.text('is_read IS false'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_notif_unread', table_name='notifications', postgresql_concurrently=True)
+        op.drop_index('ix_notif_user_created', table_name='notifications', postgresql_concurrently=True)
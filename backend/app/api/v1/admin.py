@@ -8,6 +8,7 @@ from decimal import Decimal
 from app.core.database import get_db
 from app.core.security import require_role
 from app.models import User, PaymentEvent
+from app.models.types import to_cents
 from app.services.payment_calculator import PaymentCalculatorService
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
@@ -24,11 +25,11 @@ def get_audit_report(
     """
     report = PaymentCalculatorService.get_audit_report(db)
 
-    # Calculate overall totals
-    total_calculated_maturity = sum(Decimal(str(r["calculated_net_maturity"])) for r in report)
-    total_expected_maturity = sum(Decimal(str(r["expected_net_maturity"])) for r in report)
-    total_calculated_coupon = sum(Decimal(str(r["calculated_net_coupon"])) for r in report)
-    total_expected_coupon = sum(Decimal(str(r["expected_net_coupon"])) for r in report)
+    # Calculate overall totals in integer cents
+    total_calculated_maturity = sum(to_cents(r["calculated_net_maturity"]) for r in report)
+    total_expected_maturity = sum(to_cents(r["expected_net_maturity"]) for r in report)
+    total_calculated_coupon = sum(to_cents(r["calculated_net_coupon"]) for r in report)
+    total_expected_coupon = sum(to_cents(r["expected_net_coupon"]) for r in report)
 
     maturity_difference = total_calculated_maturity - total_expected_maturity
     coupon_difference = total_calculated_coupon - total_expected_coupon
@@ -41,13 +42,13 @@ def get_audit_report(
         "summary": {
             "total_events": len(report),
             "events_with_discrepancies": discrepancy_count,
-            "total_calculated_net_maturity": float(total_calculated_maturity),
-            "total_expected_net_maturity": float(total_expected_maturity),
-            "total_maturity_difference": float(maturity_difference),
-            "total_calculated_net_coupon": float(total_calculated_coupon),
-            "total_expected_net_coupon": float(total_expected_coupon),
-            "total_coupon_difference": float(coupon_difference),
-            "has_overall_discrepancy": abs(maturity_difference) > Decimal("0.01") or abs(coupon_difference) > Decimal("0.01")
+            "total_calculated_net_maturity": total_calculated_maturity / 100,
+            "total_expected_net_maturity": total_expected_maturity / 100,
+            "total_maturity_difference": maturity_difference / 100,
+            "total_calculated_net_coupon": total_calculated_coupon / 100,
+            "total_expected_net_coupon": total_expected_coupon / 100,
+            "total_coupon_difference": coupon_difference / 100,
+            "has_overall_discrepancy": abs(maturity_difference) > 1 or abs(coupon_difference) > 1
         }
     }
 
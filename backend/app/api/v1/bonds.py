@@ -19,6 +19,7 @@ from app.schemas.bond import (
     BondPurchaseResponse
 )
 from app.services.bond_calculator import BondCalculator
+from app.services.notification_service import NotificationService
 
 router = APIRouter(prefix="/bonds", tags=["Bonds"])
 
@@ -82,6 +83,10 @@ def create_interest_rate(
     db.add(db_rate)
     db.commit()
     db.refresh(db_rate)
+
+    # Members holding this bond type are notified on a Celery worker
+    NotificationService.notify_rate_update(db_rate.rate_id)
+
     return db_rate
 
 
@@ -272,8 +277,11 @@ async def import_excel(
         "errors": []
     }
 
-    # Process each row
-    for index, row in df.iterrows():
+    # Hash the shared default password once rather than per new user
+    default_password_hash = get_password_hash("change123")
+
+    # Process each row; plain dicts avoid building a Series per row
+    for index, row in zip(df.index, df.to_dict('records')):
         try:
             # Skip rows without bond shares or with 0 shares
             if pd.isna(row.get('Bond Shares')) or float(row.get('Bond Shares', 0)) == 0:
@@ -298,7 +306,7 @@ async def import_excel(
                 user = User(
                     username=username,
                     email=email,
-                    password_hash=get_password_hash("change123"),
+                    password_hash=default_password_hash,
                     first_name=first_name,
                     last_name=last_name,
                     user_role=UserRole.MEMBER,
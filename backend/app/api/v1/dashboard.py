@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, type_coerce
 from typing import Dict
 from datetime import date, timedelta
 from decimal import Decimal
@@ -8,9 +8,10 @@ from decimal import Decimal
 from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models import (
-    User, BondIssue, MemberBondHolding, PaymentEvent,
-    MemberPayment, BondPurchase
+    User, UserRole, BondIssue, MemberBondHolding, PaymentEvent,
+    MemberPayment, BondPurchase, PurchaseStatus
 )
+from app.models.types import MoneyCents
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
@@ -35,7 +36,7 @@ def get_dashboard(
 
     # Total number of all members (from users)
     total_members = db.query(func.count(User.user_id)).filter(
-        User.user_role == "member"
+        User.user_role == UserRole.MEMBER
     ).scalar() or 0
 
     # Total face value across all holdings
@@ -95,10 +96,14 @@ def get_dashboard(
             MemberPayment.payment_event_id == event.id
         ).scalar() or 0
 
-        # Sum of total payments
+        # Sum of total payments; adding two MoneyCents columns gives a plain integer
+        # expression, so coerce it back to load the sum as a Decimal amount
         total_paid = db.query(
             func.coalesce(
-                func.sum(MemberPayment.net_maturity_coupon + MemberPayment.net_coupon_payment),
+                func.sum(type_coerce(
+                    MemberPayment.net_maturity_coupon + MemberPayment.net_coupon_payment,
+                    MoneyCents()
+                )),
                 0
             )
         ).filter(
@@ -127,7 +132,7 @@ def get_dashboard(
     ).scalar() or 0
 
     active_purchases = db.query(func.count(BondPurchase.purchase_id)).filter(
-        BondPurchase.purchase_status == "active"
+        BondPurchase.purchase_status == PurchaseStatus.ACTIVE
     ).scalar() or 0
 
     return {
@@ -7,6 +7,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user, require_role
 from app.models.user import User
 from app.services.excel_service import ExcelService
+from app.services.reporting_service import ReportingService
 
 router = APIRouter(prefix="/exports", tags=["Exports"])
 
@@ -129,6 +130,9 @@ def import_bond_purchases(
         # Clean up temp file
         os.remove(filepath)
 
+        if results['success']:
+            ReportingService.refresh_monthly_summary_view(db)
+
         return {
             "message": f"Import completed: {len(results['success'])} successful, {len(results['errors'])} errors",
             "total": results['total'],
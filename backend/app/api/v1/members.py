@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+import orjson
 from typing import List, Optional
-from decimal import Decimal
 
 from app.core.database import get_db
 from app.core.security import get_current_user, require_role
 from app.models import User, UserRole, MemberBondHolding, BondIssue
+from app.models.types import to_cents
 from app.services.payment_calculator import PaymentCalculatorService
 
 router = APIRouter(prefix="/members", tags=["Members"])
@@ -125,39 +127,56 @@ def get_member_payments_report(
             detail="Member not found"
         )
 
-    # Get payments using the service
+    # Get payments using the service; rows are streamed out as they are fetched
     payments = PaymentCalculatorService.get_member_payments(db, member_id, bond_id)
 
-    # Calculate totals
-    total_boz_award = sum(Decimal(str(p["boz_award_value"])) for p in payments)
-    total_net_discount = sum(Decimal(str(p["net_discount_value"])) for p in payments)
-    total_net_maturity_coupon = sum(Decimal(str(p["net_maturity_coupon"])) for p in payments)
-    total_net_coupon = sum(Decimal(str(p["net_coupon_payment"])) for p in payments)
-    total_gross = sum(Decimal(str(p["gross_coupon_from_boz"])) for p in payments)
-    total_taxes = sum(Decimal(str(p["withholding_tax"])) for p in payments)
-    total_fees = sum(
-        Decimal(str(p["boz_fee"])) +
-        Decimal(str(p["coop_fee_on_coupon"])) +
-        Decimal(str(p["coop_discount_fee"]))
-        for p in payments
-    )
-
-    return {
+    header = orjson.dumps({
         "member_id": member_id,
         "member_name": f"{member.first_name} {member.last_name}",
-        "member_email": member.email,
-        "payments": payments,
-        "totals": {
-            "total_boz_award_value": float(total_boz_award),
-            "total_net_discount_value": float(total_net_discount),
-            "total_net_maturity_coupon": float(total_net_maturity_coupon),
-            "total_net_coupon_payment": float(total_net_coupon),
-            "total_gross_coupon": float(total_gross),
-            "total_taxes": float(total_taxes),
-            "total_fees": float(total_fees)
-        },
-        "payment_count": len(payments)
-    }
+        "member_email": member.email
+    })
+
+    def stream_report():
+        # Totals are accumulated in integer cents while the payments are written
+        total_boz_award = 0
+        total_net_discount = 0
+        total_net_maturity_coupon = 0
+        total_net_coupon = 0
+        total_gross = 0
+        total_taxes = 0
+        total_fees = 0
+        payment_count = 0
+
+        yield header[:-1] + b',"payments":['
+        for p in payments:
+            total_boz_award += to_cents(p["boz_award_value"])
+            total_net_discount += to_cents(p["net_discount_value"])
+            total_net_maturity_coupon += to_cents(p["net_maturity_coupon"])
+            total_net_coupon += to_cents(p["net_coupon_payment"])
+            total_gross += to_cents(p["gross_coupon_from_boz"])
+            total_taxes += to_cents(p["withholding_tax"])
+            total_fees += (
+                to_cents(p["boz_fee"]) +
+                to_cents(p["coop_fee_on_coupon"]) +
+                to_cents(p["coop_discount_fee"])
+            )
+            yield (b"," if payment_count else b"") + orjson.dumps(p)
+            payment_count += 1
+
+        yield b"]," + orjson.dumps({
+            "totals": {
+                "total_boz_award_value": total_boz_award / 100,
+                "total_net_discount_value": total_net_discount / 100,
+                "total_net_maturity_coupon": total_net_maturity_coupon / 100,
+                "total_net_coupon_payment": total_net_coupon / 100,
+                "total_gross_coupon": total_gross / 100,
+                "total_taxes": total_taxes / 100,
+                "total_fees": total_fees / 100
+            },
+            "payment_count": payment_count
+        })[1:]
+
+    return StreamingResponse(stream_report(), media_type="application/json")
 
 
 @router.get("/{member_id}/holdings", response_model=List[dict])
@@ -48,10 +48,10 @@ def get_unread_count(
     current_user: User = Depends(get_current_user)
 ):
     """Get count of unread notifications."""
-    count = db.query(Notification).filter(
-        Notification.user_id == current_user.user_id,
-        Notification.is_read == False
-    ).count()
+    count = NotificationService.get_unread_count(
+        db=db,
+        user_id=current_user.user_id
+    )
 
     return {"count": count}
 
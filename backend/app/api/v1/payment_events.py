@@ -5,9 +5,10 @@ from datetime import date
 from decimal import Decimal
 from pydantic import BaseModel
 
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db
 from app.core.security import get_current_user, require_role
 from app.models import User, BondIssue, PaymentEvent, EventType, MemberPayment
+from app.models.types import to_cents
 from app.services.payment_calculator import PaymentCalculatorService
 
 router = APIRouter(prefix="/bonds", tags=["Payment Events"])
@@ -181,12 +182,12 @@ def preview_payments(
     # Convert to dictionaries
     payments_preview = [calc.to_dict() for calc in calculations]
 
-    # Calculate totals
-    total_boz_award = sum(Decimal(str(p["boz_award_value"])) for p in payments_preview)
-    total_net_discount = sum(Decimal(str(p["net_discount_value"])) for p in payments_preview)
-    total_net_maturity_coupon = sum(Decimal(str(p["net_maturity_coupon"])) for p in payments_preview)
-    total_net_coupon = sum(Decimal(str(p["net_coupon_payment"])) for p in payments_preview)
-    total_gross = sum(Decimal(str(p["gross_coupon_from_boz"])) for p in payments_preview)
+    # Calculate totals in integer cents
+    total_boz_award = sum(to_cents(p["boz_award_value"]) for p in payments_preview)
+    total_net_discount = sum(to_cents(p["net_discount_value"]) for p in payments_preview)
+    total_net_maturity_coupon = sum(to_cents(p["net_maturity_coupon"]) for p in payments_preview)
+    total_net_coupon = sum(to_cents(p["net_coupon_payment"]) for p in payments_preview)
+    total_gross = sum(to_cents(p["gross_coupon_from_boz"]) for p in payments_preview)
 
     return {
         "bond_id": bond_id,
@@ -199,11 +200,11 @@ def preview_payments(
         "payments": payments_preview,
         "summary": {
             "total_members": len(payments_preview),
-            "total_boz_award_value": float(total_boz_award),
-            "total_net_discount_value": float(total_net_discount),
-            "total_net_maturity_coupon": float(total_net_maturity_coupon),
-            "total_net_coupon_payment": float(total_net_coupon),
-            "total_gross_coupon": float(total_gross)
+            "total_boz_award_value": total_boz_award / 100,
+            "total_net_discount_value": total_net_discount / 100,
+            "total_net_maturity_coupon": total_net_maturity_coupon / 100,
+            "total_net_coupon_payment": total_net_coupon / 100,
+            "total_gross_coupon": total_gross / 100
         }
     }
 
@@ -313,6 +314,43 @@ def recalculate_payments(
     }
 
 
+@router.post("/{bond_id}/payments/recalculate-all", status_code=status.HTTP_200_OK)
+def recalculate_all_payments(
+    bond_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin", "account_manager", "treasurer"))
+):
+    """
+    Regenerate payments for every event of a bond (Admin/Treasurer only).
+    Events are recalculated in parallel, each in its own transaction.
+    """
+    bond = db.query(BondIssue).filter(BondIssue.id == bond_id).first()
+    if not bond:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Bond issue not found"
+        )
+
+    event_ids = [
+        event_id for (event_id,) in db.query(PaymentEvent.id).filter(PaymentEvent.bond_id == bond_id)
+    ]
+
+    try:
+        counts = PaymentCalculatorService.recalculate_all(SessionLocal, event_ids)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return {
+        "message": "Payments recalculated successfully",
+        "bond_id": bond_id,
+        "events_recalculated": len(counts),
+        "payments_created": sum(counts.values())
+    }
+
+
 @router.patch("/{bond_id}/events/{event_id}", status_code=status.HTTP_200_OK)
 def update_payment_event(
     bond_id: int,
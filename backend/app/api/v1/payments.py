@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, load_only
 from typing import List
 from datetime import date
 from decimal import Decimal
@@ -7,10 +8,12 @@ from decimal import Decimal
 from app.core.database import get_db
 from app.core.security import get_current_user, require_role
 from app.models.user import User
-from app.models.bond import BondPurchase, InterestRate
+from app.models.bond import BondPurchase, InterestRate, PurchaseStatus
 from app.models.payment import CouponPayment, PaymentVoucher, PaymentType, PaymentStatus
 from app.schemas.payment import CouponPaymentCreate, CouponPaymentResponse, PaymentVoucherResponse
 from app.services.bond_calculator import BondCalculator
+from app.services.payment_calculator import INSERT_CHUNK_SIZE
+from app.services.reporting_service import ReportingService
 
 router = APIRouter(prefix="/payments", tags=["Payments"])
 
@@ -29,8 +32,13 @@ def calculate_coupon_payments(
     Otherwise, it returns a preview of calculations.
     """
     # Get all active bond purchases
-    active_purchases = db.query(BondPurchase).filter(
-        BondPurchase.purchase_status == "active",
+    active_purchases = db.query(BondPurchase).options(
+        load_only(
+            BondPurchase.purchase_id, BondPurchase.user_id, BondPurchase.bond_type_id,
+            BondPurchase.face_value, BondPurchase.purchase_date, BondPurchase.maturity_date
+        )
+    ).filter(
+        BondPurchase.purchase_status == PurchaseStatus.ACTIVE,
         BondPurchase.purchase_date <= period_end
     ).all()
 
@@ -38,16 +46,37 @@ def calculate_coupon_payments(
     total_gross = Decimal("0")
     total_net = Decimal("0")
 
+    # Rates and daily rate × days are shared by every purchase of the same bond type/period
+    rates_by_bond_type = {}
+    rate_days_cache = {}
+    payment_rows = []
+
+    # Purchases already paid for their part of this period are not paid again
+    existing_periods = set()
+    if create_payments:
+        existing_periods = set(
+            db.query(
+                CouponPayment.purchase_id,
+                CouponPayment.payment_period_start,
+                CouponPayment.payment_period_end
+            ).filter(
+                CouponPayment.payment_period_start >= period_start,
+                CouponPayment.payment_period_end <= period_end
+            ).all()
+        )
+
     for purchase in active_purchases:
         # Determine payment type
         is_maturity = purchase.maturity_date <= period_end
         payment_type = PaymentType.MATURITY if is_maturity else PaymentType.SEMI_ANNUAL
 
         # Get interest rate for the period
-        rate = db.query(InterestRate).filter(
-            InterestRate.bond_type_id == purchase.bond_type_id,
-            InterestRate.effective_month <= period_start
-        ).order_by(InterestRate.effective_month.desc()).first()
+        if purchase.bond_type_id not in rates_by_bond_type:
+            rates_by_bond_type[purchase.bond_type_id] = db.query(InterestRate).filter(
+                InterestRate.bond_type_id == purchase.bond_type_id,
+                InterestRate.effective_month <= period_start
+            ).order_by(InterestRate.effective_month.desc()).first()
+        rate = rates_by_bond_type[purchase.bond_type_id]
 
         if not rate:
             continue
@@ -61,10 +90,14 @@ def calculate_coupon_payments(
             continue
 
         # Calculate payment breakdown
-        payment_calc = BondCalculator.calculate_coupon_payment(
+        rate_days_key = (rate.rate_id, calendar_days)
+        if rate_days_key not in rate_days_cache:
+            rate_days_cache[rate_days_key] = BondCalculator.calculate_rate_days(
+                rate.daily_coupon_rate, calendar_days
+            )
+        payment_calc = BondCalculator.calculate_coupon_payment_with_rate_days(
             face_value=purchase.face_value,
-            daily_rate=rate.daily_coupon_rate,
-            calendar_days=calendar_days
+            rate_days=rate_days_cache[rate_days_key]
         )
 
         # Add to calculations
@@ -80,32 +113,36 @@ def calculate_coupon_payments(
         total_gross += payment_calc["gross_coupon"]
         total_net += payment_calc["net_payment"]
 
-        # Create payment record if requested
-        if create_payments:
-            db_payment = CouponPayment(
-                purchase_id=purchase.purchase_id,
-                user_id=purchase.user_id,
-                payment_type=payment_type,
-                payment_date=period_end,
-                payment_period_start=calc_start,
-                payment_period_end=calc_end,
-                calendar_days=calendar_days,
-                gross_coupon_amount=payment_calc["gross_coupon"],
-                withholding_tax=payment_calc["withholding_tax"],
-                boz_fees=payment_calc["boz_fees"],
-                coop_fees=payment_calc["coop_fees"],
-                net_payment_amount=payment_calc["net_payment"],
-                payment_status=PaymentStatus.PENDING,
-                payment_reference=f"PAY{period_end.strftime('%Y%m%d')}{purchase.purchase_id:06d}"
-            )
-            db.add(db_payment)
+        # Collect the payment record if requested; all are inserted together below
+        if create_payments and (purchase.purchase_id, calc_start, calc_end) not in existing_periods:
+            payment_rows.append({
+                "purchase_id": purchase.purchase_id,
+                "user_id": purchase.user_id,
+                "payment_type": payment_type,
+                "payment_date": period_end,
+                "payment_period_start": calc_start,
+                "payment_period_end": calc_end,
+                "calendar_days": calendar_days,
+                "gross_coupon_amount": payment_calc["gross_coupon"],
+                "withholding_tax": payment_calc["withholding_tax"],
+                "boz_fees": payment_calc["boz_fees"],
+                "coop_fees": payment_calc["coop_fees"],
+                "net_payment_amount": payment_calc["net_payment"],
+                "payment_status": PaymentStatus.PENDING
+            })
 
     if create_payments:
+        # One executemany INSERT per chunk instead of an ORM insert per payment
+        for chunk_start in range(0, len(payment_rows), INSERT_CHUNK_SIZE):
+            db.execute(insert(CouponPayment), payment_rows[chunk_start:chunk_start + INSERT_CHUNK_SIZE])
         db.commit()
+        if payment_rows:
+            ReportingService.refresh_monthly_summary_view(db)
         return {
-            "message": f"Created {len(calculations)} coupon payment records",
-            "count": len(calculations),
-            "payments_created": len(calculations)
+            "message": f"Created {len(payment_rows)} coupon payment records",
+            "count": len(payment_rows),
+            "payments_created": len(payment_rows),
+            "payments_skipped": len(calculations) - len(payment_rows)
         }
     else:
         return {
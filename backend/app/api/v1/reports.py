@@ -173,10 +173,11 @@ def get_dashboard_data(
     Admin/Treasurer: Cooperative-wide statistics
     """
     if current_user.user_role.value == "member":
-        # Return member's portfolio
+        # Return member's portfolio; the summary view only needs the totals
         portfolio = ReportingService.get_member_portfolio(
             db=db,
-            user_id=current_user.user_id
+            user_id=current_user.user_id,
+            include_purchases=False
         )
         return {
             "type": "member",
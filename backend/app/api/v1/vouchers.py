@@ -1,6 +1,9 @@
+import os
+from typing import List
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import FileResponse, Response
+from sqlalchemy.orm import Session, joinedload
 
 from app.core.database import get_db
 from app.core.security import get_current_user, require_role
@@ -39,11 +42,13 @@ def generate_voucher(
         # Optionally send email
         if send_email:
             from app.models.payment import CouponPayment
-            payment = db.query(CouponPayment).filter(
+            payment = db.query(CouponPayment).options(
+                joinedload(CouponPayment.user)
+            ).filter(
                 CouponPayment.payment_id == payment_id
             ).first()
             if payment:
-                EmailService.send_payment_notification(db, payment)
+                EmailService.send_payment_notification(db, payment, user=payment.user)
 
         return {
             "message": "Voucher generated successfully",
@@ -52,6 +57,11 @@ def generate_voucher(
             "voucher_id": result["voucher"].voucher_id
         }
 
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -59,6 +69,47 @@ def generate_voucher(
         )
 
 
+@router.post("/generate-bulk")
+def generate_vouchers_bulk(
+    payment_ids: List[int],
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin", "account_manager", "treasurer"))
+):
+    """
+    Generate payment vouchers for several coupon payments (Admin/Treasurer only).
+
+    Args:
+        payment_ids: IDs of the coupon payments
+
+    Returns:
+        Generated voucher numbers and PDF paths
+    """
+    try:
+        results = VoucherService.generate_vouchers_bulk(
+            db=db,
+            payment_ids=payment_ids,
+            generated_by=current_user.user_id
+        )
+
+        return {
+            "message": f"{len(results)} vouchers generated successfully",
+            "vouchers": [
+                {
+                    "voucher_id": result["voucher"].voucher_id,
+                    "voucher_number": result["voucher_number"],
+                    "pdf_path": result["pdf_path"]
+                }
+                for result in results
+            ]
+        }
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error generating vouchers: {str(e)}"
+        )
+
+
 @router.get("/download/{voucher_id}")
 def download_voucher(
     voucher_id: int,
@@ -83,22 +134,29 @@ def download_voucher(
             detail="Not authorized to download this voucher"
         )
 
-    # Construct file path
-    import os
-    temp_dir = os.path.join(os.path.dirname(__file__), '../../../temp')
     filename = f"voucher_{voucher.voucher_number}.pdf"
-    filepath = os.path.join(temp_dir, filename)
+    filepath = VoucherService.pdf_path(voucher.voucher_number)
 
-    if not os.path.exists(filepath):
+    if os.path.exists(filepath):
+        return FileResponse(
+            path=filepath,
+            media_type='application/pdf',
+            filename=filename
+        )
+
+    # Not saved on this instance: render it from the database instead
+    try:
+        pdf_bytes = VoucherService.render_voucher(db, voucher)
+    except ValueError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Voucher PDF file not found"
         )
 
-    return FileResponse(
-        path=filepath,
+    return Response(
+        content=pdf_bytes,
         media_type='application/pdf',
-        filename=filename
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
     )
 
 
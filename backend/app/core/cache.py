@@ -0,0 +1,71 @@
+from typing import Dict, Optional
+import redis
+from app.core.config import settings
+
+# Only adjust counters that are already cached; a missing key is rebuilt from the database
+_ADJUST_IF_CACHED = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+    if value < 0 then
+        redis.call('DEL', KEYS[1])
+        return nil
+    end
+    return value
+end
+return nil
+"""
+
+
+class CountCache:
+    """
+    Redis-backed integer counters used in front of COUNT(*) queries.
+
+    Every operation is best effort: if Redis is unavailable, reads return None and
+    writes are skipped, so callers fall back to the database.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int = 3600):
+        self.ttl_seconds = ttl_seconds
+        self._client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        self._adjust = self._client.register_script(_ADJUST_IF_CACHED)
+
+    def get(self, key: str) -> Optional[int]:
+        """Return the cached count, or None on a miss."""
+        try:
+            value = self._client.get(key)
+        except redis.RedisError:
+            return None
+        return int(value) if value is not None else None
+
+    def set(self, key: str, value: int) -> None:
+        """Store a count freshly read from the database."""
+        try:
+            self._client.set(key, value, ex=self.ttl_seconds)
+        except redis.RedisError:
+            pass
+
+    def adjust(self, deltas: Dict[str, int]) -> None:
+        """Add each delta to its counter if that counter is cached."""
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key, delta in deltas.items():
+                self._adjust(keys=[key], args=[delta], client=pipe)
+            pipe.execute()
+        except redis.RedisError:
+            # A stale counter must not outlive a failed update
+            self.delete(*deltas)
+
+    def incr(self, key: str, amount: int = 1) -> None:
+        self.adjust({key: amount})
+
+    def decr(self, key: str, amount: int = 1) -> None:
+        self.adjust({key: -amount})
+
+    def delete(self, *keys: str) -> None:
+        try:
+            self._client.delete(*keys)
+        except redis.RedisError:
+            pass
+
+
+count_cache = CountCache(settings.REDIS_URL)
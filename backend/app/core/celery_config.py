@@ -0,0 +1,44 @@
+from celery import Celery
+from celery.schedules import crontab
+from app.core.config import settings
+
+# Initialize Celery
+celery_app = Celery(
+    "bond_management",
+    broker=settings.REDIS_URL,
+    backend=settings.REDIS_URL,
+    # Task modules the worker imports at start-up
+    include=[
+        'app.tasks.audit_tasks',
+        'app.tasks.notification_tasks',
+        'app.tasks.report_tasks',
+    ]
+)
+
+# Configuration
+celery_app.conf.update(
+    task_serializer='json',
+    accept_content=['json'],
+    result_serializer='json',
+    timezone='UTC',
+    enable_utc=True,
+    task_track_started=True,
+    # Publishing gives up after one immediate reconnect rather than backing off,
+    # so a request that queues a task fails fast when Redis is down
+    broker_transport_options={'max_retries': 1, 'interval_start': 0},
+)
+
+# Scheduled tasks configuration
+celery_app.conf.beat_schedule = {
+    # Nightly refresh of the monthly summary materialized view (1 AM)
+    'refresh-monthly-summary-view': {
+        'task': 'app.tasks.report_tasks.refresh_monthly_summary_view_task',
+        'schedule': crontab(hour=1, minute=0),
+    },
+    # Requests that publish audit entries schedule their own drain; this hourly
+    # sweep only catches entries whose drain could not be queued
+    'drain-audit-stream': {
+        'task': 'app.tasks.audit_tasks.drain_audit_stream_task',
+        'schedule': crontab(minute=0),
+    },
+}
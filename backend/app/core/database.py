@@ -7,8 +7,16 @@ from app.core.config import settings
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # psycopg2: multi-row VALUES for INSERT executemany, execute_batch for UPDATE/DELETE.
+    # db.execute(insert(Model), [dict, ...]) goes through SQLAlchemy's "insertmanyvalues"
+    # path, which reuses the one cached compiled INSERT for every batch of rows.
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    # Compiled-statement cache; room for every distinct report/service statement shape
+    query_cache_size=1200
 )
 
 # Create session factory
@@ -1,6 +1,11 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+# Configure Celery before any task is queued from a request
+from app.core.celery_config import celery_app  # noqa: F401
+from app.utils.audit_logger import AuditLogger
 from app.api.v1 import (
     auth, bonds, payments, reports, notifications,
     settings as settings_router, vouchers, exports,
@@ -14,7 +19,9 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    # orjson encodes large payment/member lists much faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -26,6 +33,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def batch_audit_logs(request: Request, call_next):
+    """Buffer audit entries made while handling a request and publish them together."""
+    token = AuditLogger.begin_batch()
+    try:
+        return await call_next(request)
+    finally:
+        # Most requests log nothing; only hand off to a thread when there is a batch
+        rows = AuditLogger.end_batch(token)
+        if rows:
+            await run_in_threadpool(AuditLogger.write_batch, rows)
+
+
 # Include routers
 # Authentication
 app.include_router(auth.router, prefix="/api/v1")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey, Enum, Boolean, DateTime, Text
+from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey, Enum, Boolean, DateTime, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -69,7 +69,7 @@ class BondPurchase(Base):
     net_discount_value = Column(Numeric(15, 2), nullable=False)
     purchase_price = Column(Numeric(15, 2), nullable=False)  # face_value - discount_value
     maturity_date = Column(Date, nullable=False, index=True)
-    purchase_status = Column(Enum(PurchaseStatus), default=PurchaseStatus.ACTIVE, nullable=False)
+    purchase_status = Column(Enum(PurchaseStatus, validate_strings=True), default=PurchaseStatus.ACTIVE, nullable=False)
     transaction_reference = Column(String(50), unique=True, nullable=True)
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -79,6 +79,15 @@ class BondPurchase(Base):
     bond_type = relationship("BondType", back_populates="bond_purchases")
     coupon_payments = relationship("CouponPayment", back_populates="bond_purchase")
 
+    __table_args__ = (
+        # Per member / bond type totals of active holdings from the index alone
+        Index(
+            'ix_bp_active_user_type', user_id, bond_type_id,
+            postgresql_include=['bond_shares', 'face_value'],
+            postgresql_where=purchase_status == PurchaseStatus.ACTIVE
+        ),
+    )
+
     def __repr__(self):
         return f"<BondPurchase {self.transaction_reference} - {self.bond_shares} shares>"
 
@@ -103,7 +112,7 @@ class BondIssue(Base):
     issue_name = Column(String(200), nullable=False, index=True)
     issue_date = Column(Date, nullable=False, index=True)
     maturity_date = Column(Date, nullable=False, index=True)
-    bond_type = Column(Enum(BondTypeEnum), nullable=False)
+    bond_type = Column(Enum(BondTypeEnum, validate_strings=True), nullable=False)
     coupon_rate = Column(Numeric(8, 6), nullable=False)  # Annual coupon rate (e.g., 0.1850)
     discount_rate = Column(Numeric(8, 6), nullable=False)  # Maturity discount rate (e.g., 0.2050)
     face_value_per_unit = Column(Numeric(15, 2), nullable=True, default=1.00)
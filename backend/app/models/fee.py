@@ -24,9 +24,9 @@ class FeeStructure(Base):
 
     fee_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     fee_name = Column(String(100), nullable=False)
-    fee_type = Column(Enum(FeeType), nullable=False)
+    fee_type = Column(Enum(FeeType, validate_strings=True), nullable=False)
     fee_value = Column(Numeric(10, 4), nullable=False)  # e.g., 0.15 for 15%
-    applies_to = Column(Enum(AppliesTo), nullable=False)
+    applies_to = Column(Enum(AppliesTo, validate_strings=True), nullable=False)
     effective_from = Column(Date, nullable=False)
     effective_to = Column(Date, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
@@ -19,7 +19,7 @@ class Notification(Base):
 
     notification_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False, index=True)
-    notification_type = Column(Enum(NotificationType), nullable=False)
+    notification_type = Column(Enum(NotificationType, validate_strings=True), nullable=False)
     title = Column(String(200), nullable=False)
     message = Column(Text, nullable=False)
     is_read = Column(Boolean, default=False, nullable=False)
@@ -30,6 +30,10 @@ class Notification(Base):
 
     __table_args__ = (
         Index('idx_user_unread', 'user_id', 'is_read'),
+        # Newest-first listing per user without a sort step
+        Index('ix_notif_user_created', user_id, created_at.desc()),
+        # Unread list and count only ever touch unread rows
+        Index('ix_notif_unread', user_id, created_at.desc(), postgresql_where=is_read.is_(False)),
     )
 
     def __repr__(self):
@@ -1,8 +1,14 @@
-from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey, Enum, DateTime, Text
+from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey, Enum, DateTime, Text, Index, Sequence, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 from app.core.database import Base
+from app.models.types import MoneyCents
+
+
+# Numbering sequences used by the voucher_number / payment_reference server defaults
+voucher_number_seq = Sequence("voucher_number_seq", metadata=Base.metadata)
+payment_reference_seq = Sequence("payment_reference_seq", metadata=Base.metadata)
 
 
 class PaymentType(str, enum.Enum):
@@ -27,28 +33,38 @@ class CouponPayment(Base):
     payment_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     purchase_id = Column(Integer, ForeignKey("bond_purchases.purchase_id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False, index=True)
-    payment_type = Column(Enum(PaymentType), nullable=False)
+    payment_type = Column(Enum(PaymentType, validate_strings=True), nullable=False)
     payment_date = Column(Date, nullable=False, index=True)
     payment_period_start = Column(Date, nullable=False)
     payment_period_end = Column(Date, nullable=False)
     calendar_days = Column(Integer, nullable=False)
-    gross_coupon_amount = Column(Numeric(15, 2), nullable=False)
-    withholding_tax = Column(Numeric(15, 2), nullable=False)  # 15%
-    boz_fees = Column(Numeric(15, 2), nullable=False)  # 1%
-    coop_fees = Column(Numeric(15, 2), nullable=False)  # 2% after WHT and BOZ
-    net_payment_amount = Column(Numeric(15, 2), nullable=False)
-    payment_status = Column(Enum(PaymentStatus), default=PaymentStatus.PENDING, nullable=False, index=True)
-    payment_reference = Column(String(50), unique=True, nullable=True)
+    gross_coupon_amount = Column(MoneyCents(), nullable=False)
+    withholding_tax = Column(MoneyCents(), nullable=False)  # 15%
+    boz_fees = Column(MoneyCents(), nullable=False)  # 1%
+    coop_fees = Column(MoneyCents(), nullable=False)  # 2% after WHT and BOZ
+    net_payment_amount = Column(MoneyCents(), nullable=False)
+    payment_status = Column(Enum(PaymentStatus, validate_strings=True), default=PaymentStatus.PENDING, nullable=False, index=True)
+    payment_reference = Column(
+        String(50), unique=True, nullable=True,
+        server_default=text("('PAY' || to_char(CURRENT_DATE, 'YYYYMMDD') || to_char(nextval('payment_reference_seq'), 'FM000000'))")
+    )
     processed_by = Column(Integer, ForeignKey("users.user_id"), nullable=True)
     processed_at = Column(DateTime(timezone=True), nullable=True)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=text("statement_timestamp()"), nullable=False)
 
     # Relationships
     bond_purchase = relationship("BondPurchase", back_populates="coupon_payments")
     user = relationship("User", foreign_keys=[user_id], back_populates="coupon_payments")
     voucher = relationship("PaymentVoucher", back_populates="payment", uselist=False)
 
+    # Enum columns store member names, so the predicate compares against 'PENDING'
+    __table_args__ = (
+        # One payment per purchase and period, so a period cannot be paid twice
+        UniqueConstraint('purchase_id', 'payment_period_start', 'payment_period_end', name='uk_coupon_purchase_period'),
+        Index('ix_coupon_pending', 'payment_date', postgresql_where=text("payment_status = 'PENDING'")),
+    )
+
     def __repr__(self):
         return f"<CouponPayment {self.payment_reference} - ${self.net_payment_amount}>"
 
@@ -66,13 +82,16 @@ class PaymentVoucher(Base):
     __tablename__ = "payment_vouchers"
 
     voucher_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    voucher_number = Column(String(50), unique=True, nullable=False, index=True)
+    voucher_number = Column(
+        String(50), unique=True, nullable=False, index=True,
+        server_default=text("('VOC' || to_char(CURRENT_DATE, 'YYYY') || to_char(nextval('voucher_number_seq'), 'FM000000'))")
+    )
     user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
     payment_id = Column(Integer, ForeignKey("coupon_payments.payment_id"), nullable=True)
     voucher_date = Column(Date, nullable=False)
-    voucher_type = Column(Enum(PaymentType), nullable=False)
-    total_amount = Column(Numeric(15, 2), nullable=False)
-    voucher_status = Column(Enum(VoucherStatus), default=VoucherStatus.DRAFT, nullable=False)
+    voucher_type = Column(Enum(PaymentType, validate_strings=True), nullable=False)
+    total_amount = Column(MoneyCents(), nullable=False)
+    voucher_status = Column(Enum(VoucherStatus, validate_strings=True), default=VoucherStatus.DRAFT, nullable=False)
     generated_by = Column(Integer, ForeignKey("users.user_id"), nullable=False)
     approved_by = Column(Integer, ForeignKey("users.user_id"), nullable=True)
     paid_by = Column(Integer, ForeignKey("users.user_id"), nullable=True)
@@ -87,6 +106,12 @@ class PaymentVoucher(Base):
     # Relationships
     payment = relationship("CouponPayment", back_populates="voucher")
 
+    __table_args__ = (
+        # At most one voucher per coupon payment
+        UniqueConstraint('payment_id', name='uk_voucher_payment'),
+        Index('ix_voucher_open', 'voucher_date', postgresql_where=text("voucher_status IN ('DRAFT', 'ISSUED')")),
+    )
+
     def __repr__(self):
         return f"<PaymentVoucher {self.voucher_number} - {self.voucher_status.value}>"
 
@@ -106,7 +131,7 @@ class PaymentEvent(Base):
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     bond_id = Column(Integer, ForeignKey("bond_issues.id"), nullable=False, index=True)
-    event_type = Column(Enum(EventType), nullable=False)
+    event_type = Column(Enum(EventType, validate_strings=True), nullable=False)
     event_name = Column(String(200), nullable=False)
     payment_date = Column(Date, nullable=False, index=True)
     calculation_period = Column(String(100), nullable=True)
@@ -114,9 +139,9 @@ class PaymentEvent(Base):
     withholding_tax_rate = Column(Numeric(5, 2), nullable=True)
     boz_fee_rate = Column(Numeric(5, 2), nullable=True)
     coop_fee_rate = Column(Numeric(5, 2), nullable=True)
-    boz_award_amount = Column(Numeric(15, 2), nullable=True, default=0)  # Total BOZ award for distribution
-    expected_total_net_maturity = Column(Numeric(15, 2), nullable=True, default=0)
-    expected_total_net_coupon = Column(Numeric(15, 2), nullable=True, default=0)
+    boz_award_amount = Column(MoneyCents(), nullable=True, default=0)  # Total BOZ award for distribution
+    expected_total_net_maturity = Column(MoneyCents(), nullable=True, default=0)
+    expected_total_net_coupon = Column(MoneyCents(), nullable=True, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
@@ -140,28 +165,39 @@ class MemberPayment(Base):
     payment_event_id = Column(Integer, ForeignKey("payment_events.id"), nullable=False, index=True)
 
     # BOZ Award fields (for maturity)
-    boz_award_value = Column(Numeric(15, 2), nullable=True, default=0)
+    boz_award_value = Column(MoneyCents(), nullable=True, default=0)
 
     # Discount value fields (for maturity)
-    base_amount = Column(Numeric(15, 2), nullable=True, default=0)  # Discount Value
-    coop_discount_fee = Column(Numeric(15, 2), nullable=True, default=0)
-    net_discount_value = Column(Numeric(15, 2), nullable=True, default=0)
+    base_amount = Column(MoneyCents(), nullable=True, default=0)  # Discount Value
+    coop_discount_fee = Column(MoneyCents(), nullable=True, default=0)
+    net_discount_value = Column(MoneyCents(), nullable=True, default=0)
 
     # Coupon payment fields
-    gross_coupon_from_boz = Column(Numeric(15, 2), nullable=True, default=0)
-    withholding_tax = Column(Numeric(15, 2), nullable=True, default=0)
-    boz_fee = Column(Numeric(15, 2), nullable=True, default=0)
-    coop_fee_on_coupon = Column(Numeric(15, 2), nullable=True, default=0)
-    net_maturity_coupon = Column(Numeric(15, 2), nullable=True, default=0)
-    net_coupon_payment = Column(Numeric(15, 2), nullable=True, default=0)
+    gross_coupon_from_boz = Column(MoneyCents(), nullable=True, default=0)
+    withholding_tax = Column(MoneyCents(), nullable=True, default=0)
+    boz_fee = Column(MoneyCents(), nullable=True, default=0)
+    coop_fee_on_coupon = Column(MoneyCents(), nullable=True, default=0)
+    net_maturity_coupon = Column(MoneyCents(), nullable=True, default=0)
+    net_coupon_payment = Column(MoneyCents(), nullable=True, default=0)
 
     calculation_period = Column(String(100), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=text("statement_timestamp()"), nullable=False)
 
     # Relationships
     member = relationship("User", foreign_keys=[member_id])
     bond_issue = relationship("BondIssue", foreign_keys=[bond_id])
     payment_event = relationship("PaymentEvent", back_populates="member_payments")
 
+    # Covering index so per-event reports can be served by index-only scans (PostgreSQL 11+)
+    __table_args__ = (
+        Index(
+            'ix_mp_event_member_cover', 'payment_event_id', 'member_id',
+            postgresql_include=[
+                'net_coupon_payment', 'net_maturity_coupon',
+                'gross_coupon_from_boz', 'withholding_tax'
+            ]
+        ),
+    )
+
     def __repr__(self):
         return f"<MemberPayment Member {self.member_id} Event {self.payment_event_id}>"
@@ -19,7 +19,7 @@ class SystemSetting(Base):
     setting_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     setting_key = Column(String(100), unique=True, nullable=False, index=True)
     setting_value = Column(Text, nullable=False)
-    setting_type = Column(Enum(SettingType), nullable=False)
+    setting_type = Column(Enum(SettingType, validate_strings=True), nullable=False)
     category = Column(String(50), nullable=False, index=True)
     description = Column(Text, nullable=True)
     is_editable = Column(Boolean, default=True, nullable=False)
@@ -0,0 +1,32 @@
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class MoneyCents(TypeDecorator):
+    """
+    Monetary amount stored as BIGINT cents.
+    Python code keeps working with 2-place Decimals; the database stores integers.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return int((value * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(int(value)).scaleb(-2)
+
+
+def to_cents(amount: float) -> int:
+    """
+    Integer cents for a 2-place amount that has already been converted to float.
+    Sums over many such amounts stay exact as ints, and are much faster than Decimal.
+    """
+    return round(amount * 100)
@@ -25,7 +25,7 @@ class User(Base):
     last_name = Column(String(50), nullable=False)
     phone_number = Column(String(20), nullable=True)
     address = Column(String, nullable=True)
-    user_role = Column(Enum(UserRole), default=UserRole.MEMBER, nullable=False, index=True)
+    user_role = Column(Enum(UserRole, validate_strings=True), default=UserRole.MEMBER, nullable=False, index=True)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -37,6 +37,7 @@ class BondTypeResponse(BondTypeBase):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class InterestRateBase(BaseModel):
@@ -61,6 +62,7 @@ class InterestRateResponse(InterestRateBase):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class BondPurchaseBase(BaseModel):
@@ -101,3 +103,4 @@ class BondPurchaseResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
@@ -24,6 +24,7 @@ class DocumentResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class DocumentWithUser(DocumentResponse):
@@ -33,4 +34,5 @@ class DocumentWithUser(DocumentResponse):
     user_email: str
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+        frozen = True
\ No newline at end of file
@@ -38,6 +38,7 @@ class CouponPaymentResponse(CouponPaymentBase):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class PaymentVoucherBase(BaseModel):
@@ -72,3 +73,4 @@ class PaymentVoucherResponse(PaymentVoucherBase):
 
     class Config:
         from_attributes = True
+        frozen = True
@@ -21,6 +21,7 @@ class MemberBalanceResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class MonthlySummaryResponse(BaseModel):
@@ -44,6 +45,7 @@ class MonthlySummaryResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class NotificationResponse(BaseModel):
@@ -61,6 +63,7 @@ class NotificationResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class SystemSettingResponse(BaseModel):
@@ -77,6 +80,7 @@ class SystemSettingResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class SystemSettingUpdate(BaseModel):
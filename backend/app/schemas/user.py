@@ -30,6 +30,7 @@ class UserResponse(UserBase):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class UserLogin(BaseModel):
@@ -1,7 +1,20 @@
-from decimal import Decimal, ROUND_HALF_UP
-from datetime import date, timedelta
+from decimal import Context, Decimal, ROUND_HALF_UP
+from datetime import date
 from typing import Dict
 
+# Built once; parsing a Decimal on every calculation adds up over a batch of holdings
+_CENT = Decimal("0.01")
+_ZERO_CENTS = Decimal("0.00")
+_DAILY_RATE_PLACES = Decimal("0.00000001")
+_DAYS_PER_YEAR = Decimal("365")
+_DEFAULT_DISCOUNT_RATE = Decimal("0.10")
+_WHT_RATE = Decimal("0.15")
+_BOZ_RATE = Decimal("0.01")
+_COOP_RATE = Decimal("0.02")
+# quantize bound to a default-precision, half-up context: skips the thread-local
+# context lookup of Decimal.quantize and the method lookup on every call
+_quantize = Context(rounding=ROUND_HALF_UP).quantize
+
 
 class BondCalculator:
     """
@@ -25,17 +38,17 @@ class BondCalculator:
     @staticmethod
     def calculate_face_value(bond_shares: Decimal, unit_value: Decimal = Decimal("1")) -> Decimal:
         """Calculate face value from bond shares."""
-        return (bond_shares * unit_value).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return _quantize(bond_shares * unit_value, _CENT)
 
     @staticmethod
-    def calculate_discount_value(face_value: Decimal, discount_rate: Decimal = Decimal("0.10")) -> Decimal:
+    def calculate_discount_value(face_value: Decimal, discount_rate: Decimal = _DEFAULT_DISCOUNT_RATE) -> Decimal:
         """Calculate discount value."""
-        return (face_value * discount_rate).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return _quantize(face_value * discount_rate, _CENT)
 
     @staticmethod
     def calculate_coop_discount_fee(discount_value: Decimal) -> Decimal:
         """Calculate co-op discount fee (2% of discount value)."""
-        return (discount_value * Decimal("0.02")).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return _quantize(discount_value * _COOP_RATE, _CENT)
 
     @staticmethod
     def calculate_purchase_price(face_value: Decimal, discount_value: Decimal) -> Decimal:
@@ -44,8 +57,12 @@ class BondCalculator:
 
     @staticmethod
     def calculate_maturity_date(purchase_date: date, maturity_years: int) -> date:
-        """Calculate maturity date."""
-        return purchase_date + timedelta(days=365 * maturity_years)
+        """Calculate maturity date: the same day and month, maturity_years later."""
+        try:
+            return purchase_date.replace(year=purchase_date.year + maturity_years)
+        except ValueError:
+            # 29 February in a non-leap maturity year
+            return purchase_date.replace(year=purchase_date.year + maturity_years, day=28)
 
     @staticmethod
     def calculate_calendar_days(start_date: date, end_date: date) -> int:
@@ -55,7 +72,7 @@ class BondCalculator:
     @staticmethod
     def calculate_daily_rate(annual_rate: Decimal) -> Decimal:
         """Calculate daily coupon rate from annual rate."""
-        return (annual_rate / Decimal("365")).quantize(Decimal("0.00000001"), rounding=ROUND_HALF_UP)
+        return _quantize(annual_rate / _DAYS_PER_YEAR, _DAILY_RATE_PLACES)
 
     @staticmethod
     def calculate_coupon_payment(
@@ -69,18 +86,41 @@ class BondCalculator:
         Returns:
             Dict with: gross_coupon, withholding_tax, boz_fees, coop_fees, net_payment
         """
+        rate_days = BondCalculator.calculate_rate_days(daily_rate, calendar_days)
+        return BondCalculator.calculate_coupon_payment_with_rate_days(face_value, rate_days)
+
+    @staticmethod
+    def calculate_rate_days(daily_rate: Decimal, calendar_days: int) -> Decimal:
+        """Calculate daily rate × calendar days, shared by every holding in the same period."""
+        return daily_rate * Decimal(calendar_days)
+
+    @staticmethod
+    def calculate_coupon_payment_with_rate_days(
+        face_value: Decimal,
+        rate_days: Decimal
+    ) -> Dict[str, Decimal]:
+        """
+        Calculate coupon payment breakdown from a precomputed daily rate × calendar days.
+
+        Returns:
+            Dict with: gross_coupon, withholding_tax, boz_fees, coop_fees, net_payment
+        """
+        # No days or a zero rate earns nothing; skip the multiply/quantize chain
+        if not rate_days:
+            return dict.fromkeys(
+                ("gross_coupon", "withholding_tax", "boz_fees", "coop_fees", "net_payment"), _ZERO_CENTS
+            )
+
         # Calculate gross coupon
-        gross_coupon = (face_value * daily_rate * Decimal(calendar_days)).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
+        gross_coupon = _quantize(face_value * rate_days, _CENT)
 
         # Calculate deductions
-        withholding_tax = (gross_coupon * Decimal("0.15")).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-        boz_fees = (gross_coupon * Decimal("0.01")).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        withholding_tax = _quantize(gross_coupon * _WHT_RATE, _CENT)
+        boz_fees = _quantize(gross_coupon * _BOZ_RATE, _CENT)
 
         # Co-op fees = 2% of (gross - WHT - BOZ)
         after_wht_boz = gross_coupon - withholding_tax - boz_fees
-        coop_fees = (after_wht_boz * Decimal("0.02")).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        coop_fees = _quantize(after_wht_boz * _COOP_RATE, _CENT)
 
         # Net payment
         net_payment = gross_coupon - withholding_tax - boz_fees - coop_fees
@@ -98,7 +138,7 @@ class BondCalculator:
         bond_shares: Decimal,
         purchase_date: date,
         maturity_years: int,
-        discount_rate: Decimal = Decimal("0.10")
+        discount_rate: Decimal = _DEFAULT_DISCOUNT_RATE
     ) -> Dict[str, any]:
         """
         Calculate complete purchase breakdown.
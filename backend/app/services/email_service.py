@@ -1,11 +1,21 @@
 """
 Email Notification Service for sending emails to members.
 """
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from html import escape
+from decimal import Decimal
+from email.charset import Charset
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+import queue
 import smtplib
+import threading
+import time
 from typing import List, Optional
 from sqlalchemy.orm import Session
+from jinja2 import Environment, DictLoader
 
 from app.core.config import settings
 from app.models.user import User
@@ -13,6 +23,384 @@ from app.models.payment import CouponPayment
 from app.models.bond import BondPurchase
 
 
+# SMTP settings are read once at import instead of on every send
+_SMTP_HOST = settings.SMTP_HOST
+_SMTP_PORT = settings.SMTP_PORT
+_SMTP_USER = settings.SMTP_USER
+_SMTP_PASSWORD = settings.SMTP_PASSWORD
+
+PAYMENT_NOTIFICATION_TEMPLATE = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background-color: #1a237e; color: white; padding: 20px; text-align: center; }
+        .content { background-color: #f5f5f5; padding: 20px; }
+        .payment-details { background-color: white; padding: 15px; margin: 15px 0; border-radius: 5px; }
+        .amount { font-size: 24px; font-weight: bold; color: #1a237e; text-align: center; margin: 20px 0; }
+        table { width: 100%; border-collapse: collapse; }
+        td { padding: 8px; border-bottom: 1px solid #ddd; }
+        .label { font-weight: bold; width: 50%; }
+        .footer { text-align: center; color: #666; font-size: 12px; margin-top: 20px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Bond Cooperative Society</h1>
+            <h2>Payment Notification</h2>
+        </div>
+        <div class="content">
+            <p>Dear {{ user.first_name }} {{ user.last_name }},</p>
+            <p>We are pleased to inform you that a coupon payment has been processed for your bond holding.</p>
+
+            <div class="amount">
+                Net Payment: {{ currency }} {{ payment.net_payment_amount|money }}
+            </div>
+
+            <div class="payment-details">
+                <h3>Payment Details</h3>
+                <table>
+                    <tr>
+                        <td class="label">Payment Reference:</td>
+                        <td>{{ payment.payment_reference }}</td>
+                    </tr>
+                    <tr>
+                        <td class="label">Payment Type:</td>
+                        <td>{{ payment.payment_type.value.replace('_', ' ').title() }}</td>
+                    </tr>
+                    <tr>
+                        <td class="label">Payment Date:</td>
+                        <td>{{ payment.payment_date.strftime('%B %d, %Y') }}</td>
+                    </tr>
+                    <tr>
+                        <td class="label">Period:</td>
+                        <td>{{ payment.payment_period_start.strftime('%B %d, %Y') }} to {{ payment.payment_period_end.strftime('%B %d, %Y') }}</td>
+                    </tr>
+                    <tr>
+                        <td class="label">Calendar Days:</td>
+                        <td>{{ payment.calendar_days }}</td>
+                    </tr>
+                </table>
+            </div>
+
+            <div class="payment-details">
+                <h3>Payment Breakdown</h3>
+                <table>
+                    <tr>
+                        <td class="label">Gross Coupon Amount:</td>
+                        <td>{{ currency }} {{ payment.gross_coupon_amount|money }}</td>
+                    </tr>
+                    <tr>
+                        <td class="label">Less: Withholding Tax (15%):</td>
+                        <td>-{{ currency }} {{ payment.withholding_tax|money }}</td>
+                    </tr>
+                    <tr>
+                        <td class="label">Less: BOZ Fees (1%):</td>
+                        <td>-{{ currency }} {{ payment.boz_fees|money }}</td>
+                    </tr>
+                    <tr>
+                        <td class="label">Less: Co-op Fees (2%):</td>
+                        <td>-{{ currency }} {{ payment.coop_fees|money }}</td>
+                    </tr>
+                    <tr style="font-weight: bold; background-color: #f0f0f0;">
+                        <td class="label">Net Payment Amount:</td>
+                        <td>{{ currency }} {{ payment.net_payment_amount|money }}</td>
+                    </tr>
+                </table>
+            </div>
+
+            <p>If you have any questions about this payment, please contact us.</p>
+
+            <p>Best regards,<br>
+            Bond Cooperative Society<br>
+            Finance Department</p>
+        </div>
+        <div class="footer">
+            <p>This is an automated email. Please do not reply to this message.</p>
+            <p>&copy; {{ payment.payment_date.year }} Bond Cooperative Society. All rights reserved.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+MATURITY_REMINDER_TEMPLATE = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background-color: #ff6f00; color: white; padding: 20px; text-align: center; }
+        .content { background-color: #fff8e1; padding: 20px; }
+        .bond-details { background-color: white; padding: 15px; margin: 15px 0; border-radius: 5px; }
+        .warning { background-color: #fff3cd; border-left: 4px solid #ff6f00; padding: 15px; margin: 15px 0; }
+        table { width: 100%; border-collapse: collapse; }
+        td { padding: 8px; border-bottom: 1px solid #ddd; }
+        .label { font-weight: bold; width: 50%; }
+        .footer { text-align: center; color: #666; font-size: 12px; margin-top: 20px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Bond Cooperative Society</h1>
+            <h2>Bond Maturity Reminder</h2>
+        </div>
+        <div class="content">
+            <p>Dear {{ user.first_name }} {{ user.last_name }},</p>
+
+            <div class="warning">
+                <strong>Important:</strong> Your bond will mature in {{ days_until_maturity }} days.
+            </div>
+
+            <div class="bond-details">
+                <h3>Bond Details</h3>
+                <table>
+                    <tr>
+                        <td class="label">Transaction Reference:</td>
+                        <td>{{ bond_purchase.transaction_reference }}</td>
+                    </tr>
+                    <tr>
+                        <td class="label">Purchase Date:</td>
+                        <td>{{ bond_purchase.purchase_date.strftime('%B %d, %Y') }}</td>
+                    </tr>
+                    <tr>
+                        <td class="label">Maturity Date:</td>
+                        <td>{{ bond_purchase.maturity_date.strftime('%B %d, %Y') }}</td>
+                    </tr>
+                    <tr>
+                        <td class="label">Bond Shares:</td>
+                        <td>{{ bond_purchase.bond_shares|money }}</td>
+                    </tr>
+                    <tr>
+                        <td class="label">Face Value:</td>
+                        <td>{{ currency }} {{ bond_purchase.face_value|money }}</td>
+                    </tr>
+                </table>
+            </div>
+
+            <p><strong>What happens at maturity?</strong></p>
+            <ul>
+                <li>Final coupon payment will be calculated and processed</li>
+                <li>Principal amount will be returned</li>
+                <li>Bond will be marked as matured</li>
+            </ul>
+
+            <p>No action is required from your side. We will process everything automatically on the maturity date.</p>
+
+            <p>If you have any questions, please contact us.</p>
+
+            <p>Best regards,<br>
+            Bond Cooperative Society</p>
+        </div>
+        <div class="footer">
+            <p>This is an automated reminder. Please do not reply to this message.</p>
+            <p>&copy; {{ bond_purchase.maturity_date.year }} Bond Cooperative Society. All rights reserved.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+WELCOME_TEMPLATE = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background-color: #1a237e; color: white; padding: 20px; text-align: center; }
+        .content { background-color: #f5f5f5; padding: 20px; }
+        .features { background-color: white; padding: 15px; margin: 15px 0; border-radius: 5px; }
+        .footer { text-align: center; color: #666; font-size: 12px; margin-top: 20px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Welcome to Bond Cooperative Society!</h1>
+        </div>
+        <div class="content">
+            <p>Dear {{ user.first_name }} {{ user.last_name }},</p>
+            <p>Welcome to the Bond Cooperative Society! We are excited to have you as a member.</p>
+
+            <div class="features">
+                <h3>Your Member Benefits</h3>
+                <ul>
+                    <li>Access to competitive bond investment opportunities</li>
+                    <li>Regular coupon interest payments</li>
+                    <li>Online portfolio management</li>
+                    <li>Real-time payment notifications</li>
+                    <li>Detailed transaction reports</li>
+                </ul>
+            </div>
+
+            <div class="features">
+                <h3>Getting Started</h3>
+                <ol>
+                    <li>Log in to your member portal</li>
+                    <li>Complete your profile information</li>
+                    <li>Browse available bond types</li>
+                    <li>Contact us to make your first investment</li>
+                </ol>
+            </div>
+
+            <p>If you have any questions, please don't hesitate to contact us.</p>
+
+            <p>Best regards,<br>
+            Bond Cooperative Society Team</p>
+        </div>
+        <div class="footer">
+            <p>&copy; 2024 Bond Cooperative Society. All rights reserved.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+def _format_money(value) -> str:
+    """Format an amount with thousands separators and 2 decimal places, keeping Decimal precision."""
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return f"{value:,.2f}"
+
+
+# Templates are compiled once on first use and cached by the environment
+_TEMPLATES = Environment(
+    loader=DictLoader({
+        'payment_notification.html': PAYMENT_NOTIFICATION_TEMPLATE,
+        'maturity_reminder.html': MATURITY_REMINDER_TEMPLATE,
+        'welcome.html': WELCOME_TEMPLATE,
+    }),
+    autoescape=True,
+    auto_reload=False
+)
+_TEMPLATES.filters['money'] = _format_money
+
+# Body left unencoded (not base64) so placeholders stay searchable in the serialized
+# message; the welcome template is ASCII, so the part is labelled 7bit
+_HTML_CHARSET = Charset('utf-8')
+_HTML_CHARSET.body_encoding = None
+
+
+_WELCOME_SUBJECT = "Welcome to Bond Cooperative Society"
+
+
+@lru_cache(maxsize=None)
+def _welcome_message_bytes() -> bytes:
+    """
+    Serialize the welcome email once with placeholders for the recipient.
+    Sends only substitute __TO__, __FIRST_NAME__ and __LAST_NAME__ in the bytes.
+    """
+    html_content = _TEMPLATES.get_template('welcome.html').render(
+        user={'first_name': '__FIRST_NAME__', 'last_name': '__LAST_NAME__'}
+    )
+
+    message = MIMEMultipart('alternative')
+    message['Subject'] = _WELCOME_SUBJECT
+    message['From'] = _SMTP_USER
+    message['To'] = '__TO__'
+    message.attach(MIMEText(html_content, 'html', _HTML_CHARSET))
+
+    return message.as_bytes()
+
+
+class SMTPPool:
+    """
+    Thread-safe pool of authenticated SMTP connections.
+
+    Connections are reused across messages instead of paying the STARTTLS + LOGIN
+    handshake per email. A connection is retired after max_messages_per_conn sends,
+    when it has been idle longer than max_idle_seconds, or when the server drops it.
+    """
+
+    def __init__(self, max_size: int = 5, max_messages_per_conn: int = 100, max_idle_seconds: int = 60):
+        self.max_messages_per_conn = max_messages_per_conn
+        self.max_idle_seconds = max_idle_seconds
+        # Idle connections as (server, messages_sent, last_used)
+        self._idle = queue.LifoQueue(maxsize=max_size)
+        self._batch_depth = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _connect() -> smtplib.SMTP:
+        server = smtplib.SMTP(_SMTP_HOST, _SMTP_PORT, timeout=30)
+        server.starttls()
+        server.login(_SMTP_USER, _SMTP_PASSWORD)
+        return server
+
+    @staticmethod
+    def _close(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except smtplib.SMTPException:
+            server.close()
+        except OSError:
+            pass
+
+    def _checkout(self):
+        while True:
+            try:
+                server, sent, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect(), 0
+            if time.monotonic() - last_used <= self.max_idle_seconds:
+                return server, sent
+            self._close(server)
+
+    def _checkin(self, server: smtplib.SMTP, sent: int) -> None:
+        if sent >= self.max_messages_per_conn:
+            self._close(server)
+            return
+        try:
+            self._idle.put_nowait((server, sent, time.monotonic()))
+        except queue.Full:
+            self._close(server)
+
+    @contextmanager
+    def acquire(self):
+        """Check out a connection; it is returned to the pool unless sending failed."""
+        server, sent = self._checkout()
+        try:
+            yield server
+        except Exception:
+            # Do not hand a connection in an unknown state to the next sender
+            self._close(server)
+            raise
+        self._checkin(server, sent + 1)
+
+    @contextmanager
+    def batch(self):
+        """Keep pooled connections open for a bulk send and close them afterwards."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                last = self._batch_depth == 0
+            if last:
+                self.close_all()
+
+    def close_all(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                server, _, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(server)
+
+
+smtp_pool = SMTPPool()
+
+
 class EmailService:
     """Service for sending email notifications."""
 
@@ -36,7 +424,7 @@ class EmailService:
             True if successful, False otherwise
         """
         # Check if email is configured
-        if not settings.SMTP_HOST or not settings.SMTP_USER:
+        if not _SMTP_HOST or not _SMTP_USER:
             print("Warning: SMTP not configured. Email not sent.")
             return False
 
@@ -44,7 +432,7 @@ class EmailService:
             # Create message
             message = MIMEMultipart('alternative')
             message['Subject'] = subject
-            message['From'] = settings.SMTP_USER
+            message['From'] = _SMTP_USER
             message['To'] = to_email
 
             if cc:
@@ -54,16 +442,36 @@ class EmailService:
             html_part = MIMEText(html_content, 'html')
             message.attach(html_part)
 
-            # Connect to SMTP server and send
-            with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-                server.starttls()
-                server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+            recipients = [to_email]
+            if cc:
+                recipients.extend(cc)
+
+            return EmailService._send_message(recipients, message.as_string())
+
+        except Exception as e:
+            print(f"Error sending email: {str(e)}")
+            return False
+
+    @staticmethod
+    def _send_message(recipients: List[str], payload) -> bool:
+        """
+        Send an already serialized message over a pooled connection.
 
-                recipients = [to_email]
-                if cc:
-                    recipients.extend(cc)
+        Args:
+            recipients: Envelope recipient addresses
+            payload: Message as str or bytes
 
-                server.sendmail(settings.SMTP_USER, recipients, message.as_string())
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Retry once if the server dropped an idle connection
+            try:
+                with smtp_pool.acquire() as server:
+                    server.sendmail(_SMTP_USER, recipients, payload)
+            except smtplib.SMTPServerDisconnected:
+                with smtp_pool.acquire() as server:
+                    server.sendmail(_SMTP_USER, recipients, payload)
 
             return True
 
@@ -75,6 +483,7 @@ class EmailService:
     def send_payment_notification(
         db: Session,
         payment: CouponPayment,
+        user: Optional[User] = None,
         currency: str = "ZMW"
     ) -> bool:
         """
@@ -83,123 +492,77 @@ class EmailService:
         Args:
             db: Database session
             payment: CouponPayment object
+            user: Payment's member, if the caller already has it loaded
             currency: Currency code
 
         Returns:
             True if successful
         """
-        user = db.query(User).filter(User.user_id == payment.user_id).first()
+        user = user or db.query(User).filter(User.user_id == payment.user_id).first()
 
         if not user:
             return False
 
-        subject = f"Coupon Payment Notification - {payment.payment_reference}"
+        subject, html_content = EmailService._render_payment_notification(user, payment, currency)
 
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background-color: #1a237e; color: white; padding: 20px; text-align: center; }}
-                .content {{ background-color: #f5f5f5; padding: 20px; }}
-                .payment-details {{ background-color: white; padding: 15px; margin: 15px 0; border-radius: 5px; }}
-                .amount {{ font-size: 24px; font-weight: bold; color: #1a237e; text-align: center; margin: 20px 0; }}
-                table {{ width: 100%; border-collapse: collapse; }}
-                td {{ padding: 8px; border-bottom: 1px solid #ddd; }}
-                .label {{ font-weight: bold; width: 50%; }}
-                .footer {{ text-align: center; color: #666; font-size: 12px; margin-top: 20px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>Bond Cooperative Society</h1>
-                    <h2>Payment Notification</h2>
-                </div>
-                <div class="content">
-                    <p>Dear {user.first_name} {user.last_name},</p>
-                    <p>We are pleased to inform you that a coupon payment has been processed for your bond holding.</p>
-
-                    <div class="amount">
-                        Net Payment: {currency} {float(payment.net_payment_amount):,.2f}
-                    </div>
-
-                    <div class="payment-details">
-                        <h3>Payment Details</h3>
-                        <table>
-                            <tr>
-                                <td class="label">Payment Reference:</td>
-                                <td>{payment.payment_reference}</td>
-                            </tr>
-                            <tr>
-                                <td class="label">Payment Type:</td>
-                                <td>{payment.payment_type.value.replace('_', ' ').title()}</td>
-                            </tr>
-                            <tr>
-                                <td class="label">Payment Date:</td>
-                                <td>{payment.payment_date.strftime('%B %d, %Y')}</td>
-                            </tr>
-                            <tr>
-                                <td class="label">Period:</td>
-                                <td>{payment.payment_period_start.strftime('%B %d, %Y')} to {payment.payment_period_end.strftime('%B %d, %Y')}</td>
-                            </tr>
-                            <tr>
-                                <td class="label">Calendar Days:</td>
-                                <td>{payment.calendar_days}</td>
-                            </tr>
-                        </table>
-                    </div>
-
-                    <div class="payment-details">
-                        <h3>Payment Breakdown</h3>
-                        <table>
-                            <tr>
-                                <td class="label">Gross Coupon Amount:</td>
-                                <td>{currency} {float(payment.gross_coupon_amount):,.2f}</td>
-                            </tr>
-                            <tr>
-                                <td class="label">Less: Withholding Tax (15%):</td>
-                                <td>-{currency} {float(payment.withholding_tax):,.2f}</td>
-                            </tr>
-                            <tr>
-                                <td class="label">Less: BOZ Fees (1%):</td>
-                                <td>-{currency} {float(payment.boz_fees):,.2f}</td>
-                            </tr>
-                            <tr>
-                                <td class="label">Less: Co-op Fees (2%):</td>
-                                <td>-{currency} {float(payment.coop_fees):,.2f}</td>
-                            </tr>
-                            <tr style="font-weight: bold; background-color: #f0f0f0;">
-                                <td class="label">Net Payment Amount:</td>
-                                <td>{currency} {float(payment.net_payment_amount):,.2f}</td>
-                            </tr>
-                        </table>
-                    </div>
-
-                    <p>If you have any questions about this payment, please contact us.</p>
-
-                    <p>Best regards,<br>
-                    Bond Cooperative Society<br>
-                    Finance Department</p>
-                </div>
-                <div class="footer">
-                    <p>This is an automated email. Please do not reply to this message.</p>
-                    <p>&copy; {payment.payment_date.year} Bond Cooperative Society. All rights reserved.</p>
-                </div>
-            </div>
-        </body>
-        </html>
+        return EmailService._send_email(user.email, subject, html_content)
+
+    @staticmethod
+    def send_payment_notification_batch(
+        db: Session,
+        payments: List[CouponPayment],
+        currency: str = "ZMW",
+        max_workers: int = 5
+    ) -> int:
         """
+        Send payment notifications for many payments in parallel.
 
-        return EmailService._send_email(user.email, subject, html_content)
+        Args:
+            db: Database session
+            payments: CouponPayment objects
+            currency: Currency code
+            max_workers: Concurrent SMTP sends (each uses its own pooled connection)
+
+        Returns:
+            Number of emails sent successfully
+        """
+        user_ids = {payment.user_id for payment in payments}
+        users_by_id = {
+            user.user_id: user
+            for user in db.query(User).filter(User.user_id.in_(user_ids)).all()
+        }
+
+        # Render in this thread; ORM objects must not be touched from the worker threads
+        messages = []
+        for payment in payments:
+            user = users_by_id.get(payment.user_id)
+            if not user:
+                continue
+            subject, html_content = EmailService._render_payment_notification(user, payment, currency)
+            messages.append((user.email, subject, html_content))
+
+        with smtp_pool.batch(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda message: EmailService._send_email(*message), messages))
+
+        return sum(results)
+
+    @staticmethod
+    def _render_payment_notification(user: User, payment: CouponPayment, currency: str) -> tuple:
+        """Build the subject and HTML body of a payment notification."""
+        subject = f"Coupon Payment Notification - {payment.payment_reference}"
+
+        html_content = _TEMPLATES.get_template('payment_notification.html').render(
+            user=user, payment=payment, currency=currency
+        )
+
+        return subject, html_content
 
     @staticmethod
     def send_maturity_reminder(
         db: Session,
         bond_purchase: BondPurchase,
         days_until_maturity: int,
+        user: Optional[User] = None,
         currency: str = "ZMW"
     ) -> bool:
         """
@@ -209,96 +572,22 @@ class EmailService:
             db: Database session
             bond_purchase: BondPurchase object
             days_until_maturity: Days until bond matures
+            user: Purchase's member, if the caller already has it loaded
             currency: Currency code
 
         Returns:
             True if successful
         """
-        user = db.query(User).filter(User.user_id == bond_purchase.user_id).first()
+        user = user or db.query(User).filter(User.user_id == bond_purchase.user_id).first()
 
         if not user:
             return False
 
         subject = f"Bond Maturity Reminder - {days_until_maturity} Days"
 
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background-color: #ff6f00; color: white; padding: 20px; text-align: center; }}
-                .content {{ background-color: #fff8e1; padding: 20px; }}
-                .bond-details {{ background-color: white; padding: 15px; margin: 15px 0; border-radius: 5px; }}
-                .warning {{ background-color: #fff3cd; border-left: 4px solid #ff6f00; padding: 15px; margin: 15px 0; }}
-                table {{ width: 100%; border-collapse: collapse; }}
-                td {{ padding: 8px; border-bottom: 1px solid #ddd; }}
-                .label {{ font-weight: bold; width: 50%; }}
-                .footer {{ text-align: center; color: #666; font-size: 12px; margin-top: 20px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>Bond Cooperative Society</h1>
-                    <h2>Bond Maturity Reminder</h2>
-                </div>
-                <div class="content">
-                    <p>Dear {user.first_name} {user.last_name},</p>
-
-                    <div class="warning">
-                        <strong>Important:</strong> Your bond will mature in {days_until_maturity} days.
-                    </div>
-
-                    <div class="bond-details">
-                        <h3>Bond Details</h3>
-                        <table>
-                            <tr>
-                                <td class="label">Transaction Reference:</td>
-                                <td>{bond_purchase.transaction_reference}</td>
-                            </tr>
-                            <tr>
-                                <td class="label">Purchase Date:</td>
-                                <td>{bond_purchase.purchase_date.strftime('%B %d, %Y')}</td>
-                            </tr>
-                            <tr>
-                                <td class="label">Maturity Date:</td>
-                                <td>{bond_purchase.maturity_date.strftime('%B %d, %Y')}</td>
-                            </tr>
-                            <tr>
-                                <td class="label">Bond Shares:</td>
-                                <td>{float(bond_purchase.bond_shares):,.2f}</td>
-                            </tr>
-                            <tr>
-                                <td class="label">Face Value:</td>
-                                <td>{currency} {float(bond_purchase.face_value):,.2f}</td>
-                            </tr>
-                        </table>
-                    </div>
-
-                    <p><strong>What happens at maturity?</strong></p>
-                    <ul>
-                        <li>Final coupon payment will be calculated and processed</li>
-                        <li>Principal amount will be returned</li>
-                        <li>Bond will be marked as matured</li>
-                    </ul>
-
-                    <p>No action is required from your side. We will process everything automatically on the maturity date.</p>
-
-                    <p>If you have any questions, please contact us.</p>
-
-                    <p>Best regards,<br>
-                    Bond Cooperative Society</p>
-                </div>
-                <div class="footer">
-                    <p>This is an automated reminder. Please do not reply to this message.</p>
-                    <p>&copy; {bond_purchase.maturity_date.year} Bond Cooperative Society. All rights reserved.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        html_content = _TEMPLATES.get_template('maturity_reminder.html').render(
+            user=user, bond_purchase=bond_purchase, days_until_maturity=days_until_maturity, currency=currency
+        )
 
         return EmailService._send_email(user.email, subject, html_content)
 
@@ -313,62 +602,23 @@ class EmailService:
         Returns:
             True if successful
         """
-        subject = "Welcome to Bond Cooperative Society"
-
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background-color: #1a237e; color: white; padding: 20px; text-align: center; }}
-                .content {{ background-color: #f5f5f5; padding: 20px; }}
-                .features {{ background-color: white; padding: 15px; margin: 15px 0; border-radius: 5px; }}
-                .footer {{ text-align: center; color: #666; font-size: 12px; margin-top: 20px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>Welcome to Bond Cooperative Society!</h1>
-                </div>
-                <div class="content">
-                    <p>Dear {user.first_name} {user.last_name},</p>
-                    <p>Welcome to the Bond Cooperative Society! We are excited to have you as a member.</p>
-
-                    <div class="features">
-                        <h3>Your Member Benefits</h3>
-                        <ul>
-                            <li>Access to competitive bond investment opportunities</li>
-                            <li>Regular coupon interest payments</li>
-                            <li>Online portfolio management</li>
-                            <li>Real-time payment notifications</li>
-                            <li>Detailed transaction reports</li>
-                        </ul>
-                    </div>
-
-                    <div class="features">
-                        <h3>Getting Started</h3>
-                        <ol>
-                            <li>Log in to your member portal</li>
-                            <li>Complete your profile information</li>
-                            <li>Browse available bond types</li>
-                            <li>Contact us to make your first investment</li>
-                        </ol>
-                    </div>
-
-                    <p>If you have any questions, please don't hesitate to contact us.</p>
-
-                    <p>Best regards,<br>
-                    Bond Cooperative Society Team</p>
-                </div>
-                <div class="footer">
-                    <p>&copy; 2024 Bond Cooperative Society. All rights reserved.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        if not _SMTP_HOST or not _SMTP_USER:
+            print("Warning: SMTP not configured. Email not sent.")
+            return False
 
-        return EmailService._send_email(user.email, subject, html_content)
+        # The cached message's body is labelled 7bit, so recipients whose details are not
+        # plain ASCII get a normally built (base64-encoded) message instead
+        if not (user.email + user.first_name + user.last_name).isascii():
+            html_content = _TEMPLATES.get_template('welcome.html').render(user=user)
+            return EmailService._send_email(user.email, _WELCOME_SUBJECT, html_content)
+
+        # Only the recipient differs between welcome emails; patch it into the cached message
+        payload = _welcome_message_bytes().replace(
+            b'__TO__', user.email.encode()
+        ).replace(
+            b'__FIRST_NAME__', escape(user.first_name).encode()
+        ).replace(
+            b'__LAST_NAME__', escape(user.last_name).encode()
+        )
+
+        return EmailService._send_message([user.email], payload)
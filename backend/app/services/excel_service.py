@@ -2,19 +2,57 @@
 Excel Import/Export Service using pandas and openpyxl.
 """
 import pandas as pd
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
+from sqlalchemy import bindparam, insert, select
 from sqlalchemy.orm import Session
 from datetime import date, datetime
 from decimal import Decimal
 from typing import List, Dict
 import os
 
-from app.models.bond import BondPurchase, BondType
+from app.models.bond import BondPurchase, BondType, PurchaseStatus
 from app.models.payment import CouponPayment
 from app.models.user import User
 from app.models.balance import MemberBalance, MonthlySummary
+from app.services.bond_calculator import BondCalculator
+
+
+# Rows per INSERT/savepoint when importing bond purchases
+IMPORT_CHUNK_SIZE = 500
+
+# Export statements are built once and reused so their compiled form stays cached
+_MONTHLY_BALANCES_STMT = select(MemberBalance, User, BondType).join(
+    User, User.user_id == MemberBalance.user_id
+).join(
+    BondType, BondType.bond_type_id == MemberBalance.bond_type_id
+).where(
+    MemberBalance.balance_date == bindparam('month')
+)
+
+_PAYMENT_REGISTER_STMT = select(
+    CouponPayment.payment_date,
+    CouponPayment.payment_reference,
+    User.user_id,
+    User.first_name,
+    User.last_name,
+    CouponPayment.payment_type,
+    CouponPayment.payment_period_start,
+    CouponPayment.payment_period_end,
+    CouponPayment.calendar_days,
+    CouponPayment.gross_coupon_amount,
+    CouponPayment.withholding_tax,
+    CouponPayment.boz_fees,
+    CouponPayment.coop_fees,
+    CouponPayment.net_payment_amount,
+    CouponPayment.payment_status
+).join(
+    User, User.user_id == CouponPayment.user_id
+).where(
+    CouponPayment.payment_date.between(bindparam('start'), bindparam('end'))
+).order_by(CouponPayment.payment_date)
 
 
 class ExcelService:
@@ -40,17 +78,8 @@ class ExcelService:
         if not summary:
             raise ValueError(f"No summary found for {month}")
 
-        # Get member balances
-        balances = db.query(MemberBalance).filter(
-            MemberBalance.balance_date == month
-        ).all()
-
-        # Create workbook
-        wb = Workbook()
-
-        # Summary sheet
-        ws_summary = wb.active
-        ws_summary.title = "Monthly Summary"
+        # Get member balances with their member and bond type in one query
+        balances = db.execute(_MONTHLY_BALANCES_STMT, {'month': month}).all()
 
         # Header styling
         header_fill = PatternFill(start_color="1a237e", end_color="1a237e", fill_type="solid")
@@ -62,14 +91,7 @@ class ExcelService:
             bottom=Side(style='thin')
         )
 
-        # Title
-        ws_summary['A1'] = "BOND COOPERATIVE SOCIETY"
-        ws_summary['A1'].font = Font(bold=True, size=16, color="1a237e")
-        ws_summary['A2'] = f"Monthly Summary - {month.strftime('%B %Y')}"
-        ws_summary['A2'].font = Font(bold=True, size=14)
-
         # Summary data
-        row = 4
         summary_data = [
             ("Total Bond Shares", float(summary.total_bond_shares)),
             ("Total Face Value", float(summary.total_face_value)),
@@ -85,69 +107,95 @@ class ExcelService:
             ("Matured Bonds Count", summary.matured_bonds_count),
         ]
 
-        for label, value in summary_data:
-            ws_summary[f'A{row}'] = label
-            ws_summary[f'A{row}'].font = Font(bold=True)
-            ws_summary[f'B{row}'] = value
-            if isinstance(value, float):
-                ws_summary[f'B{row}'].number_format = '#,##0.00'
-            row += 1
-
-        # Member Balances sheet
-        ws_balances = wb.create_sheet("Member Balances")
-
-        # Headers
+        # Member balance rows
         headers = [
             'Member ID', 'Member Name', 'Bond Type', 'Opening Balance',
             'Purchases', 'Payments Received', 'Closing Balance',
             'Total Shares', 'Total Face Value', '% Share'
         ]
+        balance_rows = []
+        balance_widths = [len(header) for header in headers]
+        for balance, user, bond_type in balances:
+            values = (
+                f"M{user.user_id:04d}",
+                f"{user.first_name} {user.last_name}",
+                bond_type.bond_name,
+                float(balance.opening_balance),
+                float(balance.purchases_month),
+                float(balance.payments_received),
+                float(balance.closing_balance),
+                float(balance.total_bond_shares),
+                float(balance.total_face_value),
+                float(balance.percentage_share),
+            )
+            # Track column widths while building rows instead of re-reading cells afterwards
+            for col, value in enumerate(values):
+                balance_widths[col] = max(balance_widths[col], len(str(value)))
+            balance_rows.append(values)
+
+        # Create workbook in write-only mode so rows are streamed to disk
+        wb = Workbook(write_only=True)
+
+        # Summary sheet
+        ws_summary = wb.create_sheet("Monthly Summary")
+        summary_widths = [0, 0]
+
+        title = WriteOnlyCell(ws_summary, value="BOND COOPERATIVE SOCIETY")
+        title.font = Font(bold=True, size=16, color="1a237e")
+        subtitle = WriteOnlyCell(ws_summary, value=f"Monthly Summary - {month.strftime('%B %Y')}")
+        subtitle.font = Font(bold=True, size=14)
+        summary_rows = [[title], [subtitle], []]
+
+        for label, value in summary_data:
+            label_cell = WriteOnlyCell(ws_summary, value=label)
+            label_cell.font = Font(bold=True)
+            value_cell = WriteOnlyCell(ws_summary, value=value)
+            if isinstance(value, float):
+                value_cell.number_format = '#,##0.00'
+            summary_rows.append([label_cell, value_cell])
+
+        # Column widths must be set before the first row is written
+        for cells in summary_rows:
+            for col, cell in enumerate(cells):
+                summary_widths[col] = max(summary_widths[col], len(str(cell.value)))
+        for col, width in enumerate(summary_widths, 1):
+            ws_summary.column_dimensions[get_column_letter(col)].width = width + 2
 
-        for col, header in enumerate(headers, 1):
-            cell = ws_balances.cell(row=1, column=col)
-            cell.value = header
+        for cells in summary_rows:
+            ws_summary.append(cells)
+
+        # Member Balances sheet
+        ws_balances = wb.create_sheet("Member Balances")
+
+        # Number format per column; None leaves text columns unstyled
+        balance_formats = [None] * 3 + ['#,##0.00'] * 6 + ['0.00000%']
+        for col, (width, number_format) in enumerate(zip(balance_widths, balance_formats), 1):
+            dimension = ws_balances.column_dimensions[get_column_letter(col)]
+            dimension.width = width + 2
+            if number_format:
+                dimension.number_format = number_format
+
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws_balances, value=header)
             cell.font = header_font
             cell.fill = header_fill
             cell.alignment = Alignment(horizontal='center')
             cell.border = border
-
-        # Data
-        row = 2
-        for balance in balances:
-            user = db.query(User).filter(User.user_id == balance.user_id).first()
-            bond_type = db.query(BondType).filter(BondType.bond_type_id == balance.bond_type_id).first()
-
-            ws_balances.cell(row=row, column=1, value=f"M{user.user_id:04d}")
-            ws_balances.cell(row=row, column=2, value=f"{user.first_name} {user.last_name}")
-            ws_balances.cell(row=row, column=3, value=bond_type.bond_name)
-            ws_balances.cell(row=row, column=4, value=float(balance.opening_balance))
-            ws_balances.cell(row=row, column=5, value=float(balance.purchases_month))
-            ws_balances.cell(row=row, column=6, value=float(balance.payments_received))
-            ws_balances.cell(row=row, column=7, value=float(balance.closing_balance))
-            ws_balances.cell(row=row, column=8, value=float(balance.total_bond_shares))
-            ws_balances.cell(row=row, column=9, value=float(balance.total_face_value))
-            ws_balances.cell(row=row, column=10, value=float(balance.percentage_share))
-
-            # Number formatting
-            for col in range(4, 10):
-                ws_balances.cell(row=row, column=col).number_format = '#,##0.00'
-            ws_balances.cell(row=row, column=10).number_format = '0.00000%'
-
-            row += 1
-
-        # Auto-adjust column widths
-        for ws in [ws_summary, ws_balances]:
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = (max_length + 2)
-                ws.column_dimensions[column].width = adjusted_width
+            header_cells.append(cell)
+        ws_balances.append(header_cells)
+
+        # Excel only applies a column's format to empty cells, so written cells still carry their own
+        for values in balance_rows:
+            cells = []
+            for value, number_format in zip(values, balance_formats):
+                if number_format is None:
+                    cells.append(value)
+                    continue
+                cell = WriteOnlyCell(ws_balances, value=value)
+                cell.number_format = number_format
+                cells.append(cell)
+            ws_balances.append(cells)
 
         # Save file
         temp_dir = os.path.join(os.path.dirname(__file__), '../../temp')
@@ -172,38 +220,27 @@ class ExcelService:
         Returns:
             Path to generated Excel file
         """
-        # Get payments
-        payments = db.query(CouponPayment).filter(
-            CouponPayment.payment_date >= start_date,
-            CouponPayment.payment_date <= end_date
-        ).order_by(CouponPayment.payment_date).all()
-
-        # Create DataFrame
-        data = []
-        for payment in payments:
-            user = db.query(User).filter(User.user_id == payment.user_id).first()
-            bond_purchase = db.query(BondPurchase).filter(
-                BondPurchase.purchase_id == payment.purchase_id
-            ).first()
-
-            data.append({
-                'Payment Date': payment.payment_date,
-                'Payment Reference': payment.payment_reference,
-                'Member ID': f"M{user.user_id:04d}",
-                'Member Name': f"{user.first_name} {user.last_name}",
-                'Payment Type': payment.payment_type.value,
-                'Period Start': payment.payment_period_start,
-                'Period End': payment.payment_period_end,
-                'Calendar Days': payment.calendar_days,
-                'Gross Coupon': float(payment.gross_coupon_amount),
-                'Withholding Tax': float(payment.withholding_tax),
-                'BOZ Fees': float(payment.boz_fees),
-                'Co-op Fees': float(payment.coop_fees),
-                'Net Payment': float(payment.net_payment_amount),
-                'Status': payment.payment_status.value,
-            })
-
-        df = pd.DataFrame(data)
+        # Get the register columns with their members in one query
+        rows = db.execute(_PAYMENT_REGISTER_STMT, {'start': start_date, 'end': end_date}).all()
+
+        # Create DataFrame column-wise
+        raw = pd.DataFrame.from_records(rows, columns=[
+            'Payment Date', 'Payment Reference', 'user_id', 'first_name', 'last_name',
+            'Payment Type', 'Period Start', 'Period End', 'Calendar Days',
+            'Gross Coupon', 'Withholding Tax', 'BOZ Fees', 'Co-op Fees', 'Net Payment', 'Status'
+        ])
+
+        amount_columns = ['Gross Coupon', 'Withholding Tax', 'BOZ Fees', 'Co-op Fees', 'Net Payment']
+        raw[amount_columns] = raw[amount_columns].astype('float64')
+        raw['Member ID'] = 'M' + raw['user_id'].astype(str).str.zfill(4)
+        raw['Member Name'] = raw['first_name'] + ' ' + raw['last_name']
+        raw['Payment Type'] = raw['Payment Type'].map(lambda payment_type: payment_type.value)
+        raw['Status'] = raw['Status'].map(lambda payment_status: payment_status.value)
+
+        df = raw[[
+            'Payment Date', 'Payment Reference', 'Member ID', 'Member Name', 'Payment Type',
+            'Period Start', 'Period End', 'Calendar Days'
+        ] + amount_columns + ['Status']]
 
         # Create workbook
         temp_dir = os.path.join(os.path.dirname(__file__), '../../temp')
@@ -212,27 +249,40 @@ class ExcelService:
         filename = f"payment_register_{start_date}_{end_date}.xlsx"
         filepath = os.path.join(temp_dir, filename)
 
-        # Write to Excel with formatting
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Payment Register', index=False)
+        # Stream the register with a write-only workbook
+        wb = Workbook(write_only=True)
+        worksheet = wb.create_sheet('Payment Register')
 
-            workbook = writer.book
-            worksheet = writer.sheets['Payment Register']
+        # Header styling
+        header_fill = PatternFill(start_color="1a237e", end_color="1a237e", fill_type="solid")
+        header_font = Font(color="FFFFFF", bold=True)
 
-            # Header styling
-            header_fill = PatternFill(start_color="1a237e", end_color="1a237e", fill_type="solid")
-            header_font = Font(color="FFFFFF", bold=True)
+        # Column widths from the data, one vectorised pass per column
+        for col, header in enumerate(df.columns, 1):
+            data_width = df[header].astype(str).str.len().max() if len(df) else 0
+            worksheet.column_dimensions[get_column_letter(col)].width = max(int(data_width), len(header)) + 2
 
-            for col_num, value in enumerate(df.columns.values, 1):
-                cell = worksheet.cell(row=1, column=col_num)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal='center')
+        header_cells = []
+        for header in df.columns:
+            cell = WriteOnlyCell(worksheet, value=header)
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.alignment = Alignment(horizontal='center')
+            header_cells.append(cell)
+        worksheet.append(header_cells)
+
+        # Amount columns get a number format; everything else is written as-is
+        number_formats = ['#,##0.00' if column in amount_columns else None for column in df.columns]
+        for values in df.itertuples(index=False, name=None):
+            cells = []
+            for value, number_format in zip(values, number_formats):
+                if number_format is not None:
+                    value = WriteOnlyCell(worksheet, value=value)
+                    value.number_format = number_format
+                cells.append(value)
+            worksheet.append(cells)
 
-            # Number formatting
-            for row in range(2, len(df) + 2):
-                for col in [9, 10, 11, 12, 13]:  # Amount columns
-                    worksheet.cell(row=row, column=col).number_format = '#,##0.00'
+        wb.save(filepath)
 
         return filepath
 
@@ -250,78 +300,121 @@ class ExcelService:
             Dictionary with import results
         """
         try:
-            # Read Excel file
-            df = pd.read_excel(file_path)
+            # Read the sheet as plain value tuples; row 1 holds the column names
+            wb = load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                rows_iter = wb.active.iter_rows(values_only=True)
+                header = next(rows_iter, ())
+                records = [
+                    dict(zip(header, values)) for values in rows_iter
+                    if any(value is not None for value in values)
+                ]
+            finally:
+                wb.close()
 
             results = {
                 'success': [],
                 'errors': [],
-                'total': len(df)
+                'total': len(records)
+            }
+
+            # Look up members and bond types once for the whole file, loading only the columns used below
+            emails = list({row['email'] for row in records if row.get('email') is not None})
+            bond_names = list({row['bond_type'] for row in records if row.get('bond_type') is not None})
+            users = {
+                u.email: u for u in db.query(User.email, User.user_id).filter(User.email.in_(emails))
+            }
+            bond_types = {
+                bt.bond_name: bt for bt in db.query(
+                    BondType.bond_name, BondType.bond_type_id, BondType.maturity_period_years
+                ).filter(BondType.bond_name.in_(bond_names))
             }
 
-            for idx, row in df.iterrows():
+            # Validate and calculate every row before touching the database
+            pending = []
+            for idx, row in enumerate(records):
                 try:
                     # Validate required fields
                     required_fields = ['email', 'bond_shares', 'purchase_date', 'bond_type']
                     for field in required_fields:
-                        if field not in row or pd.isna(row[field]):
+                        if row.get(field) is None:
                             raise ValueError(f"Missing required field: {field}")
 
-                    # Find or create user
-                    user = db.query(User).filter(User.email == row['email']).first()
+                    user = users.get(row['email'])
                     if not user:
                         raise ValueError(f"User not found with email: {row['email']}")
 
-                    # Find bond type
-                    bond_type = db.query(BondType).filter(
-                        BondType.bond_name == row['bond_type']
-                    ).first()
+                    bond_type = bond_types.get(row['bond_type'])
                     if not bond_type:
                         raise ValueError(f"Bond type not found: {row['bond_type']}")
 
-                    # Calculate values using Bond Calculator
-                    from app.services.bond_calculator import BondCalculator
+                    purchase_date = pd.to_datetime(row['purchase_date']).date()
+                    bond_shares = Decimal(str(row['bond_shares']))
+                    discount_rate = row.get('discount_rate')
 
+                    # Calculate values using Bond Calculator
                     calc_results = BondCalculator.calculate_purchase_breakdown(
-                        bond_shares=Decimal(str(row['bond_shares'])),
-                        purchase_date=pd.to_datetime(row['purchase_date']).date(),
+                        bond_shares=bond_shares,
+                        purchase_date=purchase_date,
                         maturity_years=bond_type.maturity_period_years,
-                        discount_rate=Decimal(str(row.get('discount_rate', 0.10)))
+                        discount_rate=Decimal(str(0.10 if discount_rate is None else discount_rate))
                     )
 
-                    # Create bond purchase
-                    purchase = BondPurchase(
-                        user_id=user.user_id,
-                        bond_type_id=bond_type.bond_type_id,
-                        purchase_date=pd.to_datetime(row['purchase_date']).date(),
-                        purchase_month=pd.to_datetime(row['purchase_date']).date().replace(day=1),
-                        bond_shares=Decimal(str(row['bond_shares'])),
-                        face_value=calc_results['face_value'],
-                        discount_value=calc_results['discount_value'],
-                        coop_discount_fee=calc_results['coop_discount_fee'],
-                        net_discount_value=calc_results['net_discount_value'],
-                        purchase_price=calc_results['purchase_price'],
-                        maturity_date=calc_results['maturity_date'],
-                        transaction_reference=f"IMP{datetime.now().strftime('%Y%m%d')}{idx:04d}",
-                        notes=row.get('notes', None)
-                    )
+                    pending.append((idx, row, {
+                        'user_id': user.user_id,
+                        'bond_type_id': bond_type.bond_type_id,
+                        'purchase_date': purchase_date,
+                        'purchase_month': purchase_date.replace(day=1),
+                        'bond_shares': bond_shares,
+                        'face_value': calc_results['face_value'],
+                        'discount_value': calc_results['discount_value'],
+                        'coop_discount_fee': calc_results['coop_discount_fee'],
+                        'net_discount_value': calc_results['net_discount_value'],
+                        'purchase_price': calc_results['purchase_price'],
+                        'maturity_date': calc_results['maturity_date'],
+                        'purchase_status': PurchaseStatus.ACTIVE,
+                        'transaction_reference': f"IMP{datetime.now().strftime('%Y%m%d')}{idx:04d}",
+                        'notes': row.get('notes')
+                    }))
 
-                    db.add(purchase)
-                    db.commit()
+                except Exception as e:
+                    results['errors'].append({
+                        'row': idx + 2,  # Excel row number
+                        'error': str(e),
+                        'data': row
+                    })
 
+            # Insert in chunks, each under a savepoint. If a chunk fails it is rolled back
+            # and its rows retried one at a time, so only the offending rows are reported
+            for chunk_start in range(0, len(pending), IMPORT_CHUNK_SIZE):
+                chunk = pending[chunk_start:chunk_start + IMPORT_CHUNK_SIZE]
+                try:
+                    with db.begin_nested():
+                        db.execute(insert(BondPurchase), [values for _, _, values in chunk])
+                    inserted = chunk
+                except Exception:
+                    inserted = []
+                    for idx, row, values in chunk:
+                        try:
+                            with db.begin_nested():
+                                db.execute(insert(BondPurchase), values)
+                        except Exception as e:
+                            results['errors'].append({
+                                'row': idx + 2,
+                                'error': str(e),
+                                'data': row
+                            })
+                            continue
+                        inserted.append((idx, row, values))
+
+                for idx, row, _ in inserted:
                     results['success'].append({
-                        'row': idx + 2,  # Excel row number
+                        'row': idx + 2,
                         'email': row['email'],
                         'bond_shares': row['bond_shares']
                     })
 
-                except Exception as e:
-                    db.rollback()
-                    results['errors'].append({
-                        'row': idx + 2,
-                        'error': str(e),
-                        'data': row.to_dict()
-                    })
+            db.commit()
 
             return results
 
@@ -1,13 +1,24 @@
 """
 Notification Service for creating and managing user notifications.
 """
+import logging
+
+from kombu.exceptions import OperationalError
+from sqlalchemy import event, insert, select, update
 from sqlalchemy.orm import Session
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
+from app.core.cache import count_cache
 from app.models.notification import Notification, NotificationType
 from app.models.user import User
 
+logger = logging.getLogger(__name__)
+
+
+def _unread_count_key(user_id: int) -> str:
+    return f"notif:unread:{user_id}"
+
 
 class NotificationService:
     """Service for managing notifications."""
@@ -20,7 +31,8 @@ class NotificationService:
         title: str,
         message: str,
         related_entity_type: str = None,
-        related_entity_id: int = None
+        related_entity_id: int = None,
+        commit: bool = True
     ) -> Notification:
         """
         Create a new notification for a user.
@@ -33,6 +45,8 @@ class NotificationService:
             message: Notification message
             related_entity_type: Optional related entity type
             related_entity_id: Optional related entity ID
+            commit: Commit immediately; pass False when the caller owns the
+                transaction and will commit it
 
         Returns:
             Created Notification object
@@ -47,9 +61,19 @@ class NotificationService:
         )
 
         db.add(notification)
+        key = _unread_count_key(user_id)
+
+        if not commit:
+            db.flush()
+            # The row may still be rolled back, so drop the cached count once the caller commits
+            event.listen(db, "after_commit", lambda session: count_cache.delete(key), once=True)
+            return notification
+
         db.commit()
         db.refresh(notification)
 
+        count_cache.incr(key)
+
         return notification
 
     @staticmethod
@@ -60,25 +84,49 @@ class NotificationService:
         ).first()
 
         if notification:
+            was_unread = not notification.is_read
             notification.is_read = True
             notification.read_at = datetime.utcnow()
             db.commit()
             db.refresh(notification)
 
+            if was_unread:
+                count_cache.decr(_unread_count_key(notification.user_id))
+
         return notification
 
     @staticmethod
     def mark_all_as_read(db: Session, user_id: int) -> int:
         """Mark all notifications as read for a user."""
-        count = db.query(Notification).filter(
-            Notification.user_id == user_id,
-            Notification.is_read == False
-        ).update({
-            "is_read": True,
-            "read_at": datetime.utcnow()
-        })
+        # RETURNING gives the affected ids in the same round trip as the update
+        notification_ids = db.execute(
+            update(Notification).where(
+                Notification.user_id == user_id,
+                Notification.is_read == False
+            ).values(
+                is_read=True,
+                read_at=datetime.utcnow()
+            ).returning(Notification.notification_id)
+        ).scalars().all()
 
         db.commit()
+
+        # Nothing is left unread, so the cached count is known without a query
+        count_cache.set(_unread_count_key(user_id), 0)
+
+        return len(notification_ids)
+
+    @staticmethod
+    def get_unread_count(db: Session, user_id: int) -> int:
+        """Get the number of unread notifications, served from Redis when cached."""
+        key = _unread_count_key(user_id)
+        count = count_cache.get(key)
+        if count is None:
+            count = db.query(Notification).filter(
+                Notification.user_id == user_id,
+                Notification.is_read == False
+            ).count()
+            count_cache.set(key, count)
         return count
 
     @staticmethod
@@ -105,7 +153,7 @@ class NotificationService:
         return query.order_by(Notification.created_at.desc()).limit(limit).all()
 
     @staticmethod
-    def notify_payment_due(db: Session, user_id: int, payment_id: int, amount: float):
+    def notify_payment_due(db: Session, user_id: int, payment_id: int, amount: float, commit: bool = True):
         """Create a payment due notification."""
         return NotificationService.create_notification(
             db=db,
@@ -114,11 +162,12 @@ class NotificationService:
             title="Payment Due",
             message=f"A coupon payment of ZMW {amount:.2f} is due.",
             related_entity_type="coupon_payment",
-            related_entity_id=payment_id
+            related_entity_id=payment_id,
+            commit=commit
         )
 
     @staticmethod
-    def notify_payment_processed(db: Session, user_id: int, payment_id: int, amount: float):
+    def notify_payment_processed(db: Session, user_id: int, payment_id: int, amount: float, commit: bool = True):
         """Create a payment processed notification."""
         return NotificationService.create_notification(
             db=db,
@@ -127,11 +176,14 @@ class NotificationService:
             title="Payment Processed",
             message=f"Your coupon payment of ZMW {amount:.2f} has been processed.",
             related_entity_type="coupon_payment",
-            related_entity_id=payment_id
+            related_entity_id=payment_id,
+            commit=commit
         )
 
     @staticmethod
-    def notify_maturity_approaching(db: Session, user_id: int, purchase_id: int, maturity_date: str):
+    def notify_maturity_approaching(
+        db: Session, user_id: int, purchase_id: int, maturity_date: str, commit: bool = True
+    ):
         """Create a maturity approaching notification."""
         return NotificationService.create_notification(
             db=db,
@@ -140,35 +192,81 @@ class NotificationService:
             title="Bond Maturity Approaching",
             message=f"Your bond will mature on {maturity_date}. Please prepare for redemption.",
             related_entity_type="bond_purchase",
-            related_entity_id=purchase_id
+            related_entity_id=purchase_id,
+            commit=commit
         )
 
     @staticmethod
-    def notify_rate_update(db: Session, bond_type_name: str, new_rate: float):
-        """Notify all members with bonds of this type about rate update."""
-        # Get all users with active bonds of this type
-        from app.models.bond import BondPurchase, BondType
+    def notify_rate_update(rate_id: int) -> Optional[str]:
+        """
+        Queue rate update notifications for all members with bonds of the rate's type.
+
+        The fan-out runs on a Celery worker so the caller does not wait on one
+        row per member. Returns the task id, or None if the broker is unavailable;
+        the notifications are best-effort, like the other Redis-backed features.
+        """
+        from app.tasks.notification_tasks import notify_rate_update_task
+
+        try:
+            # No publish retries: the rate is already saved and the request should not stall
+            return notify_rate_update_task.apply_async((rate_id,), retry=False).id
+        except OperationalError:
+            logger.exception("Could not queue rate update notifications for rate %s", rate_id)
+            return None
+
+    @staticmethod
+    def _notify_rate_update(db: Session, rate_id: int) -> int:
+        """
+        Insert rate update notifications for all members with active bonds of the rate's type.
+
+        Safe to retry: members already notified of this rate are skipped.
+        Returns the number of notifications created.
+        """
+        from app.models.bond import BondPurchase, InterestRate, PurchaseStatus
+
+        rate = db.get(InterestRate, rate_id)
+        if not rate:
+            return 0
 
-        bond_type = db.query(BondType).filter(BondType.bond_name == bond_type_name).first()
-        if not bond_type:
-            return []
+        message = (
+            f"The interest rate for {rate.bond_type.bond_name} has been updated "
+            f"to {rate.annual_rate:.2%}."
+        )
+
+        # The interest rate row is the idempotency key, so a retry at any time skips
+        # members the earlier attempt already notified
+        already_notified = select(Notification.user_id).where(
+            Notification.notification_type == NotificationType.RATE_UPDATE,
+            Notification.related_entity_type == "interest_rate",
+            Notification.related_entity_id == rate_id
+        )
 
         user_ids = db.query(BondPurchase.user_id).filter(
-            BondPurchase.bond_type_id == bond_type.bond_type_id,
-            BondPurchase.purchase_status == "active"
+            BondPurchase.bond_type_id == rate.bond_type_id,
+            BondPurchase.purchase_status == PurchaseStatus.ACTIVE,
+            BondPurchase.user_id.not_in(already_notified)
         ).distinct().all()
 
-        notifications = []
-        for (user_id,) in user_ids:
-            notification = NotificationService.create_notification(
-                db=db,
-                user_id=user_id,
-                notification_type=NotificationType.RATE_UPDATE,
-                title="Interest Rate Update",
-                message=f"The interest rate for {bond_type_name} has been updated to {new_rate:.2%}.",
-                related_entity_type="bond_type",
-                related_entity_id=bond_type.bond_type_id
-            )
-            notifications.append(notification)
-
-        return notifications
+        if not user_ids:
+            return 0
+
+        # One multi-row INSERT and one commit for every member
+        db.execute(
+            insert(Notification),
+            [
+                {
+                    "user_id": user_id,
+                    "notification_type": NotificationType.RATE_UPDATE,
+                    "title": "Interest Rate Update",
+                    "message": message,
+                    "related_entity_type": "interest_rate",
+                    "related_entity_id": rate_id
+                }
+                for (user_id,) in user_ids
+            ]
+        )
+        db.commit()
+
+        count_cache.adjust({_unread_count_key(user_id): 1 for (user_id,) in user_ids})
+
+        return len(user_ids)
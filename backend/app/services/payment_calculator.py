@@ -1,79 +1,159 @@
+import csv
+import io
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from decimal import Decimal, ROUND_HALF_UP
-from typing import List, Dict, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from typing import Callable, Dict, Iterator, List, Optional
+import numpy as np
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import and_, func, insert, select, text
 from datetime import date
 
+from app.core.config import settings
 from app.models import (
     BondIssue, MemberBondHolding, PaymentEvent, MemberPayment,
     User, EventType
 )
+from app.models.types import MoneyCents
 
 
+# Events with more member payments than this are written with COPY instead of INSERTs
+COPY_THRESHOLD = 500
+
+# Rows per multi-row INSERT for smaller events
+INSERT_CHUNK_SIZE = 1000
+
+# Events with at least this many holdings are calculated on integer cent arrays;
+# below this the per-member Decimal loop is faster than the array setup
+VECTORIZE_THRESHOLD = 1000
+
+# Keep every intermediate product well inside int64
+_INT64_PRODUCT_LIMIT = 2 ** 62
+
+MEMBER_PAYMENT_AMOUNT_FIELDS = (
+    "boz_award_value", "base_amount", "coop_discount_fee", "net_discount_value",
+    "gross_coupon_from_boz", "withholding_tax", "boz_fee", "coop_fee_on_coupon",
+    "net_maturity_coupon", "net_coupon_payment"
+)
+
+
+_CENT = Decimal("0.01")
+
+
+def _report_load_options() -> list:
+    """Loader options for report queries; with STRICT_LOADING any lazy load raises."""
+    return [raiseload('*', sql_only=True)] if settings.STRICT_LOADING else []
+
+
+def _discount_maturity_amounts(
+    member_face_value: Decimal,
+    boz_award_value: Decimal,
+    rates: tuple
+) -> Dict[str, Decimal]:
+    """Discount and maturity coupon amounts for one member."""
+    effective_rate, _, wht_rate, boz_fee_rate, coop_fee_rate = rates
+
+    # Discount Value = Face Value - BOZ Award Value
+    discount_value = member_face_value - boz_award_value
+    # Co-op discount fee = Discount Value * coop_fee_rate
+    coop_discount_fee = (discount_value * coop_fee_rate).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+    # Maturity Coupon calculation
+    gross_coupon = (member_face_value * effective_rate).quantize(_CENT, rounding=ROUND_HALF_UP)
+    withholding_tax = (gross_coupon * wht_rate).quantize(_CENT, rounding=ROUND_HALF_UP)
+    boz_fee = (gross_coupon * boz_fee_rate).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+    return {
+        "base_amount": discount_value.quantize(_CENT, rounding=ROUND_HALF_UP),
+        "coop_discount_fee": coop_discount_fee,
+        "net_discount_value": (discount_value - coop_discount_fee).quantize(_CENT, rounding=ROUND_HALF_UP),
+        "gross_coupon_from_boz": gross_coupon,
+        "withholding_tax": withholding_tax,
+        "boz_fee": boz_fee,
+        # Already whole cents, no further rounding needed
+        "net_maturity_coupon": gross_coupon - withholding_tax - boz_fee
+    }
+
+
+def _semi_annual_coupon_amounts(
+    member_face_value: Decimal,
+    boz_award_value: Decimal,
+    rates: tuple
+) -> Dict[str, Decimal]:
+    """Semi-annual coupon amounts for one member."""
+    _, coupon_rate_period, wht_rate, boz_fee_rate, coop_fee_rate = rates
+
+    # Base amount = member_face_value * coupon_rate_period
+    base_amount = (member_face_value * coupon_rate_period).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+    # Withholding tax, BOZ fee and co-op fee on coupon
+    withholding_tax = (base_amount * wht_rate).quantize(_CENT, rounding=ROUND_HALF_UP)
+    boz_fee = (base_amount * boz_fee_rate).quantize(_CENT, rounding=ROUND_HALF_UP)
+    coop_fee_on_coupon = (base_amount * coop_fee_rate).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+    return {
+        "base_amount": base_amount,
+        "gross_coupon_from_boz": base_amount,
+        "withholding_tax": withholding_tax,
+        "boz_fee": boz_fee,
+        "coop_fee_on_coupon": coop_fee_on_coupon,
+        # Net coupon payment; already whole cents
+        "net_coupon_payment": base_amount - withholding_tax - boz_fee - coop_fee_on_coupon
+    }
+
+
+def _no_event_amounts(member_face_value: Decimal, boz_award_value: Decimal, rates: tuple) -> Dict[str, Decimal]:
+    return {}
+
+
+# Rates are passed as (effective_rate, coupon_rate_period, wht_rate, boz_fee_rate, coop_fee_rate)
+_EVENT_AMOUNT_CALCULATORS = {
+    EventType.DISCOUNT_MATURITY: _discount_maturity_amounts,
+    EventType.COUPON_SEMI_ANNUAL: _semi_annual_coupon_amounts,
+}
+
+
+@dataclass(slots=True)
 class PaymentCalculationResult:
     """Data class for payment calculation results."""
-    def __init__(
-        self,
-        member_id: int,
-        member_code: str,
-        member_name: str,
-        bond_shares: Decimal,
-        percentage_share: Decimal,
-        member_face_value: Decimal,
-        # BOZ Award fields
-        boz_award_value: Decimal = Decimal("0"),
-        # Discount fields
-        base_amount: Decimal = Decimal("0"),
-        coop_discount_fee: Decimal = Decimal("0"),
-        net_discount_value: Decimal = Decimal("0"),
-        # Coupon fields
-        gross_coupon_from_boz: Decimal = Decimal("0"),
-        withholding_tax: Decimal = Decimal("0"),
-        boz_fee: Decimal = Decimal("0"),
-        coop_fee_on_coupon: Decimal = Decimal("0"),
-        net_maturity_coupon: Decimal = Decimal("0"),
-        net_coupon_payment: Decimal = Decimal("0"),
-        calculation_period: str = ""
-    ):
-        self.member_id = member_id
-        self.member_code = member_code
-        self.member_name = member_name
-        self.bond_shares = bond_shares
-        self.percentage_share = percentage_share
-        self.member_face_value = member_face_value
-        self.boz_award_value = boz_award_value
-        self.base_amount = base_amount
-        self.coop_discount_fee = coop_discount_fee
-        self.net_discount_value = net_discount_value
-        self.gross_coupon_from_boz = gross_coupon_from_boz
-        self.withholding_tax = withholding_tax
-        self.boz_fee = boz_fee
-        self.coop_fee_on_coupon = coop_fee_on_coupon
-        self.net_maturity_coupon = net_maturity_coupon
-        self.net_coupon_payment = net_coupon_payment
-        self.calculation_period = calculation_period
+    member_id: int
+    member_code: str
+    member_name: str
+    bond_shares: Decimal
+    percentage_share: Decimal
+    member_face_value: Decimal
+    # BOZ Award fields
+    boz_award_value: Decimal = Decimal("0")
+    # Discount fields
+    base_amount: Decimal = Decimal("0")
+    coop_discount_fee: Decimal = Decimal("0")
+    net_discount_value: Decimal = Decimal("0")
+    # Coupon fields
+    gross_coupon_from_boz: Decimal = Decimal("0")
+    withholding_tax: Decimal = Decimal("0")
+    boz_fee: Decimal = Decimal("0")
+    coop_fee_on_coupon: Decimal = Decimal("0")
+    net_maturity_coupon: Decimal = Decimal("0")
+    net_coupon_payment: Decimal = Decimal("0")
+    calculation_period: str = ""
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for API responses."""
-        return {
+        result = {
             "member_id": self.member_id,
             "member_code": self.member_code,
-            "member_name": self.member_name,
-            "bond_shares": float(self.bond_shares),
-            "percentage_share": float(self.percentage_share),
-            "member_face_value": float(self.member_face_value),
-            "boz_award_value": float(self.boz_award_value),
-            "base_amount": float(self.base_amount),
-            "coop_discount_fee": float(self.coop_discount_fee),
-            "net_discount_value": float(self.net_discount_value),
-            "gross_coupon_from_boz": float(self.gross_coupon_from_boz),
-            "withholding_tax": float(self.withholding_tax),
-            "boz_fee": float(self.boz_fee),
-            "coop_fee_on_coupon": float(self.coop_fee_on_coupon),
-            "net_maturity_coupon": float(self.net_maturity_coupon),
-            "net_coupon_payment": float(self.net_coupon_payment),
-            "calculation_period": self.calculation_period
+            "member_name": self.member_name
         }
+        for name in _RESULT_DECIMAL_FIELDS:
+            result[name] = float(getattr(self, name))
+        result["calculation_period"] = self.calculation_period
+        return result
+
+
+# Decimal fields of PaymentCalculationResult, in declaration order
+_RESULT_DECIMAL_FIELDS = tuple(
+    field.name for field in fields(PaymentCalculationResult) if field.type is Decimal
+)
 
 
 class PaymentCalculatorService:
@@ -82,11 +162,6 @@ class PaymentCalculatorService:
     Implements the Excel logic for BOZ awards, discount values, and coupon payments.
     """
 
-    @staticmethod
-    def _round(value: Decimal) -> Decimal:
-        """Round to 2 decimal places."""
-        return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
     @staticmethod
     def calculate_payments_for_event(
         db: Session,
@@ -98,18 +173,26 @@ class PaymentCalculatorService:
 
         Returns a list of PaymentCalculationResult objects.
         """
-        # Get payment event
-        event = db.query(PaymentEvent).filter(PaymentEvent.id == event_id).first()
+        # Get payment event; Session.get reuses rows the caller already loaded in this session
+        event = db.get(PaymentEvent, event_id)
         if not event:
             raise ValueError(f"Payment event {event_id} not found")
 
         # Get bond issue
-        bond = db.query(BondIssue).filter(BondIssue.id == event.bond_id).first()
+        bond = db.get(BondIssue, event.bond_id)
         if not bond:
             raise ValueError(f"Bond issue {event.bond_id} not found")
 
         # Get all member holdings for this bond as of the payment date
-        holdings = db.query(MemberBondHolding, User).join(
+        # Plain column rows: only six fields are used, so skip building ORM entities
+        holdings = db.query(
+            MemberBondHolding.bond_shares,
+            MemberBondHolding.member_face_value,
+            User.user_id,
+            User.username,
+            User.first_name,
+            User.last_name
+        ).join(
             User, User.user_id == MemberBondHolding.member_id
         ).filter(
             MemberBondHolding.bond_id == event.bond_id,
@@ -120,7 +203,7 @@ class PaymentCalculatorService:
             return []
 
         # Calculate total shares for percentage calculation
-        total_shares = sum(Decimal(str(h.MemberBondHolding.bond_shares)) for h in holdings)
+        total_shares = sum(Decimal(str(row.bond_shares)) for row in holdings)
 
         if total_shares == 0:
             return []
@@ -133,99 +216,195 @@ class PaymentCalculatorService:
         # BOZ award amount (total to distribute)
         total_boz_award = Decimal(str(event.boz_award_amount or 0))
 
-        results = []
+        # Per-event coupon rates are the same for every member, so resolve them once
+        effective_rate = Decimal(str(event.base_rate or bond.discount_rate))
+        # Semi-annual coupon rate (annual rate / 2)
+        coupon_rate_period = Decimal(str(event.base_rate or bond.coupon_rate)) / Decimal("2")
+
+        if len(holdings) >= VECTORIZE_THRESHOLD:
+            results = PaymentCalculatorService._calculate_payments_vectorized(
+                event, holdings, total_boz_award, effective_rate, coupon_rate_period,
+                wht_rate, boz_fee_rate, coop_fee_rate
+            )
+            if results is not None:
+                return results
+
+        return PaymentCalculatorService._calculate_payments_decimal(
+            event, holdings, total_shares, total_boz_award, effective_rate, coupon_rate_period,
+            wht_rate, boz_fee_rate, coop_fee_rate
+        )
 
-        for holding, user in holdings:
-            member_shares = Decimal(str(holding.bond_shares))
-            member_face_value = Decimal(str(holding.member_face_value))
+    @staticmethod
+    def _calculate_payments_decimal(
+        event: PaymentEvent,
+        holdings: list,
+        total_shares: Decimal,
+        total_boz_award: Decimal,
+        effective_rate: Decimal,
+        coupon_rate_period: Decimal,
+        wht_rate: Decimal,
+        boz_fee_rate: Decimal,
+        coop_fee_rate: Decimal
+    ) -> List[PaymentCalculationResult]:
+        """Calculate member payments one member at a time with Decimal arithmetic."""
+        # The event type is the same for every member, so pick its calculation once
+        calculate_amounts = _EVENT_AMOUNT_CALCULATORS.get(event.event_type, _no_event_amounts)
+        rates = (effective_rate, coupon_rate_period, wht_rate, boz_fee_rate, coop_fee_rate)
+        cent = _CENT
+        hundred = Decimal("100")
+        calculation_period = event.calculation_period or ""
+
+        results = []
 
-            # Calculate percentage share
-            percentage_share = PaymentCalculatorService._round(
-                (member_shares / total_shares) * Decimal("100")
-            ) if total_shares > 0 else Decimal("0")
+        for row in holdings:
+            member_shares = Decimal(str(row.bond_shares))
+            member_face_value = Decimal(str(row.member_face_value))
 
-            # Calculate BOZ award allocation
-            boz_award_value = PaymentCalculatorService._round(
-                (member_shares / total_shares) * total_boz_award
-            ) if total_shares > 0 else Decimal("0")
+            # Multiply before dividing so the only rounding is the final one to the cent,
+            # as in the integer path; dividing first would round the ratio to 28 digits
+            percentage_share = (member_shares * hundred / total_shares).quantize(cent, rounding=ROUND_HALF_UP)
+            boz_award_value = (member_shares * total_boz_award / total_shares).quantize(cent, rounding=ROUND_HALF_UP)
 
-            result = PaymentCalculationResult(
-                member_id=user.user_id,
-                member_code=user.username,
-                member_name=f"{user.first_name} {user.last_name}",
+            results.append(PaymentCalculationResult(
+                member_id=row.user_id,
+                member_code=row.username,
+                member_name=f"{row.first_name} {row.last_name}",
                 bond_shares=member_shares,
                 percentage_share=percentage_share,
                 member_face_value=member_face_value,
                 boz_award_value=boz_award_value,
-                calculation_period=event.calculation_period or ""
+                calculation_period=calculation_period,
+                **calculate_amounts(member_face_value, boz_award_value, rates)
+            ))
+
+        return results
+
+    @staticmethod
+    def _scaled_int(value: Decimal, places: int) -> Optional[int]:
+        """Return value * 10**places as an int, or None if digits would be lost."""
+        scaled = value.scaleb(places)
+        if scaled != scaled.to_integral_value():
+            return None
+        return int(scaled)
+
+    @staticmethod
+    def _div_round_half_up(numerator: np.ndarray, denominator: int) -> np.ndarray:
+        """Integer division rounding halves away from zero, like Decimal ROUND_HALF_UP."""
+        quotient = (np.abs(numerator) * 2 + denominator) // (2 * denominator)
+        return np.where(numerator < 0, -quotient, quotient)
+
+    @staticmethod
+    def _calculate_payments_vectorized(
+        event: PaymentEvent,
+        holdings: list,
+        total_boz_award: Decimal,
+        effective_rate: Decimal,
+        coupon_rate_period: Decimal,
+        wht_rate: Decimal,
+        boz_fee_rate: Decimal,
+        coop_fee_rate: Decimal
+    ) -> Optional[List[PaymentCalculationResult]]:
+        """
+        Calculate member payments on int64 cent arrays for large events.
+        Each amount is rounded half-up to the cent at the same step as the Decimal loop,
+        so results match it exactly. Returns None (use the Decimal loop) if an input has
+        more decimal places than its column or a product could overflow int64.
+        """
+        scaled_int = PaymentCalculatorService._scaled_int
+        div_round = PaymentCalculatorService._div_round_half_up
+
+        member_shares = [Decimal(str(row.bond_shares)) for row in holdings]
+        member_face_values = [Decimal(str(row.member_face_value)) for row in holdings]
+
+        shares_cents = [scaled_int(value, 2) for value in member_shares]
+        face_cents = [scaled_int(value, 2) for value in member_face_values]
+        award_cents = scaled_int(total_boz_award, 2)
+        # Fee rates are percentages with 2 places, i.e. 4 places once divided by 100
+        rates = [scaled_int(rate, 4) for rate in (wht_rate, boz_fee_rate, coop_fee_rate)]
+        effective_micros = scaled_int(effective_rate, 6)
+        coupon_period_scaled = scaled_int(coupon_rate_period, 7)
+
+        scalars = [award_cents, effective_micros, coupon_period_scaled] + rates
+        if None in shares_cents or None in face_cents or None in scalars:
+            return None
+
+        max_shares = max(abs(value) for value in shares_cents)
+        max_amount = max(max(abs(value) for value in face_cents), abs(award_cents)) * 2
+        products = [
+            max_shares * 10000,
+            max_shares * abs(award_cents),
+            max_amount * abs(effective_micros),
+            max_amount * abs(coupon_period_scaled),
+            # Gross coupons are at most 100x the face value (rates are NUMERIC(8, 6))
+            max_amount * 100 * max(abs(rate) for rate in rates)
+        ]
+        if max(products) * 2 >= _INT64_PRODUCT_LIMIT:
+            return None
+
+        wht_bp, boz_fee_bp, coop_fee_bp = rates
+        shares = np.array(shares_cents, dtype=np.int64)
+        face = np.array(face_cents, dtype=np.int64)
+        total_shares = int(shares.sum())
+
+        # Percentage share in hundredths of a percent, BOZ award in cents
+        percentage = div_round(shares * 10000, total_shares)
+        boz_award = div_round(shares * award_cents, total_shares)
+
+        # Fields the event type does not use keep the result's zero defaults
+        columns = {"boz_award_value": boz_award}
+
+        if event.event_type == EventType.DISCOUNT_MATURITY:
+            discount = face - boz_award
+            coop_discount_fee = div_round(discount * coop_fee_bp, 10000)
+            gross = div_round(face * effective_micros, 10 ** 6)
+            wht = div_round(gross * wht_bp, 10000)
+            boz_fee = div_round(gross * boz_fee_bp, 10000)
+            columns.update(
+                base_amount=discount,
+                coop_discount_fee=coop_discount_fee,
+                net_discount_value=discount - coop_discount_fee,
+                gross_coupon_from_boz=gross,
+                withholding_tax=wht,
+                boz_fee=boz_fee,
+                net_maturity_coupon=gross - wht - boz_fee
+            )
+
+        elif event.event_type == EventType.COUPON_SEMI_ANNUAL:
+            base = div_round(face * coupon_period_scaled, 10 ** 7)
+            wht = div_round(base * wht_bp, 10000)
+            boz_fee = div_round(base * boz_fee_bp, 10000)
+            coop_fee = div_round(base * coop_fee_bp, 10000)
+            columns.update(
+                base_amount=base,
+                gross_coupon_from_boz=base,
+                withholding_tax=wht,
+                boz_fee=boz_fee,
+                coop_fee_on_coupon=coop_fee,
+                net_coupon_payment=base - wht - boz_fee - coop_fee
             )
 
-            # Calculate based on event type
-            if event.event_type == EventType.DISCOUNT_MATURITY:
-                # Discount Value = Face Value - BOZ Award Value
-                discount_value = member_face_value - boz_award_value
-                result.base_amount = PaymentCalculatorService._round(discount_value)
-
-                # Co-op discount fee = Discount Value * coop_fee_rate
-                result.coop_discount_fee = PaymentCalculatorService._round(
-                    discount_value * coop_fee_rate
-                )
-
-                # Net discount value = Discount Value - coop_discount_fee
-                result.net_discount_value = PaymentCalculatorService._round(
-                    discount_value - result.coop_discount_fee
-                )
-
-                # Maturity Coupon calculation
-                effective_rate = Decimal(str(event.base_rate or bond.discount_rate))
-                gross_coupon = PaymentCalculatorService._round(
-                    member_face_value * effective_rate
-                )
-                result.gross_coupon_from_boz = gross_coupon
-
-                result.withholding_tax = PaymentCalculatorService._round(
-                    gross_coupon * wht_rate
-                )
-                result.boz_fee = PaymentCalculatorService._round(
-                    gross_coupon * boz_fee_rate
-                )
-                result.net_maturity_coupon = PaymentCalculatorService._round(
-                    gross_coupon - result.withholding_tax - result.boz_fee
-                )
-
-            elif event.event_type == EventType.COUPON_SEMI_ANNUAL:
-                # Semi-annual coupon rate (annual rate / 2)
-                annual_rate = Decimal(str(event.base_rate or bond.coupon_rate))
-                coupon_rate_period = annual_rate / Decimal("2")
-
-                # Base amount = member_face_value * coupon_rate_period
-                base_amount = PaymentCalculatorService._round(
-                    member_face_value * coupon_rate_period
-                )
-                result.base_amount = base_amount
-                result.gross_coupon_from_boz = base_amount
-
-                # Withholding tax
-                result.withholding_tax = PaymentCalculatorService._round(
-                    base_amount * wht_rate
-                )
-
-                # BOZ fee
-                result.boz_fee = PaymentCalculatorService._round(
-                    base_amount * boz_fee_rate
-                )
-
-                # Co-op fee on coupon
-                result.coop_fee_on_coupon = PaymentCalculatorService._round(
-                    base_amount * coop_fee_rate
-                )
-
-                # Net coupon payment
-                result.net_coupon_payment = PaymentCalculatorService._round(
-                    base_amount - result.withholding_tax - result.boz_fee - result.coop_fee_on_coupon
-                )
-
-            results.append(result)
+        # Back to 2-place Decimals only once, at the end; int * 0.01 is exact and
+        # cheaper than scaleb
+        cent = _CENT
+        names = list(columns)
+        amount_columns = [[Decimal(value) * cent for value in column.tolist()] for column in columns.values()]
+        percentages = [Decimal(value) * cent for value in percentage.tolist()]
+        calculation_period = event.calculation_period or ""
+
+        results = []
+        for row, bond_shares, face_value, percentage_share, amounts in zip(
+            holdings, member_shares, member_face_values, percentages, zip(*amount_columns)
+        ):
+            results.append(PaymentCalculationResult(
+                member_id=row.user_id,
+                member_code=row.username,
+                member_name=f"{row.first_name} {row.last_name}",
+                bond_shares=bond_shares,
+                percentage_share=percentage_share,
+                member_face_value=face_value,
+                calculation_period=calculation_period,
+                **dict(zip(names, amounts))
+            ))
 
         return results
 
@@ -238,36 +417,81 @@ class PaymentCalculatorService:
         Generate and save member payment records for an event.
         Returns the number of payment records created.
         """
+        count = PaymentCalculatorService._write_payments_for_event(db, event_id)
+        db.commit()
+        return count
+
+    @staticmethod
+    def _write_payments_for_event(
+        db: Session,
+        event_id: int
+    ) -> int:
+        """
+        Calculate and insert member payment records for an event without committing.
+        Returns the number of payment records written.
+        """
         # Calculate payments
         calculations = PaymentCalculatorService.calculate_payments_for_event(db, event_id)
 
-        # Get event and bond
-        event = db.query(PaymentEvent).filter(PaymentEvent.id == event_id).first()
+        # Already in the session's identity map from the calculation above
+        event = db.get(PaymentEvent, event_id)
+
+        if len(calculations) > COPY_THRESHOLD:
+            PaymentCalculatorService._copy_member_payments(db, event, calculations)
+            return len(calculations)
+
+        # Insert as plain rows so SQLAlchemy batches them into multi-row INSERT statements
+        rows = [
+            {
+                "member_id": calc.member_id,
+                "bond_id": event.bond_id,
+                "payment_event_id": event_id,
+                **{field: getattr(calc, field) for field in MEMBER_PAYMENT_AMOUNT_FIELDS},
+                "calculation_period": calc.calculation_period
+            }
+            for calc in calculations
+        ]
+        for chunk_start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            db.execute(insert(MemberPayment), rows[chunk_start:chunk_start + INSERT_CHUNK_SIZE])
+
+        return len(rows)
 
-        # Create MemberPayment records
-        count = 0
+    @staticmethod
+    def _copy_member_payments(
+        db: Session,
+        event: PaymentEvent,
+        calculations: List[PaymentCalculationResult]
+    ) -> None:
+        """
+        Bulk-load member payments with COPY FROM STDIN for large events.
+        Runs inside the session's transaction; the caller commits.
+        """
+        money = MoneyCents()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
         for calc in calculations:
-            payment = MemberPayment(
-                member_id=calc.member_id,
-                bond_id=event.bond_id,
-                payment_event_id=event_id,
-                boz_award_value=calc.boz_award_value,
-                base_amount=calc.base_amount,
-                coop_discount_fee=calc.coop_discount_fee,
-                net_discount_value=calc.net_discount_value,
-                gross_coupon_from_boz=calc.gross_coupon_from_boz,
-                withholding_tax=calc.withholding_tax,
-                boz_fee=calc.boz_fee,
-                coop_fee_on_coupon=calc.coop_fee_on_coupon,
-                net_maturity_coupon=calc.net_maturity_coupon,
-                net_coupon_payment=calc.net_coupon_payment,
-                calculation_period=calc.calculation_period
+            writer.writerow(
+                [calc.member_id, event.bond_id, event.id] +
+                [money.process_bind_param(getattr(calc, field), None) for field in MEMBER_PAYMENT_AMOUNT_FIELDS] +
+                [calc.calculation_period]
             )
-            db.add(payment)
-            count += 1
+        buffer.seek(0)
 
-        db.commit()
-        return count
+        columns = ", ".join(
+            ("member_id", "bond_id", "payment_event_id") + MEMBER_PAYMENT_AMOUNT_FIELDS + ("calculation_period",)
+        )
+
+        # Payments can be regenerated from the event, so a lost commit on crash is acceptable
+        db.execute(text("SET LOCAL synchronous_commit = OFF"))
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY member_payments ({columns}) FROM STDIN "
+                f"WITH (FORMAT csv, FORCE_NOT_NULL (calculation_period))",
+                buffer
+            )
+        finally:
+            cursor.close()
 
     @staticmethod
     def recalculate_payments_for_event(
@@ -278,77 +502,98 @@ class PaymentCalculatorService:
         Delete existing payments and regenerate them for an event.
         Returns the number of payment records created.
         """
-        # Delete existing payments
+        # Delete existing payments; nothing in the session needs the old rows
         db.query(MemberPayment).filter(
             MemberPayment.payment_event_id == event_id
-        ).delete()
+        ).delete(synchronize_session=False)
+
+        # Regenerate in the same transaction so the event is never left without payments
+        count = PaymentCalculatorService._write_payments_for_event(db, event_id)
         db.commit()
+        return count
+
+    @staticmethod
+    def recalculate_all(
+        db_factory: Callable[[], Session],
+        event_ids: List[int],
+        max_workers: Optional[int] = None
+    ) -> Dict[int, int]:
+        """
+        Recalculate several events in parallel, one thread and one session per event.
+        Each event commits independently. Returns the payment count per event id;
+        the first failure is re-raised once every event has finished.
+        """
+        if max_workers is None:
+            # Leave a couple of pooled connections for request handlers
+            max_workers = max(1, settings.DB_POOL_SIZE - 2)
+
+        def recalculate(event_id: int) -> int:
+            db = db_factory()
+            try:
+                return PaymentCalculatorService.recalculate_payments_for_event(db, event_id)
+            finally:
+                db.close()
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(event_ids) or 1)) as executor:
+            futures = {event_id: executor.submit(recalculate, event_id) for event_id in event_ids}
 
-        # Regenerate
-        return PaymentCalculatorService.generate_payments_for_event(db, event_id)
+        return {event_id: future.result() for event_id, future in futures.items()}
 
     @staticmethod
     def get_member_payments(
         db: Session,
         member_id: int,
         bond_id: Optional[int] = None
-    ) -> List[Dict]:
+    ) -> Iterator[Dict]:
         """
         Get all payments for a specific member, optionally filtered by bond.
-        Returns payment records with event and bond details.
+        Yields payment records with event and bond details, fetching rows in batches.
         """
-        query = db.query(MemberPayment, PaymentEvent, BondIssue, User).join(
+        # One holding per bond (the earliest recorded) so the join does not multiply payment rows
+        holding_ids = select(func.min(MemberBondHolding.id)).where(
+            MemberBondHolding.member_id == member_id
+        ).group_by(MemberBondHolding.bond_id)
+
+        query = db.query(MemberPayment, PaymentEvent, BondIssue, User, MemberBondHolding).join(
             PaymentEvent, PaymentEvent.id == MemberPayment.payment_event_id
         ).join(
             BondIssue, BondIssue.id == MemberPayment.bond_id
         ).join(
             User, User.user_id == MemberPayment.member_id
+        ).outerjoin(
+            MemberBondHolding, and_(
+                MemberBondHolding.bond_id == MemberPayment.bond_id,
+                MemberBondHolding.id.in_(holding_ids)
+            )
         ).filter(
             MemberPayment.member_id == member_id
-        )
+        ).options(*_report_load_options())
 
         if bond_id:
             query = query.filter(MemberPayment.bond_id == bond_id)
 
-        results = query.order_by(PaymentEvent.payment_date.desc()).all()
+        rows = query.order_by(PaymentEvent.payment_date.desc()).yield_per(200)
 
-        payments = []
-        for payment, event, bond, user in results:
-            # Get member's bond holding for shares and face value
-            holding = db.query(MemberBondHolding).filter(
-                MemberBondHolding.member_id == member_id,
-                MemberBondHolding.bond_id == payment.bond_id
-            ).first()
-
-            bond_shares = float(holding.bond_shares) if holding else 0
-            member_face_value = float(holding.member_face_value) if holding else 0
-
-            payments.append({
+        for payment, event, bond, user, holding in rows:
+            record = {
                 "payment_id": payment.id,
                 "member_id": payment.member_id,
                 "member_name": f"{user.first_name} {user.last_name}",
                 "bond_id": payment.bond_id,
                 "bond_name": bond.issue_name,
-                "bond_shares": bond_shares,
-                "member_face_value": member_face_value,
+                "bond_shares": float(holding.bond_shares) if holding else 0,
+                "member_face_value": float(holding.member_face_value) if holding else 0,
                 "event_id": payment.payment_event_id,
                 "event_name": event.event_name,
                 "event_type": event.event_type.value,
-                "payment_date": event.payment_date.isoformat(),
-                "boz_award_value": float(payment.boz_award_value or 0),
-                "base_amount": float(payment.base_amount or 0),
-                "coop_discount_fee": float(payment.coop_discount_fee or 0),
-                "net_discount_value": float(payment.net_discount_value or 0),
-                "gross_coupon_from_boz": float(payment.gross_coupon_from_boz or 0),
-                "withholding_tax": float(payment.withholding_tax or 0),
-                "boz_fee": float(payment.boz_fee or 0),
-                "coop_fee_on_coupon": float(payment.coop_fee_on_coupon or 0),
-                "net_maturity_coupon": float(payment.net_maturity_coupon or 0),
-                "net_coupon_payment": float(payment.net_coupon_payment or 0),
-                "calculation_period": payment.calculation_period or ""
-            })
+                "payment_date": event.payment_date.isoformat()
+            }
+            for field in MEMBER_PAYMENT_AMOUNT_FIELDS:
+                value = getattr(payment, field)
+                record[field] = float(value) if value is not None else 0.0
+            record["calculation_period"] = payment.calculation_period or ""
 
-        return payments
+            yield record
 
     @staticmethod
     def get_audit_report(db: Session) -> List[Dict]:
@@ -358,23 +603,30 @@ class PaymentCalculatorService:
         """
         events = db.query(PaymentEvent, BondIssue).join(
             BondIssue, BondIssue.id == PaymentEvent.bond_id
-        ).all()
+        ).options(*_report_load_options()).all()
 
-        report = []
-        for event, bond in events:
-            # Aggregate calculated totals
-            totals = db.query(
+        # Aggregate calculated totals for every event in one grouped query
+        totals_by_event = {
+            row.payment_event_id: row
+            for row in db.query(
+                MemberPayment.payment_event_id,
                 func.sum(MemberPayment.net_maturity_coupon).label('total_net_maturity'),
                 func.sum(MemberPayment.net_coupon_payment).label('total_net_coupon')
-            ).filter(
-                MemberPayment.payment_event_id == event.id
-            ).first()
+            ).group_by(MemberPayment.payment_event_id)
+        }
+
+        # Money columns and their sums already load as Decimals, so only NULLs need replacing
+        zero = Decimal("0")
+
+        report = []
+        for event, bond in events:
+            totals = totals_by_event.get(event.id)
 
-            total_net_maturity = Decimal(str(totals.total_net_maturity or 0))
-            total_net_coupon = Decimal(str(totals.total_net_coupon or 0))
+            total_net_maturity = (totals.total_net_maturity if totals else None) or zero
+            total_net_coupon = (totals.total_net_coupon if totals else None) or zero
 
-            expected_net_maturity = Decimal(str(event.expected_total_net_maturity or 0))
-            expected_net_coupon = Decimal(str(event.expected_total_net_coupon or 0))
+            expected_net_maturity = event.expected_total_net_maturity or zero
+            expected_net_coupon = event.expected_total_net_coupon or zero
 
             # Calculate differences
             maturity_diff = total_net_maturity - expected_net_maturity
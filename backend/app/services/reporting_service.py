@@ -2,15 +2,76 @@
 Reporting Service for generating monthly summaries and reports.
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import Date, Numeric, and_, bindparam, cast, func, literal, or_, select, text, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Dict, List
 
-from app.models.bond import BondPurchase, BondType
+from app.models.bond import BondPurchase, BondType, PurchaseStatus
 from app.models.payment import CouponPayment
 from app.models.balance import MemberBalance, MonthlySummary
-from app.models.user import User
+
+
+def _next_month(month: date) -> date:
+    """First day of the month after `month` (which must be a first day)."""
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+# Purchase fields listed in a member portfolio
+PORTFOLIO_PURCHASE_COLUMNS = (
+    BondPurchase.purchase_id,
+    BondPurchase.bond_type_id,
+    BondPurchase.purchase_date,
+    BondPurchase.maturity_date,
+    BondPurchase.bond_shares,
+    BondPurchase.face_value,
+    BondPurchase.purchase_price,
+    BondPurchase.transaction_reference
+)
+
+# Monthly summary statements are built once; only :month / :next_month change per
+# call, so SQLAlchemy's compiled cache reuses the same compiled SQL every time.
+
+# Active holding totals, active members, this month's purchases and bonds matured
+# this month in one scan of bond_purchases
+_is_active = BondPurchase.purchase_status == PurchaseStatus.ACTIVE
+_purchased_this_month = and_(
+    BondPurchase.purchase_date >= bindparam('month'),
+    BondPurchase.purchase_date < bindparam('next_month')
+)
+_purchase_totals = select(
+    func.sum(BondPurchase.bond_shares).filter(_is_active).label('total_shares'),
+    func.sum(BondPurchase.face_value).filter(_is_active).label('total_face_value'),
+    func.count(BondPurchase.purchase_id).filter(_is_active).label('active_count'),
+    func.count(func.distinct(BondPurchase.user_id)).filter(_is_active).label('active_members'),
+    func.sum(BondPurchase.purchase_price).filter(_purchased_this_month).label('total_purchases'),
+    func.sum(BondPurchase.coop_discount_fee).filter(_purchased_this_month).label('coop_discount_fees'),
+    func.count(BondPurchase.purchase_id).filter(_purchased_this_month).label('new_purchases'),
+    func.count(BondPurchase.purchase_id).filter(
+        BondPurchase.maturity_date >= bindparam('month'),
+        BondPurchase.maturity_date < bindparam('next_month'),
+        BondPurchase.purchase_status == PurchaseStatus.MATURED
+    ).label('matured_count')
+).subquery('purchase_totals')
+
+# This month's coupon payment totals; the payment_date range uses its index
+_payment_totals = select(
+    func.sum(CouponPayment.gross_coupon_amount).label('total_gross'),
+    func.sum(CouponPayment.withholding_tax).label('total_wht'),
+    func.sum(CouponPayment.boz_fees).label('total_boz'),
+    func.sum(CouponPayment.coop_fees).label('total_coop_fees'),
+    func.sum(CouponPayment.net_payment_amount).label('total_net')
+).where(
+    CouponPayment.payment_date >= bindparam('month'),
+    CouponPayment.payment_date < bindparam('next_month')
+).subquery('payment_totals')
+
+# Both single-row aggregates read from the base tables in one round trip, so the
+# summary is always current without refreshing the monthly views
+_SUMMARY_TOTALS_STMT = select(_purchase_totals, _payment_totals).select_from(
+    _purchase_totals.join(_payment_totals, true())
+)
 
 
 class ReportingService:
@@ -32,89 +93,75 @@ class ReportingService:
         # Ensure month is first day
         month = date(month.year, month.month, 1)
 
-        # Calculate totals from active bond purchases
-        bond_totals = db.query(
-            func.sum(BondPurchase.bond_shares).label('total_shares'),
-            func.sum(BondPurchase.face_value).label('total_face_value'),
-            func.count(BondPurchase.purchase_id).label('active_count')
-        ).filter(
-            BondPurchase.purchase_status == "active"
-        ).first()
-
-        # Calculate purchases in this month
-        purchases_totals = db.query(
-            func.sum(BondPurchase.purchase_price).label('total_purchases'),
-            func.sum(BondPurchase.coop_discount_fee).label('coop_discount_fees'),
-            func.count(BondPurchase.purchase_id).label('new_purchases')
-        ).filter(
-            func.date_trunc('month', BondPurchase.purchase_date) == month
-        ).first()
-
-        # Calculate payment totals for this month
-        payment_totals = db.query(
-            func.sum(CouponPayment.gross_coupon_amount).label('total_gross'),
-            func.sum(CouponPayment.withholding_tax).label('total_wht'),
-            func.sum(CouponPayment.boz_fees).label('total_boz'),
-            func.sum(CouponPayment.coop_fees).label('total_coop_fees'),
-            func.sum(CouponPayment.net_payment_amount).label('total_net')
-        ).filter(
-            func.date_trunc('month', CouponPayment.payment_date) == month
-        ).first()
-
-        # Count matured bonds this month
-        matured_count = db.query(func.count(BondPurchase.purchase_id)).filter(
-            func.date_trunc('month', BondPurchase.maturity_date) == month,
-            BondPurchase.purchase_status == "matured"
-        ).scalar() or 0
-
-        # Count active members
-        active_members = db.query(func.count(func.distinct(BondPurchase.user_id))).filter(
-            BondPurchase.purchase_status == "active"
-        ).scalar() or 0
+        totals = db.execute(
+            _SUMMARY_TOTALS_STMT, {"month": month, "next_month": _next_month(month)}
+        ).one()
 
         # Calculate net cooperative income (discount fees + coupon fees)
         net_coop_income = (
-            (purchases_totals.coop_discount_fees or Decimal("0")) +
-            (payment_totals.total_coop_fees or Decimal("0"))
+            (totals.coop_discount_fees or Decimal("0")) +
+            (totals.total_coop_fees or Decimal("0"))
         )
 
-        # Create summary
-        summary = MonthlySummary(
-            summary_month=month,
-            total_bond_shares=bond_totals.total_shares or Decimal("0"),
-            total_face_value=bond_totals.total_face_value or Decimal("0"),
-            total_purchases=purchases_totals.total_purchases or Decimal("0"),
-            total_gross_coupons=payment_totals.total_gross or Decimal("0"),
-            total_withholding_tax=payment_totals.total_wht or Decimal("0"),
-            total_boz_fees=payment_totals.total_boz or Decimal("0"),
-            total_coop_fees=payment_totals.total_coop_fees or Decimal("0"),
-            total_net_payments=payment_totals.total_net or Decimal("0"),
-            net_cooperative_income=net_coop_income,
-            active_members_count=active_members,
-            new_purchases_count=purchases_totals.new_purchases or 0,
-            matured_bonds_count=matured_count,
-            generated_by=generated_by
-        )
+        values = {
+            "total_bond_shares": totals.total_shares or Decimal("0"),
+            "total_face_value": totals.total_face_value or Decimal("0"),
+            "total_purchases": totals.total_purchases or Decimal("0"),
+            "total_gross_coupons": totals.total_gross or Decimal("0"),
+            "total_withholding_tax": totals.total_wht or Decimal("0"),
+            "total_boz_fees": totals.total_boz or Decimal("0"),
+            "total_coop_fees": totals.total_coop_fees or Decimal("0"),
+            "total_net_payments": totals.total_net or Decimal("0"),
+            "net_cooperative_income": net_coop_income,
+            "active_members_count": totals.active_members or 0,
+            "new_purchases_count": totals.new_purchases or 0,
+            "matured_bonds_count": totals.matured_count or 0,
+            "generated_by": generated_by
+        }
+
+        # Create or overwrite this month's summary in one statement (summary_month is unique)
+        stmt = pg_insert(MonthlySummary).values(summary_month=month, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['summary_month'],
+            set_={key: stmt.excluded[key] for key in values}
+        ).returning(MonthlySummary)
+        summary = db.scalars(stmt, execution_options={"populate_existing": True}).one()
 
-        # Check if summary already exists
-        existing = db.query(MonthlySummary).filter(
-            MonthlySummary.summary_month == month
-        ).first()
-
-        if existing:
-            # Update existing
-            for key, value in summary.__dict__.items():
-                if not key.startswith('_') and key != 'summary_id':
-                    setattr(existing, key, value)
-            db.commit()
-            db.refresh(existing)
-            return existing
-        else:
-            # Create new
-            db.add(summary)
-            db.commit()
-            db.refresh(summary)
-            return summary
+        db.commit()
+        return summary
+
+    @staticmethod
+    def refresh_monthly_summary_view(db: Session) -> None:
+        """
+        Refresh the monthly payment and purchase views (monthly_summary_mv,
+        monthly_purchases_mv). Runs nightly from Celery beat and after bulk
+        payment runs and purchase imports.
+        """
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY monthly_summary_mv"))
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY monthly_purchases_mv"))
+        db.commit()
+
+    @staticmethod
+    def get_user_payment_totals(db: Session, month: date) -> Dict[int, Decimal]:
+        """
+        Get net coupon payments received per user for a month, aggregated in one query.
+
+        Returns:
+            Dictionary of user_id -> total net payment amount
+        """
+        month = date(month.year, month.month, 1)
+        next_month = _next_month(month)
+
+        # Plain range on payment_date so ix_coupon_payments_payment_date can be used
+        rows = db.query(
+            CouponPayment.user_id,
+            func.sum(CouponPayment.net_payment_amount).label('net')
+        ).filter(
+            CouponPayment.payment_date >= month,
+            CouponPayment.payment_date < next_month
+        ).group_by(CouponPayment.user_id).all()
+
+        return {row.user_id: row.net for row in rows}
 
     @staticmethod
     def generate_member_balances(db: Session, month: date) -> List[MemberBalance]:
@@ -130,143 +177,164 @@ class ReportingService:
         """
         # Ensure month is first day
         month = date(month.year, month.month, 1)
+        next_month = _next_month(month)
+
+        # Active holdings per (member, bond type) with each one's share of the cooperative
+        # total, computed in one pass with a window over the grouped sums
+        face_value_sum = func.sum(BondPurchase.face_value)
+        holdings = select(
+            BondPurchase.user_id,
+            BondPurchase.bond_type_id,
+            func.sum(BondPurchase.bond_shares).label('shares'),
+            face_value_sum.label('face_value'),
+            (
+                face_value_sum * 100
+                / func.nullif(func.sum(face_value_sum).over(partition_by=BondPurchase.bond_type_id), 0)
+            ).label('percentage_share')
+        ).where(
+            BondPurchase.purchase_status == PurchaseStatus.ACTIVE
+        ).group_by(BondPurchase.user_id, BondPurchase.bond_type_id).cte('holdings')
+
+        # Members with active bonds
+        members = select(holdings.c.user_id).distinct().cte('members')
+
+        # Plain ranges on the date columns so their btree indexes can be used
+        purchases = select(
+            BondPurchase.user_id,
+            BondPurchase.bond_type_id,
+            func.sum(BondPurchase.purchase_price).label('total')
+        ).where(
+            BondPurchase.purchase_date >= month,
+            BondPurchase.purchase_date < next_month
+        ).group_by(BondPurchase.user_id, BondPurchase.bond_type_id).cte('purchases')
+
+        # net_payment_amount is stored in cents
+        payments = select(
+            CouponPayment.user_id,
+            (cast(func.sum(CouponPayment.net_payment_amount), Numeric(15, 2)) / 100).label('net')
+        ).where(
+            CouponPayment.payment_date >= month,
+            CouponPayment.payment_date < next_month
+        ).group_by(CouponPayment.user_id).cte('payments')
+
+        # Latest balance before this month for every (member, bond type)
+        ranked_balances = select(
+            MemberBalance.user_id,
+            MemberBalance.bond_type_id,
+            MemberBalance.closing_balance,
+            func.row_number().over(
+                partition_by=(MemberBalance.user_id, MemberBalance.bond_type_id),
+                order_by=MemberBalance.balance_date.desc()
+            ).label('rn')
+        ).where(MemberBalance.balance_date < month).subquery()
+        previous = select(ranked_balances).where(ranked_balances.c.rn == 1).cte('previous')
+
+        opening_balance = func.coalesce(previous.c.closing_balance, 0)
+        purchases_month = func.coalesce(purchases.c.total, 0)
+        total_shares = func.coalesce(holdings.c.shares, 0)
+
+        # One row per member with active bonds and active bond type, skipping pairs
+        # with neither holdings nor purchases this month
+        snapshot = select(
+            members.c.user_id,
+            BondType.bond_type_id,
+            literal(month, Date),
+            opening_balance,
+            purchases_month,
+            func.coalesce(payments.c.net, 0),
+            opening_balance + purchases_month,
+            total_shares,
+            func.coalesce(holdings.c.face_value, 0),
+            func.coalesce(holdings.c.percentage_share, 0)
+        ).select_from(
+            members.join(BondType, BondType.is_active == True)
+            .outerjoin(holdings, and_(
+                holdings.c.user_id == members.c.user_id,
+                holdings.c.bond_type_id == BondType.bond_type_id
+            ))
+            .outerjoin(purchases, and_(
+                purchases.c.user_id == members.c.user_id,
+                purchases.c.bond_type_id == BondType.bond_type_id
+            ))
+            .outerjoin(previous, and_(
+                previous.c.user_id == members.c.user_id,
+                previous.c.bond_type_id == BondType.bond_type_id
+            ))
+            .outerjoin(payments, payments.c.user_id == members.c.user_id)
+        ).where(
+            or_(total_shares != 0, purchases_month != 0)
+        )
 
-        # Get all users with active bonds
-        users_with_bonds = db.query(User.user_id).join(
-            BondPurchase, User.user_id == BondPurchase.user_id
-        ).filter(BondPurchase.purchase_status == "active").distinct().all()
-
-        # Get all bond types
-        bond_types = db.query(BondType).filter(BondType.is_active == True).all()
-
-        balances = []
-
-        for user_id_tuple in users_with_bonds:
-            user_id = user_id_tuple[0]
-
-            for bond_type in bond_types:
-                # Get previous month balance
-                previous_balance = db.query(MemberBalance).filter(
-                    MemberBalance.user_id == user_id,
-                    MemberBalance.bond_type_id == bond_type.bond_type_id,
-                    MemberBalance.balance_date < month
-                ).order_by(MemberBalance.balance_date.desc()).first()
-
-                opening_balance = previous_balance.closing_balance if previous_balance else Decimal("0")
-
-                # Calculate purchases this month
-                purchases_month = db.query(
-                    func.sum(BondPurchase.purchase_price)
-                ).filter(
-                    BondPurchase.user_id == user_id,
-                    BondPurchase.bond_type_id == bond_type.bond_type_id,
-                    func.date_trunc('month', BondPurchase.purchase_date) == month
-                ).scalar() or Decimal("0")
-
-                # Calculate payments received this month
-                payments_received = db.query(
-                    func.sum(CouponPayment.net_payment_amount)
-                ).filter(
-                    CouponPayment.user_id == user_id,
-                    func.date_trunc('month', CouponPayment.payment_date) == month
-                ).scalar() or Decimal("0")
-
-                # Get current totals
-                current_totals = db.query(
-                    func.sum(BondPurchase.bond_shares).label('shares'),
-                    func.sum(BondPurchase.face_value).label('face_value')
-                ).filter(
-                    BondPurchase.user_id == user_id,
-                    BondPurchase.bond_type_id == bond_type.bond_type_id,
-                    BondPurchase.purchase_status == "active"
-                ).first()
-
-                total_shares = current_totals.shares or Decimal("0")
-                total_face_value = current_totals.face_value or Decimal("0")
-
-                # Calculate cooperative total for percentage
-                coop_total = db.query(
-                    func.sum(BondPurchase.face_value)
-                ).filter(
-                    BondPurchase.bond_type_id == bond_type.bond_type_id,
-                    BondPurchase.purchase_status == "active"
-                ).scalar() or Decimal("1")  # Avoid division by zero
-
-                percentage_share = (total_face_value / coop_total * Decimal("100")).quantize(Decimal("0.00001"))
-
-                closing_balance = opening_balance + purchases_month
-
-                # Skip if no activity
-                if total_shares == 0 and purchases_month == 0:
-                    continue
-
-                balance = MemberBalance(
-                    user_id=user_id,
-                    bond_type_id=bond_type.bond_type_id,
-                    balance_date=month,
-                    opening_balance=opening_balance,
-                    purchases_month=purchases_month,
-                    payments_received=payments_received,
-                    closing_balance=closing_balance,
-                    total_bond_shares=total_shares,
-                    total_face_value=total_face_value,
-                    percentage_share=percentage_share
-                )
-
-                # Check if balance already exists
-                existing = db.query(MemberBalance).filter(
-                    MemberBalance.user_id == user_id,
-                    MemberBalance.bond_type_id == bond_type.bond_type_id,
-                    MemberBalance.balance_date == month
-                ).first()
-
-                if existing:
-                    # Update existing
-                    for key, value in balance.__dict__.items():
-                        if not key.startswith('_') and key != 'balance_id':
-                            setattr(existing, key, value)
-                    balances.append(existing)
-                else:
-                    db.add(balance)
-                    balances.append(balance)
+        # Computed and written in a single INSERT ... SELECT; snapshots already
+        # generated for this month are overwritten (uk_user_bond_date)
+        stmt = pg_insert(MemberBalance).from_select(
+            [
+                'user_id', 'bond_type_id', 'balance_date', 'opening_balance', 'purchases_month',
+                'payments_received', 'closing_balance', 'total_bond_shares', 'total_face_value',
+                'percentage_share'
+            ],
+            snapshot
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['user_id', 'bond_type_id', 'balance_date'],
+            set_={
+                column.name: column
+                for column in stmt.excluded
+                if column.name not in ('balance_id', 'user_id', 'bond_type_id', 'balance_date', 'created_at')
+            }
+        ).returning(MemberBalance)
+        balances = list(db.scalars(stmt, execution_options={"populate_existing": True}))
 
         db.commit()
         return balances
 
     @staticmethod
-    def get_member_portfolio(db: Session, user_id: int) -> Dict:
+    def get_member_portfolio(db: Session, user_id: int, include_purchases: bool = True) -> Dict:
         """
         Get complete portfolio for a member.
 
         Args:
             db: Database session
             user_id: User ID
+            include_purchases: Also load the active purchase records
 
         Returns:
             Dictionary with portfolio details
         """
-        # Get all active purchases
-        purchases = db.query(BondPurchase).filter(
+        active = (
             BondPurchase.user_id == user_id,
-            BondPurchase.purchase_status == "active"
-        ).all()
+            BondPurchase.purchase_status == PurchaseStatus.ACTIVE
+        )
 
-        # Calculate totals
-        total_investment = sum(p.purchase_price for p in purchases)
-        total_face_value = sum(p.face_value for p in purchases)
-        total_shares = sum(p.bond_shares for p in purchases)
+        # Totals are summed in SQL rather than over loaded purchase objects
+        totals = db.query(
+            func.coalesce(func.sum(BondPurchase.purchase_price), 0).label('total_investment'),
+            func.coalesce(func.sum(BondPurchase.face_value), 0).label('total_face_value'),
+            func.coalesce(func.sum(BondPurchase.bond_shares), 0).label('total_shares'),
+            func.count(BondPurchase.purchase_id).label('active_bonds_count')
+        ).filter(*active).one()
 
         # Get recent payments
         recent_payments = db.query(CouponPayment).filter(
             CouponPayment.user_id == user_id
         ).order_by(CouponPayment.payment_date.desc()).limit(10).all()
 
-        return {
+        portfolio = {
             "user_id": user_id,
-            "total_investment": float(total_investment),
-            "total_face_value": float(total_face_value),
-            "total_shares": float(total_shares),
-            "active_bonds_count": len(purchases),
-            "purchases": purchases,
-            "recent_payments": recent_payments
+            "total_investment": float(totals.total_investment),
+            "total_face_value": float(totals.total_face_value),
+            "total_shares": float(totals.total_shares),
+            "active_bonds_count": totals.active_bonds_count
         }
+        if include_purchases:
+            # Only the holding fields, fetched as rows in batches rather than hydrated
+            # as full ORM objects
+            portfolio["purchases"] = [
+                row._asdict()
+                for row in db.query(*PORTFOLIO_PURCHASE_COLUMNS).filter(*active).order_by(
+                    BondPurchase.purchase_date
+                ).yield_per(100)
+            ]
+        portfolio["recent_payments"] = recent_payments
+
+        return portfolio
@@ -1,22 +1,201 @@
 """
 Payment Voucher PDF Generation Service using ReportLab.
 """
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, joinedload
 from datetime import datetime
 from decimal import Decimal
+import functools
+import io
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
 
 from app.models.payment import PaymentVoucher, CouponPayment, VoucherStatus
 from app.models.user import User
 from app.models.bond import BondPurchase
 
 
+# Bulk runs with at least this many vouchers render PDFs in a process pool
+PDF_PROCESS_POOL_THRESHOLD = 20
+
+# Attributes _generate_pdf reads; bulk workers receive just these values
+_PDF_VOUCHER_FIELDS = ("voucher_number", "voucher_date")
+_PDF_PAYMENT_FIELDS = (
+    "payment_type", "payment_reference", "gross_coupon_amount", "withholding_tax",
+    "boz_fees", "coop_fees", "net_payment_amount", "payment_period_start",
+    "payment_period_end", "calendar_days"
+)
+_PDF_USER_FIELDS = ("user_id", "first_name", "last_name", "email", "phone_number")
+
+# Saved voucher PDFs (backend/temp)
+VOUCHER_DIR = os.path.join(os.path.dirname(__file__), '../../temp')
+
+# ReportLab is imported on first use so processes that never render a PDF skip its
+# import cost; styles are the same for every voucher and are built once per process
+@functools.cache
+def _pdf_styles() -> SimpleNamespace:
+    """Paragraph and table styles shared by every voucher PDF."""
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+    base = getSampleStyleSheet()
+
+    title = ParagraphStyle(
+        'CustomTitle',
+        parent=base['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1a237e'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+
+    subtitle = ParagraphStyle(
+        'CustomSubtitle',
+        parent=base['Normal'],
+        fontSize=16,
+        textColor=colors.HexColor('#283593'),
+        spaceAfter=20,
+        alignment=TA_CENTER
+    )
+
+    heading = ParagraphStyle(
+        'CustomHeading',
+        parent=base['Heading2'],
+        fontSize=14,
+        textColor=colors.HexColor('#1a237e'),
+        spaceAfter=12,
+        spaceBefore=12
+    )
+
+    footer = ParagraphStyle(
+        'Footer',
+        parent=base['Normal'],
+        fontSize=9,
+        textColor=colors.grey,
+        alignment=TA_CENTER
+    )
+
+    # Voucher details and payee information
+    label_value_table = TableStyle([
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 11),
+        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#1a237e')),
+        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+        ('LEFTPADDING', (1, 0), (1, -1), 15),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ])
+
+    payment_table = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e8eaf6')),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 1), (0, -1), 'Helvetica'),
+        ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 11),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ])
+
+    net_table = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#1a237e')),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 14),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ('TOPPADDING', (0, 0), (-1, -1), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ])
+
+    period_table = TableStyle([
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#1a237e')),
+        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+        ('LEFTPADDING', (1, 0), (1, -1), 15),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ])
+
+    signature_table = TableStyle([
+        ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('TOPPADDING', (0, 1), (-1, 1), 10),
+        ('BOTTOMPADDING', (0, 1), (-1, 1), 20),
+    ])
+
+    return SimpleNamespace(
+        title=title,
+        subtitle=subtitle,
+        heading=heading,
+        footer=footer,
+        label_value_table=label_value_table,
+        payment_table=payment_table,
+        net_table=net_table,
+        period_table=period_table,
+        signature_table=signature_table
+    )
+
+
+# Flowables that never change between vouchers. Platypus stores layout state on a
+# flowable while building, so each thread keeps its own set instead of sharing one.
+_static_flowables_local = threading.local()
+
+
+def _static_flowables() -> SimpleNamespace:
+    """Header, section headings and signature footer, built once per thread."""
+    flowables = getattr(_static_flowables_local, "flowables", None)
+    if flowables is None:
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Table, Paragraph, Spacer
+
+        styles = _pdf_styles()
+
+        signature_table = Table(
+            [
+                ['_' * 30, '_' * 30],
+                ['Prepared By', 'Approved By'],
+                ['', ''],
+                ['Date: ______________', 'Date: ______________']
+            ],
+            colWidths=[3 * inch, 3 * inch]
+        )
+        signature_table.setStyle(styles.signature_table)
+
+        flowables = SimpleNamespace(
+            header=[
+                Paragraph("Bond Cooperative Society", styles.title),
+                Paragraph("Payment Voucher", styles.subtitle),
+                Spacer(1, 0.3 * inch)
+            ],
+            payee_heading=Paragraph("Payee Information", styles.heading),
+            calculation_heading=Paragraph("Payment Calculation", styles.heading),
+            period_heading=Paragraph("Payment Period", styles.heading),
+            footer=[
+                signature_table,
+                Spacer(1, 0.3 * inch),
+                Paragraph(
+                    "This is a computer-generated document and does not require a signature.",
+                    styles.footer
+                )
+            ]
+        )
+        _static_flowables_local.flowables = flowables
+    return flowables
+
 class VoucherService:
     """Service for generating payment vouchers as PDFs."""
 
@@ -25,7 +204,8 @@ class VoucherService:
         db: Session,
         payment_id: int,
         generated_by: int,
-        currency: str = "ZMW"
+        currency: str = "ZMW",
+        save_pdf: bool = True
     ) -> dict:
         """
         Generate a payment voucher for a coupon payment.
@@ -35,32 +215,31 @@ class VoucherService:
             payment_id: ID of the coupon payment
             generated_by: User ID generating the voucher
             currency: Currency code (default: ZMW)
+            save_pdf: Also write the PDF to the voucher directory
 
         Returns:
-            Dictionary with voucher info and PDF path
+            Dictionary with voucher info, PDF bytes and PDF path (None if not saved)
         """
-        # Get payment with related data
-        payment = db.query(CouponPayment).filter(
+        # Get payment with its member, bond purchase and any voucher in one query
+        payment = db.query(CouponPayment).options(
+            joinedload(CouponPayment.user),
+            joinedload(CouponPayment.bond_purchase),
+            joinedload(CouponPayment.voucher)
+        ).filter(
             CouponPayment.payment_id == payment_id
         ).first()
 
         if not payment:
             raise ValueError("Payment not found")
 
-        # Get user details
-        user = db.query(User).filter(User.user_id == payment.user_id).first()
+        if payment.voucher is not None:
+            raise ValueError(f"Voucher {payment.voucher.voucher_number} already exists for this payment")
 
-        # Get bond purchase details
-        bond_purchase = db.query(BondPurchase).filter(
-            BondPurchase.purchase_id == payment.purchase_id
-        ).first()
-
-        # Generate voucher number
-        voucher_number = f"VOC{datetime.now().year}{payment_id:06d}"
+        user = payment.user
+        bond_purchase = payment.bond_purchase
 
-        # Create voucher record
+        # Create voucher record (voucher_number is assigned by the database sequence)
         voucher = PaymentVoucher(
-            voucher_number=voucher_number,
             user_id=payment.user_id,
             payment_id=payment_id,
             voucher_date=datetime.now().date(),
@@ -70,12 +249,13 @@ class VoucherService:
             generated_by=generated_by
         )
 
+        # Flush for the voucher number, then build the PDF before committing: a commit
+        # would expire the loaded payment, user and purchase and reload each of them
         db.add(voucher)
-        db.commit()
-        db.refresh(voucher)
+        db.flush()
 
         # Generate PDF
-        pdf_path = VoucherService._generate_pdf(
+        pdf_bytes = VoucherService._generate_pdf(
             voucher=voucher,
             payment=payment,
             user=user,
@@ -83,12 +263,129 @@ class VoucherService:
             currency=currency
         )
 
+        pdf_path = None
+        if save_pdf:
+            pdf_path = VoucherService.pdf_path(voucher.voucher_number)
+            os.makedirs(os.path.dirname(pdf_path), exist_ok=True)
+            with open(pdf_path, "wb") as f:
+                f.write(pdf_bytes)
+
+        db.commit()
+
         return {
             "voucher": voucher,
+            "pdf_bytes": pdf_bytes,
             "pdf_path": pdf_path,
-            "voucher_number": voucher_number
+            "voucher_number": voucher.voucher_number
         }
 
+    @staticmethod
+    def generate_vouchers_bulk(
+        db: Session,
+        payment_ids: List[int],
+        generated_by: int,
+        currency: str = "ZMW",
+        save_pdf: bool = True,
+        max_workers: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Generate vouchers for many coupon payments at once.
+
+        Payments and members are loaded in one query and the vouchers inserted in one
+        statement; large batches render their PDFs in a process pool. Unknown payment
+        ids and payments that already have a voucher are skipped. Returns one
+        dictionary per voucher, as generate_voucher does.
+        """
+        payments = db.query(CouponPayment).options(
+            joinedload(CouponPayment.user)
+        ).filter(
+            CouponPayment.payment_id.in_(payment_ids),
+            ~CouponPayment.voucher.has()
+        ).all()
+
+        if not payments:
+            return []
+
+        # voucher_number is assigned by the database sequence and returned by RETURNING
+        voucher_date = datetime.now().date()
+        vouchers = db.scalars(
+            insert(PaymentVoucher).returning(PaymentVoucher, sort_by_parameter_order=True),
+            [
+                {
+                    "user_id": payment.user_id,
+                    "payment_id": payment.payment_id,
+                    "voucher_date": voucher_date,
+                    "voucher_type": payment.payment_type,
+                    "total_amount": payment.net_payment_amount,
+                    "voucher_status": VoucherStatus.DRAFT,
+                    "generated_by": generated_by
+                }
+                for payment in payments
+            ]
+        ).all()
+
+        # Workers only get plain values, never ORM objects
+        payloads = [
+            (
+                {column: getattr(voucher, column) for column in _PDF_VOUCHER_FIELDS},
+                {column: getattr(payment, column) for column in _PDF_PAYMENT_FIELDS},
+                {column: getattr(payment.user, column) for column in _PDF_USER_FIELDS},
+                currency
+            )
+            for voucher, payment in zip(vouchers, payments)
+        ]
+
+        if len(payloads) >= PDF_PROCESS_POOL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                pdfs = list(executor.map(_render_pdf_worker, payloads, chunksize=8))
+        else:
+            pdfs = [_render_pdf_worker(payload) for payload in payloads]
+
+        results = []
+        for voucher, pdf_bytes in zip(vouchers, pdfs):
+            pdf_path = None
+            if save_pdf:
+                pdf_path = VoucherService.pdf_path(voucher.voucher_number)
+                os.makedirs(os.path.dirname(pdf_path), exist_ok=True)
+                with open(pdf_path, "wb") as f:
+                    f.write(pdf_bytes)
+
+            results.append({
+                "voucher": voucher,
+                "pdf_bytes": pdf_bytes,
+                "pdf_path": pdf_path,
+                "voucher_number": voucher.voucher_number
+            })
+
+        db.commit()
+        return results
+
+    @staticmethod
+    def pdf_path(voucher_number: str) -> str:
+        """Path a saved voucher PDF is written to."""
+        return os.path.join(VOUCHER_DIR, f"voucher_{voucher_number}.pdf")
+
+    @staticmethod
+    def render_voucher(db: Session, voucher: PaymentVoucher, currency: str = "ZMW") -> bytes:
+        """Render the PDF for an existing voucher from the database."""
+        payment = db.query(CouponPayment).options(
+            joinedload(CouponPayment.user),
+            joinedload(CouponPayment.bond_purchase)
+        ).filter(
+            CouponPayment.payment_id == voucher.payment_id
+        ).first()
+
+        if not payment:
+            raise ValueError("Payment not found")
+
+        return VoucherService._generate_pdf(
+            voucher=voucher,
+            payment=payment,
+            user=payment.user,
+            bond_purchase=payment.bond_purchase,
+            currency=currency
+        )
+
     @staticmethod
     def _generate_pdf(
         voucher: PaymentVoucher,
@@ -96,9 +393,9 @@ class VoucherService:
         user: User,
         bond_purchase: BondPurchase,
         currency: str
-    ) -> str:
+    ) -> bytes:
         """
-        Generate the PDF document for the voucher.
+        Generate the PDF document for the voucher in memory.
 
         Args:
             voucher: PaymentVoucher object
@@ -108,19 +405,18 @@ class VoucherService:
             currency: Currency code
 
         Returns:
-            Path to generated PDF file
+            PDF file contents
         """
-        # Create temp directory if it doesn't exist
-        temp_dir = os.path.join(os.path.dirname(__file__), '../../temp')
-        os.makedirs(temp_dir, exist_ok=True)
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Table, Spacer
 
-        # PDF file path
-        filename = f"voucher_{voucher.voucher_number}.pdf"
-        filepath = os.path.join(temp_dir, filename)
+        styles = _pdf_styles()
+        buffer = io.BytesIO()
 
         # Create document
         doc = SimpleDocTemplate(
-            filepath,
+            buffer,
             pagesize=A4,
             rightMargin=72,
             leftMargin=72,
@@ -128,42 +424,10 @@ class VoucherService:
             bottomMargin=18
         )
 
-        # Container for document elements
-        elements = []
-
-        # Styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1a237e'),
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-
-        subtitle_style = ParagraphStyle(
-            'CustomSubtitle',
-            parent=styles['Normal'],
-            fontSize=16,
-            textColor=colors.HexColor('#283593'),
-            spaceAfter=20,
-            alignment=TA_CENTER
-        )
+        static = _static_flowables()
 
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor('#1a237e'),
-            spaceAfter=12,
-            spaceBefore=12
-        )
-
-        # Header
-        elements.append(Paragraph("Bond Cooperative Society", title_style))
-        elements.append(Paragraph("Payment Voucher", subtitle_style))
-        elements.append(Spacer(1, 0.3 * inch))
+        # Container for document elements, starting with the header
+        elements = list(static.header)
 
         # Voucher details table
         voucher_data = [
@@ -174,22 +438,13 @@ class VoucherService:
         ]
 
         voucher_table = Table(voucher_data, colWidths=[2 * inch, 4 * inch])
-        voucher_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#1a237e')),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('LEFTPADDING', (1, 0), (1, -1), 15),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        voucher_table.setStyle(styles.label_value_table)
 
         elements.append(voucher_table)
         elements.append(Spacer(1, 0.4 * inch))
 
         # Payee details
-        elements.append(Paragraph("Payee Information", heading_style))
+        elements.append(static.payee_heading)
 
         payee_data = [
             ['Name:', f"{user.first_name} {user.last_name}"],
@@ -199,22 +454,13 @@ class VoucherService:
         ]
 
         payee_table = Table(payee_data, colWidths=[2 * inch, 4 * inch])
-        payee_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#1a237e')),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('LEFTPADDING', (1, 0), (1, -1), 15),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        payee_table.setStyle(styles.label_value_table)
 
         elements.append(payee_table)
         elements.append(Spacer(1, 0.4 * inch))
 
         # Payment calculation breakdown
-        elements.append(Paragraph("Payment Calculation", heading_style))
+        elements.append(static.calculation_heading)
 
         payment_data = [
             ['Description', 'Amount'],
@@ -225,20 +471,7 @@ class VoucherService:
         ]
 
         payment_table = Table(payment_data, colWidths=[4 * inch, 2 * inch])
-        payment_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e8eaf6')),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (0, -1), 'Helvetica'),
-            ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        payment_table.setStyle(styles.payment_table)
 
         elements.append(payment_table)
         elements.append(Spacer(1, 0.2 * inch))
@@ -246,22 +479,13 @@ class VoucherService:
         # Net payment (highlighted)
         net_data = [['Net Payment Amount', f'{currency} {float(payment.net_payment_amount):,.2f}']]
         net_table = Table(net_data, colWidths=[4 * inch, 2 * inch])
-        net_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#1a237e')),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 14),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('TOPPADDING', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ]))
+        net_table.setStyle(styles.net_table)
 
         elements.append(net_table)
         elements.append(Spacer(1, 0.4 * inch))
 
         # Payment period
-        elements.append(Paragraph("Payment Period", heading_style))
+        elements.append(static.period_heading)
         period_data = [
             ['Period Start:', payment.payment_period_start.strftime('%B %d, %Y')],
             ['Period End:', payment.payment_period_end.strftime('%B %d, %Y')],
@@ -269,53 +493,27 @@ class VoucherService:
         ]
 
         period_table = Table(period_data, colWidths=[2 * inch, 4 * inch])
-        period_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#1a237e')),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('LEFTPADDING', (1, 0), (1, -1), 15),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        period_table.setStyle(styles.period_table)
 
         elements.append(period_table)
         elements.append(Spacer(1, 0.6 * inch))
 
         # Footer with signature lines
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=9,
-            textColor=colors.grey,
-            alignment=TA_CENTER
-        )
-
-        signature_data = [
-            ['_' * 30, '_' * 30],
-            ['Prepared By', 'Approved By'],
-            ['', ''],
-            ['Date: ______________', 'Date: ______________']
-        ]
-
-        signature_table = Table(signature_data, colWidths=[3 * inch, 3 * inch])
-        signature_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('TOPPADDING', (0, 1), (-1, 1), 10),
-            ('BOTTOMPADDING', (0, 1), (-1, 1), 20),
-        ]))
-
-        elements.append(signature_table)
-        elements.append(Spacer(1, 0.3 * inch))
-        elements.append(Paragraph(
-            "This is a computer-generated document and does not require a signature.",
-            footer_style
-        ))
+        elements.extend(static.footer)
 
         # Build PDF
         doc.build(elements)
 
-        return filepath
+        return buffer.getvalue()
+
+
+def _render_pdf_worker(payload: Tuple[dict, dict, dict, str]) -> bytes:
+    """Render one voucher PDF from plain values (runs in a worker process)."""
+    voucher, payment, user, currency = payload
+    return VoucherService._generate_pdf(
+        voucher=SimpleNamespace(**voucher),
+        payment=SimpleNamespace(**payment),
+        user=SimpleNamespace(**user),
+        bond_purchase=None,
+        currency=currency
+    )
@@ -0,0 +1,3 @@
+# Importing the configured app makes it current, so @shared_task tasks bind to it
+# (and its Redis broker) in any process that imports app.tasks
+from app.core.celery_config import celery_app  # noqa: F401
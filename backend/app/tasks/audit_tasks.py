@@ -0,0 +1,19 @@
+from celery import shared_task
+
+from app.core.database import SessionLocal
+from app.utils.audit_logger import AuditLogger
+
+
+@shared_task(name='app.tasks.audit_tasks.drain_audit_stream_task', ignore_result=True)
+def drain_audit_stream_task():
+    """
+    Write audit entries published by API requests to the audit_logs table.
+    Queued by AuditLogger.write_batch once entries are published, plus an hourly
+    sweep from Celery beat.
+    """
+    db = SessionLocal()
+    try:
+        written = AuditLogger.drain_stream(db)
+        return {'status': 'completed', 'entries_written': written}
+    finally:
+        db.close()
@@ -0,0 +1,25 @@
+from celery import shared_task
+
+from app.core.database import SessionLocal
+from app.services.notification_service import NotificationService
+
+
+@shared_task(
+    name='app.tasks.notification_tasks.notify_rate_update_task',
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=3,
+    # Nothing reads the result, and skipping it keeps queueing off the result backend
+    ignore_result=True
+)
+def notify_rate_update_task(rate_id: int):
+    """
+    Notify every member holding the rate's bond type about a new interest rate.
+    Retries are safe; members already notified of this rate are skipped.
+    """
+    db = SessionLocal()
+    try:
+        created = NotificationService._notify_rate_update(db, rate_id)
+        return {'status': 'completed', 'notifications_created': created}
+    finally:
+        db.close()
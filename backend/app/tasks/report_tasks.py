@@ -0,0 +1,18 @@
+from celery import shared_task
+
+from app.core.database import SessionLocal
+from app.services.reporting_service import ReportingService
+
+
+@shared_task(name='app.tasks.report_tasks.refresh_monthly_summary_view_task')
+def refresh_monthly_summary_view_task():
+    """
+    Refresh the monthly summary materialized views.
+    Runs every night at 1 AM.
+    """
+    db = SessionLocal()
+    try:
+        ReportingService.refresh_monthly_summary_view(db)
+        return {'status': 'completed'}
+    finally:
+        db.close()
@@ -1,14 +1,139 @@
 """
 Audit Logger Utility for tracking all database changes.
 """
+from contextvars import ContextVar
+from datetime import datetime, timezone
+import logging
+import orjson
+import redis
+from kombu.exceptions import OperationalError
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.core.database import SessionLocal
 from app.models.audit import AuditLog
 
+# Buffered entries are published here and written to audit_logs by drain_audit_stream_task
+AUDIT_STREAM = "audit_stream"
+AUDIT_GROUP = "audit_writers"
+AUDIT_CONSUMER = "audit_drain"
+
+# The first batch published in a window schedules one drain this many seconds later;
+# the key marks a drain as already scheduled for the window
+AUDIT_DRAIN_DELAY = 10
+AUDIT_DRAIN_KEY = "audit_stream:drain_scheduled"
+
+logger = logging.getLogger(__name__)
+
+_redis = redis.Redis.from_url(settings.REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5)
+
 
 class AuditLogger:
     """Utility class for audit logging."""
 
+    # Entries buffered for the current request; None outside a batch (see app.main)
+    _pending: ContextVar[Optional[List[Dict]]] = ContextVar('audit_pending', default=None)
+
+    @staticmethod
+    def begin_batch():
+        """Start buffering entries in the current context; returns a token for end_batch."""
+        return AuditLogger._pending.set([])
+
+    @staticmethod
+    def end_batch(token) -> List[Dict]:
+        """Stop buffering and return the entries collected since begin_batch."""
+        pending = AuditLogger._pending.get()
+        AuditLogger._pending.reset(token)
+        return pending or []
+
+    @staticmethod
+    def write_batch(rows: List[Dict]) -> None:
+        """
+        Publish buffered entries to the audit stream.
+        If Redis is unavailable they are inserted directly so no entry is lost.
+        """
+        if not rows:
+            return
+        try:
+            pipe = _redis.pipeline(transaction=False)
+            for row in rows:
+                pipe.xadd(AUDIT_STREAM, {"payload": orjson.dumps(row, default=str)})
+            pipe.set(AUDIT_DRAIN_KEY, 1, nx=True, ex=AUDIT_DRAIN_DELAY)
+            drain_due = pipe.execute()[-1]
+        except redis.RedisError:
+            db = SessionLocal()
+            try:
+                db.execute(insert(AuditLog), rows)
+                db.commit()
+            finally:
+                db.close()
+            return
+
+        if drain_due:
+            AuditLogger._schedule_drain()
+
+    @staticmethod
+    def _schedule_drain() -> None:
+        """
+        Queue a drain to run once the current window closes, so the stream is only
+        read when something was published. Entries stay in the stream if it cannot
+        be queued; the hourly sweep in the beat schedule picks them up.
+        """
+        from app.tasks.audit_tasks import drain_audit_stream_task
+
+        try:
+            drain_audit_stream_task.apply_async(countdown=AUDIT_DRAIN_DELAY, retry=False)
+        except OperationalError:
+            logger.exception("Could not queue an audit stream drain")
+            try:
+                # Let the next batch try again
+                _redis.delete(AUDIT_DRAIN_KEY)
+            except redis.RedisError:
+                pass
+
+    @staticmethod
+    def drain_stream(db: Session, batch_size: int = 1000) -> int:
+        """
+        Insert entries from the audit stream into audit_logs, one statement per batch.
+
+        Messages are acknowledged only after their batch commits; unacknowledged ones
+        from an interrupted run are read again first.
+
+        Returns:
+            Number of entries written
+        """
+        try:
+            _redis.xgroup_create(AUDIT_STREAM, AUDIT_GROUP, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+        written = 0
+        # "0" replays this consumer's pending messages, ">" reads new ones
+        for start_id in ("0", ">"):
+            while True:
+                response = _redis.xreadgroup(
+                    AUDIT_GROUP, AUDIT_CONSUMER, {AUDIT_STREAM: start_id}, count=batch_size
+                )
+                messages = response[0][1] if response else []
+                if not messages:
+                    break
+
+                message_ids = [message_id for message_id, _ in messages]
+                rows = [orjson.loads(fields[b"payload"]) for _, fields in messages]
+                for row in rows:
+                    row["action_timestamp"] = datetime.fromisoformat(row["action_timestamp"])
+
+                db.execute(insert(AuditLog), rows)
+                db.commit()
+
+                _redis.xack(AUDIT_STREAM, AUDIT_GROUP, *message_ids)
+                _redis.xdel(AUDIT_STREAM, *message_ids)
+                written += len(rows)
+
+        return written
+
     @staticmethod
     def log_action(
         db: Session,
@@ -20,10 +145,13 @@ class AuditLogger:
         new_values: Optional[Dict] = None,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None
-    ) -> AuditLog:
+    ) -> Optional[AuditLog]:
         """
         Log an action to the audit trail.
 
+        Inside a batch (every API request) the entry is buffered and published to the
+        audit stream when the request finishes; otherwise it is committed immediately.
+
         Args:
             db: Database session
             user_id: User performing the action (None for system actions)
@@ -36,9 +164,9 @@ class AuditLogger:
             user_agent: Client user agent string
 
         Returns:
-            Created AuditLog object
+            Created AuditLog object, or None when the entry was buffered
         """
-        audit_log = AuditLog(
+        values = dict(
             user_id=user_id,
             action_type=action_type,
             table_name=table_name,
@@ -49,6 +177,14 @@ class AuditLogger:
             user_agent=user_agent
         )
 
+        pending = AuditLogger._pending.get()
+        if pending is not None:
+            # Stamp now; the row itself is written later by the stream consumer
+            values["action_timestamp"] = datetime.now(timezone.utc)
+            pending.append(values)
+            return None
+
+        audit_log = AuditLog(**values)
         db.add(audit_log)
         db.commit()
 
@@ -0,0 +1,18 @@
+"""
+Shared start-up for the scripts in this directory.
+"""
+import os
+import sys
+from pathlib import Path
+
+
+def ensure_on_path():
+    """
+    Put the backend directory on sys.path so scripts can import the app package.
+    Skipped when BMS_PACKAGED is set, i.e. the app is already installed.
+    """
+    if os.environ.get("BMS_PACKAGED"):
+        return
+    backend_dir = str(Path(__file__).resolve().parent.parent)
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
@@ -0,0 +1,28 @@
+"""
+Column helpers shared by the Excel import scripts in this directory.
+"""
+import re
+from decimal import Decimal
+
+import pandas as pd
+
+
+def column_key(name) -> str:
+    """
+    snake_case identifier for a sheet header, e.g. 'FACE Value ' -> 'face_value'
+    and "Nov '23 b/f" -> 'nov_23_bf', so stray spaces in the workbook don't matter.
+    """
+    key = re.sub(r'\s+', '_', str(name).strip())
+    return re.sub(r'[^\w]', '', key).strip('_').lower()
+
+
+def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Rename sheet headers to their column_key identifiers."""
+    df.columns = [column_key(name) for name in df.columns]
+    return df
+
+
+def decimal_column(values: pd.Series) -> pd.Series:
+    """Decimal for each float, parsed once per distinct value since amounts repeat a lot."""
+    decimals = {value: Decimal(str(value)) for value in values.unique().tolist()}
+    return values.map(decimals)
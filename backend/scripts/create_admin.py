@@ -1,10 +1,18 @@
 """
 Script to create an initial admin user.
 Run this after setting up the database.
+
+Set ADMIN_PASSWORD to choose the password, or ADMIN_PASSWORD_HASH to supply a
+ready-made hash and skip hashing at startup (useful for CI and containers):
+
+    python -c "from app.core.security import get_password_hash; print(get_password_hash('...'))"
 """
+import os
 import sys
 sys.path.append('.')
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from app.core.database import SessionLocal
 from app.core.security import get_password_hash
 from app.models.user import User, UserRole
@@ -14,32 +22,34 @@ def create_admin():
     db = SessionLocal()
 
     try:
-        # Check if admin already exists
-        existing_admin = db.query(User).filter(User.username == "admin").first()
-        if existing_admin:
-            print("Admin user already exists!")
-            return
-
-        # Create admin user
-        admin = User(
-            username="admin",
-            email="admin@bondcoop.com",
-            password_hash=get_password_hash("admin123"),
-            first_name="System",
-            last_name="Administrator",
-            phone_number="+260 123 456 789",
-            address="Bond Cooperative Society Headquarters",
-            user_role=UserRole.ADMIN,
-            is_active=True
+        password = os.environ.get("ADMIN_PASSWORD", "admin123")
+        password_hash = os.environ.get("ADMIN_PASSWORD_HASH") or get_password_hash(password)
+
+        # Create admin user; does nothing if the username is already taken
+        admin_id = db.scalar(
+            pg_insert(User).values(
+                username="admin",
+                email="admin@bondcoop.com",
+                password_hash=password_hash,
+                first_name="System",
+                last_name="Administrator",
+                phone_number="+260 123 456 789",
+                address="Bond Cooperative Society Headquarters",
+                user_role=UserRole.ADMIN,
+                is_active=True
+            ).on_conflict_do_nothing(index_elements=['username']).returning(User.user_id)
         )
-
-        db.add(admin)
         db.commit()
 
+        if admin_id is None:
+            print("Admin user already exists!")
+            return
+
         print("✅ Admin user created successfully!")
         print("\nLogin credentials:")
         print("  Username: admin")
-        print("  Password: admin123")
+        if not os.environ.get("ADMIN_PASSWORD_HASH"):
+            print(f"  Password: {password}")
         print("\n⚠️  Please change the password after first login!")
 
     except Exception as e:
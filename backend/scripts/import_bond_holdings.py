@@ -19,17 +19,53 @@ import argparse
 from pathlib import Path
 from datetime import date
 from decimal import Decimal
+from itertools import islice
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pandas as pd
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.core.database import SessionLocal, engine, Base
 from app.models import BondIssue, User, MemberBondHolding, BondTypeEnum, UserRole
 from app.core.security import get_password_hash
 
+from _excel_columns import column_key, normalize_columns, decimal_column
+
+
+# Holding rows per INSERT executemany batch
+INSERT_CHUNK_SIZE = 1000
+
+# Built once and reused for every chunk
+_HOLDINGS_INSERT_STMT = insert(MemberBondHolding)
+
+# Read as text so member codes keep their written form (e.g. 7 rather than 7.0)
+TEXT_COLUMN_DTYPES = {'No': 'string', 'First Name': 'string', 'Last Name': 'string', 'Email': 'string'}
+
+# Sheet columns the import uses (as column_key names); the rest are not loaded
+NEEDED_COLUMNS = frozenset({
+    'no', 'first_name', 'last_name', 'email', 'bond_shares', 'face_value', 'nov_23_bf',
+    'total_bond_share', 'percentage_share', 'boz_award_costs_value_plus_bal_bf',
+    'variance_difference_cf_jan_2024'
+})
+
+
+def _text_column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Stripped text column; missing or blank cells (or a missing column) become NA."""
+    if name not in df:
+        return pd.Series(pd.NA, index=df.index, dtype="string")
+    values = df[name].astype("string").str.strip()
+    return values.mask(values == "")
+
+
+def _number_column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Numeric column with missing or unparseable cells (or a missing column) as 0."""
+    if name not in df:
+        return pd.Series(0.0, index=df.index)
+    return pd.to_numeric(df[name], errors="coerce").fillna(0)
+
 
 def create_bond_issue(
     db: Session,
@@ -44,7 +80,7 @@ def create_bond_issue(
     boz_fee_rate: Decimal = Decimal("1.0"),
     coop_fee_rate: Decimal = Decimal("2.0")
 ) -> BondIssue:
-    """Create a bond issue record."""
+    """Create a bond issue record; it is committed together with the holdings."""
     bond = BondIssue(
         issuer=issuer,
         issue_name=issue_name,
@@ -58,58 +94,54 @@ def create_bond_issue(
         coop_fee_rate=coop_fee_rate
     )
     db.add(bond)
-    db.commit()
-    db.refresh(bond)
+    # Flush for the id; the caller commits once at the end of the import
+    db.flush()
     print(f"✓ Created bond issue: {bond.issue_name} (ID: {bond.id})")
     return bond
 
 
 def upsert_member(
-    db: Session,
     member_code: str,
     first_name: str,
     last_name: str,
-    email: str = None,
-    members_cache: dict = None
-) -> User:
+    email: str,
+    members_cache: dict,
+    new_members: dict,
+    password_hash: str
+) -> None:
     """
     Create or update a member.
-    Uses cache to avoid repeated queries.
-    """
-    if members_cache is not None and member_code in members_cache:
-        return members_cache[member_code]
 
-    # Try to find by username (member_code)
-    member = db.query(User).filter(User.username == member_code).first()
+    members_cache maps member codes to the users already loaded for this import.
+    Codes not in it are collected in new_members as plain rows, which the caller
+    inserts together. password_hash is the hash of the default password, computed
+    once by the caller.
+    """
+    member = members_cache.get(member_code) or new_members.get(member_code)
 
     if member is None:
         # Create new member
         if email is None or '@' not in email:
             email = f"{member_code}@placeholder.com"
 
-        member = User(
-            username=member_code,
-            email=email.lower(),
-            password_hash=get_password_hash("change123"),  # Default password
-            first_name=first_name,
-            last_name=last_name,
-            user_role=UserRole.MEMBER,
-            is_active=True
-        )
-        db.add(member)
-        db.flush()
-        print(f"  ✓ Created member: {first_name} {last_name} ({member_code})")
+        new_members[member_code] = {
+            "username": member_code,
+            "email": email.lower(),
+            "password_hash": password_hash,  # Default password
+            "first_name": first_name,
+            "last_name": last_name,
+            "user_role": UserRole.MEMBER,
+            "is_active": True
+        }
+    elif isinstance(member, dict):
+        # Repeated code for a member created by this import
+        member["first_name"] = first_name
+        member["last_name"] = last_name
     else:
         # Update if names changed
         if member.first_name != first_name or member.last_name != last_name:
             member.first_name = first_name
             member.last_name = last_name
-            print(f"  ✓ Updated member: {first_name} {last_name} ({member_code})")
-
-    if members_cache is not None:
-        members_cache[member_code] = member
-
-    return member
 
 
 def import_excel(
@@ -130,7 +162,16 @@ def import_excel(
 
     # Read Excel file
     try:
-        df = pd.read_excel(excel_file, sheet_name=sheet_name)
+        # openpyxl's read-only, values-only reader (pandas opens it with read_only,
+        # data_only and keep_links=False); identifying columns are read as text
+        df = pd.read_excel(
+            excel_file,
+            sheet_name=sheet_name,
+            engine="openpyxl",
+            dtype=TEXT_COLUMN_DTYPES,
+            usecols=lambda name: column_key(name) in NEEDED_COLUMNS
+        )
+        normalize_columns(df)
         print(f"✓ Read {len(df)} rows from Excel")
     except Exception as e:
         print(f"✗ Failed to read Excel file: {e}")
@@ -157,72 +198,106 @@ def import_excel(
 
         bond = create_bond_issue(db, **bond_params)
 
-        # Cache for members
-        members_cache = {}
-
         # Import holdings
-        holdings_created = 0
-        holdings_skipped = 0
         errors = []
 
-        for idx, row in df.iterrows():
+        # Clean whole columns once rather than cell by cell inside the loop
+        rows = pd.DataFrame({
+            "member_code": _text_column(df, 'no'),
+            "first_name": _text_column(df, 'first_name'),
+            "last_name": _text_column(df, 'last_name'),
+            "email": _text_column(df, 'email'),
+            "bond_shares": _number_column(df, 'bond_shares'),
+            "member_face_value": _number_column(df, 'face_value'),
+            "opening_balance": _number_column(df, 'nov_23_bf'),
+            "total_bond_share": _number_column(df, 'total_bond_share'),
+            "percentage_share": _number_column(df, 'percentage_share'),
+            "award_value_plus_balance": _number_column(df, 'boz_award_costs_value_plus_bal_bf'),
+            "variance": _number_column(df, 'variance_difference_cf_jan_2024')
+        })
+
+        # Skip rows without bond shares
+        has_shares = rows["bond_shares"] != 0
+        holdings_skipped = int((~has_shares).sum())
+
+        missing_member = has_shares & (
+            rows["member_code"].isna() | rows["first_name"].isna() | rows["last_name"].isna()
+        )
+        for idx in rows.index[missing_member]:
+            errors.append(f"Row {idx + 2}: Missing member information")
+
+        # Set as_of_date (adjust as needed)
+        as_of_date = date(2023, 11, 30)
+
+        # Load every existing member in the sheet with one query
+        valid = rows[has_shares & ~missing_member]
+        members_cache = {
+            member.username: member
+            for member in db.query(User).filter(User.username.in_(set(valid["member_code"])))
+        }
+
+        valid = valid.assign(**{
+            name: decimal_column(valid[name])
+            for name in (
+                "bond_shares", "member_face_value", "opening_balance", "total_bond_share",
+                "percentage_share", "award_value_plus_balance", "variance"
+            )
+        })
+
+        # Hash the shared default password once rather than per new member
+        default_password_hash = get_password_hash("change123")
+
+        # Upsert members first; new ones are inserted together below
+        new_members = {}
+        valid_rows = []
+        for row in valid.itertuples():
             try:
-                # Skip rows without bond shares
-                if pd.isna(row.get('Bond Shares')) or float(row.get('Bond Shares', 0)) == 0:
-                    holdings_skipped += 1
-                    continue
-
-                # Extract member data
-                member_code = str(row.get('No', '')).strip()
-                first_name = str(row.get('First Name', '')).strip()
-                last_name = str(row.get('Last Name', '')).strip()
-                email = str(row.get('Email', '')).strip() if not pd.isna(row.get('Email')) else None
-
-                if not member_code or not first_name or not last_name:
-                    errors.append(f"Row {idx + 2}: Missing member information")
-                    continue
-
-                # Upsert member
-                member = upsert_member(db, member_code, first_name, last_name, email, members_cache)
-
-                # Extract holding data
-                bond_shares = Decimal(str(row.get('Bond Shares', 0)))
-                member_face_value = Decimal(str(row.get('FACE Value ', 0)))  # Note: trailing space in column name
-                opening_balance = Decimal(str(row.get("Nov '23 b/f", 0))) if not pd.isna(row.get("Nov '23 b/f")) else Decimal("0")
-                total_bond_share = Decimal(str(row.get('Total Bond share', 0))) if not pd.isna(row.get('Total Bond share')) else Decimal("0")
-                percentage_share = Decimal(str(row.get('Percentage Share (%)', 0))) if not pd.isna(row.get('Percentage Share (%)')) else Decimal("0")
-                award_value_plus_balance = Decimal(str(row.get('BOZ Award Costs Value Plus bal b/f', 0))) if not pd.isna(row.get('BOZ Award Costs Value Plus bal b/f')) else Decimal("0")
-                variance = Decimal(str(row.get('Variance (Difference) C/F Jan 2024', 0))) if not pd.isna(row.get('Variance (Difference) C/F Jan 2024')) else Decimal("0")
-
-                # Set as_of_date (adjust as needed)
-                as_of_date = date(2023, 11, 30)
-
-                # Create holding
-                holding = MemberBondHolding(
-                    member_id=member.user_id,
-                    bond_id=bond.id,
-                    as_of_date=as_of_date,
-                    bond_shares=bond_shares,
-                    opening_balance=opening_balance,
-                    total_bond_share=total_bond_share,
-                    percentage_share=percentage_share,
-                    award_value_plus_balance_bf=award_value_plus_balance,
-                    variance_cf_next_period=variance,
-                    member_face_value=member_face_value
+                email = row.email if not pd.isna(row.email) else None
+                upsert_member(
+                    row.member_code, row.first_name, row.last_name, email,
+                    members_cache, new_members, default_password_hash
                 )
-                db.add(holding)
-                holdings_created += 1
-
+                valid_rows.append(row)
             except Exception as e:
-                errors.append(f"Row {idx + 2}: {str(e)}")
+                errors.append(f"Row {row.Index + 2}: {str(e)}")
                 continue
 
-        # Commit all changes
+        # One INSERT ... RETURNING for all new members gives their user_ids
+        member_ids = {code: member.user_id for code, member in members_cache.items()}
+        if new_members:
+            created = db.execute(
+                insert(User).returning(User.user_id, User.username),
+                list(new_members.values())
+            )
+            member_ids.update({row.username: row.user_id for row in created})
+
+        # Holdings are plain rows for a Core executemany insert, built lazily one chunk at a time
+        holdings_rows = (
+            {
+                "member_id": member_ids[row.member_code],
+                "bond_id": bond.id,
+                "as_of_date": as_of_date,
+                "bond_shares": row.bond_shares,
+                "opening_balance": row.opening_balance,
+                "total_bond_share": row.total_bond_share,
+                "percentage_share": row.percentage_share,
+                "award_value_plus_balance_bf": row.award_value_plus_balance,
+                "variance_cf_next_period": row.variance,
+                "member_face_value": row.member_face_value
+            }
+            for row in valid_rows
+        )
+        while chunk := list(islice(holdings_rows, INSERT_CHUNK_SIZE)):
+            db.execute(_HOLDINGS_INSERT_STMT, chunk)
+        holdings_created = len(valid_rows)
+
+        # Bond issue, members and holdings are committed together
         db.commit()
 
         print(f"\n📈 Import Summary:")
         print(f"  ✓ Bond issue created: {bond.issue_name}")
-        print(f"  ✓ Members processed: {len(members_cache)}")
+        print(f"  ✓ Members processed: {len(member_ids)}")
+        print(f"  ✓ Members created: {len(new_members)}")
         print(f"  ✓ Holdings created: {holdings_created}")
         print(f"  ⊘ Holdings skipped (0 shares): {holdings_skipped}")
 
@@ -2,16 +2,30 @@
 Script to import bond purchases and users from Excel file.
 """
 import sys
+from itertools import islice
 sys.path.append('.')
 
 import pandas as pd
 from datetime import datetime, date
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal
 from app.core.security import get_password_hash
 from app.models.user import User, UserRole
 from app.models.bond import BondPurchase, BondType, PurchaseStatus
-from decimal import Decimal
+from _excel_columns import column_key, normalize_columns, decimal_column
+
+# Bond purchase rows per INSERT executemany batch
+INSERT_CHUNK_SIZE = 1000
+
+# Built once and reused for every chunk
+_PURCHASES_INSERT_STMT = insert(BondPurchase)
+
+# Sheet columns the import uses (as column_key names); the rest are not loaded
+NEEDED_COLUMNS = frozenset({
+    'first_name', 'last_name', 'email', 'bond_shares', 'face_value',
+    'discount_value_paid_on_maturity', 'less_2_coop_discount_fee'
+})
 
 
 def import_excel_data(file_path: str, purchase_date: date = None, bond_type_name: str = "2-Year Bond"):
@@ -28,7 +42,16 @@ def import_excel_data(file_path: str, purchase_date: date = None, bond_type_name
     try:
         # Read Excel file
         print(f"📊 Reading Excel file: {file_path}")
-        df = pd.read_excel(file_path, sheet_name=0, header=1)
+        # openpyxl's read-only, values-only reader; member details are read as text
+        df = pd.read_excel(
+            file_path,
+            sheet_name=0,
+            header=1,
+            engine="openpyxl",
+            dtype={'First Name': 'string', 'Last Name': 'string', 'Email': 'string'},
+            usecols=lambda name: column_key(name) in NEEDED_COLUMNS
+        )
+        normalize_columns(df)
 
         # Get or create bond type
         bond_type = db.query(BondType).filter(BondType.bond_name == bond_type_name).first()
@@ -48,28 +71,87 @@ def import_excel_data(file_path: str, purchase_date: date = None, bond_type_name
         # Track statistics
         users_created = 0
         users_updated = 0
-        bonds_created = 0
+        duplicates_skipped = 0
+        pending_purchases = []
         errors = []
 
+        # Parse the amount columns once, with the per-row fallbacks applied column-wise
+        bond_shares_col = pd.to_numeric(df['bond_shares'], errors='coerce').fillna(0)
+        # Face value defaults to the share count
+        face_value_col = (
+            pd.to_numeric(df['face_value'], errors='coerce').fillna(bond_shares_col)
+            if 'face_value' in df else bond_shares_col
+        )
+        discount_col = (
+            pd.to_numeric(df['discount_value_paid_on_maturity'], errors='coerce').fillna(0)
+            if 'discount_value_paid_on_maturity' in df else pd.Series(0.0, index=df.index)
+        )
+        # Coop discount fee defaults to 2% of the discount
+        coop_fee_col = pd.to_numeric(df['less_2_coop_discount_fee'], errors='coerce').fillna(discount_col * 0.02)
+        df = df.assign(
+            bond_shares=bond_shares_col,
+            face_value=face_value_col,
+            discount_value=discount_col,
+            coop_fee=coop_fee_col,
+            net_discount=discount_col - coop_fee_col,
+            # Price paid is face value less any discount
+            price_paid=face_value_col.where(discount_col <= 0, face_value_col - discount_col)
+        )
+
+        # Only rows with a name, an email and shares reach the row loop; the index
+        # keeps the original row numbers for error messages
+        df = df[df['first_name'].notna() & df['email'].notna() & (df['bond_shares'] > 0)]
+
+        # Normalize and validate emails column-wise; invalid rows are reported and dropped
+        df = df.assign(email=df['email'].str.strip().str.lower())
+        invalid_email = ~df['email'].str.contains('@', na=False)
+        errors.extend(
+            f"Row {index + 2}: Invalid email '{email}'"
+            for index, email in df.loc[invalid_email, 'email'].items()
+        )
+        df = df[~invalid_email]
+        df = df.assign(**{
+            name: decimal_column(df[name])
+            for name in ('bond_shares', 'face_value', 'discount_value', 'coop_fee', 'net_discount', 'price_paid')
+        })
+
+        # Look up existing users, taken usernames and this date's purchases once,
+        # instead of querying for every row
+        emails = set(df['email'])
+        users_by_email = {
+            user.email: user
+            for user in db.query(User).filter(User.email.in_(emails))
+        }
+        taken_usernames = set(db.scalars(select(User.username)))
+        existing_purchases = set(
+            db.query(BondPurchase.user_id, BondPurchase.face_value).filter(
+                BondPurchase.bond_type_id == bond_type.bond_type_id,
+                BondPurchase.purchase_date == purchase_date
+            ).all()
+        )
+
+        # Hash the shared default password once rather than per new user
+        default_password_hash = get_password_hash("change123")
+
+        # Every purchase in the import shares the same dates
+        purchase_month = purchase_date.replace(day=1)
+        maturity_date = purchase_date.replace(year=purchase_date.year + bond_type.maturity_period_years)
+
         # Process each row
-        for index, row in df.iterrows():
+        columns = [
+            'first_name', 'last_name', 'email',
+            'bond_shares', 'face_value', 'discount_value', 'coop_fee', 'net_discount', 'price_paid'
+        ]
+        for row in df[columns].itertuples():
+            index = row.Index
             try:
-                # Skip rows with missing essential data
-                if pd.isna(row['First Name']) or pd.isna(row['Email']):
-                    continue
-
                 # Extract user data
-                first_name = str(row['First Name']).strip()
-                last_name = str(row['Last Name']).strip() if pd.notna(row['Last Name']) else ""
-                email = str(row['Email']).strip().lower()
-
-                # Skip invalid emails
-                if not email or '@' not in email:
-                    errors.append(f"Row {index + 2}: Invalid email '{email}'")
-                    continue
+                first_name = str(row.first_name).strip()
+                last_name = str(row.last_name).strip() if pd.notna(row.last_name) else ""
+                email = row.email
 
                 # Check if user exists
-                user = db.query(User).filter(User.email == email).first()
+                user = users_by_email.get(email)
 
                 if not user:
                     # Create new user
@@ -77,96 +159,65 @@ def import_excel_data(file_path: str, purchase_date: date = None, bond_type_name
                     # Ensure unique username
                     base_username = username
                     counter = 1
-                    while db.query(User).filter(User.username == username).first():
+                    while username in taken_usernames:
                         username = f"{base_username}{counter}"
                         counter += 1
 
                     user = User(
                         username=username,
                         email=email,
-                        password_hash=get_password_hash("change123"),  # Default password
+                        password_hash=default_password_hash,  # Default password
                         first_name=first_name,
                         last_name=last_name,
                         user_role=UserRole.MEMBER,
                         is_active=True
                     )
-                    db.add(user)
-                    db.flush()  # Get user_id
+                    db.add(user)  # user_id is assigned by the flush after the loop
+                    users_by_email[email] = user
+                    taken_usernames.add(username)
                     users_created += 1
-                    print(f"  ✅ Created user: {email} (username: {username})")
                 else:
                     # Update user name if different
                     if user.first_name != first_name or user.last_name != last_name:
                         user.first_name = first_name
                         user.last_name = last_name
                         users_updated += 1
-                        print(f"  📝 Updated user: {email}")
-
-                # Extract bond data
-                bond_shares = float(row['Bond Shares']) if pd.notna(row['Bond Shares']) else 0
-
-                # Skip if no bond shares
-                if bond_shares <= 0:
-                    continue
-
-                # Parse face value (column has trailing space)
-                face_value = float(row['FACE Value ']) if pd.notna(row.get('FACE Value ')) else bond_shares
-
-                # Parse discount value
-                discount_value = float(row['Discount Value Paid on Maturity']) if pd.notna(row.get('Discount Value Paid on Maturity')) else 0
-
-                # Parse coop discount fee (2% of discount)
-                coop_fee = float(row['Less 2%\n Co-op  Discount Fee']) if pd.notna(row['Less 2%\n Co-op  Discount Fee']) else (discount_value * 0.02)
-
-                # Calculate net discount value
-                net_discount = discount_value - coop_fee
-
-                # Calculate price paid (face value - discount)
-                price_paid = face_value - discount_value if discount_value > 0 else face_value
-
-                # Calculate purchase month (first day of month)
-                purchase_month = purchase_date.replace(day=1)
-
-                # Calculate maturity date
-                maturity_date = purchase_date.replace(year=purchase_date.year + bond_type.maturity_period_years)
 
                 # Check if bond purchase already exists for this user and date
-                existing_bond = db.query(BondPurchase).filter(
-                    BondPurchase.user_id == user.user_id,
-                    BondPurchase.bond_type_id == bond_type.bond_type_id,
-                    BondPurchase.purchase_date == purchase_date,
-                    BondPurchase.face_value == Decimal(str(face_value))
-                ).first()
-
-                if existing_bond:
-                    print(f"  ⏭️  Skipped duplicate bond for {email}: {face_value}")
+                # (new users have no user_id yet, and no purchases)
+                if (user.user_id, row.face_value) in existing_purchases:
+                    duplicates_skipped += 1
                     continue
 
-                # Create bond purchase
-                bond_purchase = BondPurchase(
-                    user_id=user.user_id,
-                    bond_type_id=bond_type.bond_type_id,
-                    purchase_date=purchase_date,
-                    purchase_month=purchase_month,
-                    bond_shares=Decimal(str(bond_shares)),
-                    face_value=Decimal(str(face_value)),
-                    discount_value=Decimal(str(discount_value)),
-                    coop_discount_fee=Decimal(str(coop_fee)),
-                    net_discount_value=Decimal(str(net_discount)),
-                    purchase_price=Decimal(str(price_paid)),
-                    maturity_date=maturity_date,
-                    purchase_status=PurchaseStatus.ACTIVE
-                )
-                db.add(bond_purchase)
-                bonds_created += 1
-                print(f"  💰 Created bond for {email}: Face Value={face_value}, Price Paid={price_paid}")
+                # Bond purchase row, inserted in bulk after the loop
+                pending_purchases.append((user, {
+                    "bond_type_id": bond_type.bond_type_id,
+                    "purchase_date": purchase_date,
+                    "purchase_month": purchase_month,
+                    "bond_shares": row.bond_shares,
+                    "face_value": row.face_value,
+                    "discount_value": row.discount_value,
+                    "coop_discount_fee": row.coop_fee,
+                    "net_discount_value": row.net_discount,
+                    "purchase_price": row.price_paid,
+                    "maturity_date": maturity_date,
+                    "purchase_status": PurchaseStatus.ACTIVE
+                }))
 
             except Exception as e:
-                error_msg = f"Row {index + 2}: {str(e)}"
-                errors.append(error_msg)
-                print(f"  ❌ {error_msg}")
+                errors.append(f"Row {index + 2}: {str(e)}")
                 continue
 
+        # Assign user_ids to all new users at once
+        db.flush()
+        purchase_rows = ({"user_id": user.user_id, **values} for user, values in pending_purchases)
+
+        # One executemany INSERT per chunk instead of an ORM insert per purchase;
+        # only one chunk of row dicts is built at a time
+        while chunk := list(islice(purchase_rows, INSERT_CHUNK_SIZE)):
+            db.execute(_PURCHASES_INSERT_STMT, chunk)
+        bonds_created = len(pending_purchases)
+
         # Commit all changes
         db.commit()
 
@@ -177,6 +228,7 @@ def import_excel_data(file_path: str, purchase_date: date = None, bond_type_name
         print(f"✅ Users created: {users_created}")
         print(f"📝 Users updated: {users_updated}")
         print(f"💰 Bond purchases created: {bonds_created}")
+        print(f"⏭️  Duplicate bonds skipped: {duplicates_skipped}")
 
         if errors:
             print(f"\n⚠️  Errors encountered: {len(errors)}")
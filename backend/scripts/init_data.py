@@ -7,6 +7,8 @@ sys.path.append('.')
 
 from datetime import date
 from decimal import Decimal
+from sqlalchemy import insert, select
+
 from app.core.database import SessionLocal
 from app.models.bond import BondType
 from app.models.fee import FeeStructure, FeeType, AppliesTo
@@ -35,18 +37,19 @@ def init_bond_types(db):
         }
     ]
 
+    # bond_name has no unique constraint, so look up the existing names once
+    existing = set(db.scalars(select(BondType.bond_name)))
+    new_bond_types = []
     for bt_data in bond_types:
-        existing = db.query(BondType).filter(
-            BondType.bond_name == bt_data["bond_name"]
-        ).first()
-
-        if not existing:
-            bond_type = BondType(**bt_data)
-            db.add(bond_type)
+        if bt_data["bond_name"] not in existing:
+            new_bond_types.append(bt_data)
             print(f"✅ Created bond type: {bt_data['bond_name']}")
         else:
             print(f"⏭️  Bond type already exists: {bt_data['bond_name']}")
 
+    if new_bond_types:
+        db.execute(insert(BondType), new_bond_types)
+
     db.commit()
 
 
@@ -91,18 +94,18 @@ def init_fee_structure(db):
         }
     ]
 
+    existing = set(db.scalars(select(FeeStructure.fee_name)))
+    new_fees = []
     for fee_data in fees:
-        existing = db.query(FeeStructure).filter(
-            FeeStructure.fee_name == fee_data["fee_name"]
-        ).first()
-
-        if not existing:
-            fee = FeeStructure(**fee_data)
-            db.add(fee)
+        if fee_data["fee_name"] not in existing:
+            new_fees.append(fee_data)
             print(f"✅ Created fee: {fee_data['fee_name']}")
         else:
             print(f"⏭️  Fee already exists: {fee_data['fee_name']}")
 
+    if new_fees:
+        db.execute(insert(FeeStructure), new_fees)
+
     db.commit()
 
 
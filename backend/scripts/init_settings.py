@@ -5,6 +5,8 @@ Run this after creating the database schema.
 import sys
 sys.path.append('.')
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from app.core.database import SessionLocal
 from app.models.settings import SystemSetting, SettingType
 
@@ -113,14 +115,15 @@ def init_settings():
     ]
 
     try:
-        for setting_data in settings:
-            existing = db.query(SystemSetting).filter(
-                SystemSetting.setting_key == setting_data["setting_key"]
-            ).first()
+        # Insert every setting in one statement; existing keys are left untouched
+        created = set(db.scalars(
+            pg_insert(SystemSetting).values(settings)
+            .on_conflict_do_nothing(index_elements=['setting_key'])
+            .returning(SystemSetting.setting_key)
+        ))
 
-            if not existing:
-                setting = SystemSetting(**setting_data)
-                db.add(setting)
+        for setting_data in settings:
+            if setting_data["setting_key"] in created:
                 print(f"✅ Created setting: {setting_data['setting_key']}")
             else:
                 print(f"⏭️  Setting already exists: {setting_data['setting_key']}")
@@ -11,32 +11,51 @@ Run this script to update your database with the new schema.
 
 Usage:
     python scripts/migrate_add_bond_issues.py
+    python scripts/migrate_add_bond_issues.py --dry-run   # list missing tables only
 """
 
 import sys
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from app.core.database import engine, Base
-from app.models import (
-    BondIssue, MemberBondHolding, PaymentEvent, MemberPayment
-)
-
-
-def run_migration(auto_confirm=False):
-    """Run the migration to add new tables."""
-    print("=" * 60)
-    print("Bond Management System - Database Migration")
-    print("Adding Bond Issues System Tables")
-    print("=" * 60)
-
-    print("\nTables to be created:")
-    print("  1. bond_issues")
-    print("  2. member_bond_holdings")
-    print("  3. payment_events")
-    print("  4. member_payments")
+from _bootstrap import ensure_on_path
+
+ensure_on_path()
+
+
+def run_migration(auto_confirm=False, dry_run=False):
+    """Run the migration to add new tables; with dry_run, only report the missing ones."""
+    # Imported here so loading the script doesn't wait on the app models and engine
+    from sqlalchemy import inspect
+    from app.core.database import engine, Base
+    from app.models import (
+        BondIssue, MemberBondHolding, PaymentEvent, MemberPayment
+    )
+
+    # Each block of output is written with a single print
+    print("\n".join([
+        "=" * 60,
+        "Bond Management System - Database Migration",
+        "Adding Bond Issues System Tables",
+        "=" * 60
+    ]))
+
+    # Read the existing table names once; only missing tables are created
+    existing = set(inspect(engine).get_table_names())
+    tables = [
+        model.__table__
+        for model in (BondIssue, MemberBondHolding, PaymentEvent, MemberPayment)
+        if model.__tablename__ not in existing
+    ]
+    if not tables:
+        print("\n✓ All tables already exist")
+        return
+
+    print("\nTables to be created:\n" + "\n".join(
+        f"  {number}. {table.name}" for number, table in enumerate(tables, start=1)
+    ))
+
+    if dry_run:
+        print("\nDry run: no changes made.")
+        return
 
     if not auto_confirm:
         response = input("\nProceed with migration? (yes/no): ").strip().lower()
@@ -49,24 +68,19 @@ def run_migration(auto_confirm=False):
     try:
         print("\nCreating tables...")
 
-        # Create only the new tables
-        BondIssue.__table__.create(engine, checkfirst=True)
-        print("  ✓ Created table: bond_issues")
-
-        MemberBondHolding.__table__.create(engine, checkfirst=True)
-        print("  ✓ Created table: member_bond_holdings")
-
-        PaymentEvent.__table__.create(engine, checkfirst=True)
-        print("  ✓ Created table: payment_events")
-
-        MemberPayment.__table__.create(engine, checkfirst=True)
-        print("  ✓ Created table: member_payments")
+        # One connection and one DDL transaction; the tables are known to be missing
+        with engine.begin() as conn:
+            Base.metadata.create_all(bind=conn, tables=tables, checkfirst=False)
 
-        print("\n✅ Migration completed successfully!")
-        print("\nNext steps:")
-        print("  1. Import bond holdings using: python scripts/import_bond_holdings.py <excel_file>")
-        print("  2. Create payment events via the API or web interface")
-        print("  3. Use preview/generate endpoints to calculate member payments")
+        print("\n".join(
+            [f"  ✓ Created table: {table.name}" for table in tables] + [
+                "\n✅ Migration completed successfully!",
+                "\nNext steps:",
+                "  1. Import bond holdings using: python scripts/import_bond_holdings.py <excel_file>",
+                "  2. Create payment events via the API or web interface",
+                "  3. Use preview/generate endpoints to calculate member payments"
+            ]
+        ))
 
     except Exception as e:
         print(f"\n✗ Migration failed: {e}")
@@ -76,6 +90,5 @@ def run_migration(auto_confirm=False):
 
 
 if __name__ == "__main__":
-    import sys
     auto_confirm = '--auto' in sys.argv or '-y' in sys.argv
-    run_migration(auto_confirm=auto_confirm)
+    run_migration(auto_confirm=auto_confirm, dry_run='--dry-run' in sys.argv)
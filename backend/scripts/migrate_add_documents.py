@@ -3,56 +3,61 @@
 Migration script to add member_documents table.
 """
 import sys
-import os
+from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _bootstrap import ensure_on_path
 
-from sqlalchemy import create_engine, text, inspect
-from app.core.database import Base
-from app.models import MemberDocument, User
-from app.core.config import settings
+ensure_on_path()
 
-def migrate():
-    """Run the migration."""
-    # Create engine
-    engine = create_engine(settings.DATABASE_URL)
-    inspector = inspect(engine)
 
-    # Check if table exists
-    if "member_documents" in inspector.get_table_names():
-        print("✓ Table 'member_documents' already exists")
-        return
+def migrate(dry_run=False):
+    """Run the migration; with dry_run, only report whether the table is missing."""
+    # Imported here so the confirmation prompt doesn't wait on loading the app models
+    from sqlalchemy import create_engine, inspect
+    from sqlalchemy.pool import NullPool
+    from app.core.config import settings
+    from app.models import MemberDocument
 
-    print("Creating member_documents table...")
+    # A one-off script needs a single connection, not a pool; it is closed on dispose()
+    engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
 
-    # Create table
-    MemberDocument.__table__.create(engine)
+    try:
+        # Check and create on one connection; the table and its indexes commit together
+        with engine.begin() as conn:
+            if "member_documents" in inspect(conn).get_table_names():
+                print("✓ Table 'member_documents' already exists")
+                return
+
+            if dry_run:
+                print("Would create: member_documents")
+                return
+
+            print("Creating member_documents table...")
+            MemberDocument.__table__.create(conn)
+    finally:
+        engine.dispose()
 
     print("✅ Migration completed successfully!")
     print("  ✓ Created table: member_documents")
 
     # Create uploads directory
-    upload_dir = os.path.join("uploads", "member_documents")
-    os.makedirs(upload_dir, exist_ok=True)
+    upload_dir = Path("uploads", "member_documents")
+    upload_dir.mkdir(parents=True, exist_ok=True)
     print(f"  ✓ Created uploads directory: {upload_dir}")
 
 
 if __name__ == "__main__":
-    import argparse
-
-    parser = argparse.parser(description="Add member_documents table")
-    parser.add_argument("--auto", action="store_true", help="Run automatically without confirmation")
-    args = parser.parse_args()
+    auto_confirm = '--auto' in sys.argv or '-y' in sys.argv
+    dry_run = '--dry-run' in sys.argv
 
-    if not args.auto:
+    if not auto_confirm and not dry_run:
         response = input("Run migration to add member_documents table? (yes/no): ")
         if response.lower() not in ['yes', 'y']:
             print("Migration cancelled")
             sys.exit(0)
 
     try:
-        migrate()
+        migrate(dry_run=dry_run)
     except Exception as e:
         print(f"❌ Migration failed: {str(e)}")
         sys.exit(1)
@@ -0,0 +1,18 @@
+"""
+Shared inputs for the calculator tests.
+Decimal and date are immutable, so one instance per session is safe to share.
+"""
+import pytest
+from decimal import Decimal
+from datetime import date
+
+
+@pytest.fixture(scope="session")
+def face_value():
+    """Face value of a 10,000-share holding."""
+    return Decimal("10000")
+
+
+@pytest.fixture(scope="session")
+def purchase_date():
+    return date(2024, 1, 1)
@@ -7,23 +7,26 @@ from datetime import date
 from app.services.bond_calculator import BondCalculator
 
 
-def test_calculate_face_value():
+@pytest.mark.parametrize("bond_shares,expected", [
+    (Decimal("10000"), Decimal("10000.00")),
+    (Decimal("5000.50"), Decimal("5000.50")),
+])
+def test_calculate_face_value(bond_shares, expected):
     """Test face value calculation."""
-    result = BondCalculator.calculate_face_value(Decimal("10000"))
-    assert result == Decimal("10000.00")
+    assert BondCalculator.calculate_face_value(bond_shares) == expected
 
-    result = BondCalculator.calculate_face_value(Decimal("5000.50"))
-    assert result == Decimal("5000.50")
 
-
-def test_calculate_discount_value():
+@pytest.mark.parametrize("discount_rate,expected", [
+    (None, Decimal("1000.00")),  # default 10% of 10000
+    (Decimal("0.15"), Decimal("1500.00")),  # 15% of 10000
+])
+def test_calculate_discount_value(face_value, discount_rate, expected):
     """Test discount value calculation."""
-    face_value = Decimal("10000")
-    result = BondCalculator.calculate_discount_value(face_value)
-    assert result == Decimal("1000.00")  # 10% of 10000
-
-    result = BondCalculator.calculate_discount_value(face_value, Decimal("0.15"))
-    assert result == Decimal("1500.00")  # 15% of 10000
+    if discount_rate is None:
+        result = BondCalculator.calculate_discount_value(face_value)
+    else:
+        result = BondCalculator.calculate_discount_value(face_value, discount_rate)
+    assert result == expected
 
 
 def test_calculate_coop_discount_fee():
@@ -33,25 +36,23 @@ def test_calculate_coop_discount_fee():
     assert result == Decimal("20.00")  # 2% of 1000
 
 
-def test_calculate_purchase_price():
+def test_calculate_purchase_price(face_value):
     """Test purchase price calculation."""
-    face_value = Decimal("10000")
     discount_value = Decimal("1000")
     result = BondCalculator.calculate_purchase_price(face_value, discount_value)
     assert result == Decimal("9000")
 
 
-def test_calculate_maturity_date():
+def test_calculate_maturity_date(purchase_date):
     """Test maturity date calculation."""
-    purchase_date = date(2024, 1, 1)
     result = BondCalculator.calculate_maturity_date(purchase_date, 2)
     expected = date(2026, 1, 1)
     assert result == expected
 
 
-def test_calculate_calendar_days():
+def test_calculate_calendar_days(purchase_date):
     """Test calendar days calculation."""
-    start = date(2024, 1, 1)
+    start = purchase_date
     end = date(2024, 7, 1)
     result = BondCalculator.calculate_calendar_days(start, end)
     assert result == 182  # Days between dates
@@ -65,9 +66,8 @@ def test_calculate_daily_rate():
     assert abs(result - expected) < Decimal("0.00000001")
 
 
-def test_calculate_coupon_payment():
+def test_calculate_coupon_payment(face_value):
     """Test complete coupon payment calculation."""
-    face_value = Decimal("10000")
     daily_rate = Decimal("0.000247")  # 9.02% annual / 365
     calendar_days = 183  # Semi-annual period
 
@@ -97,10 +97,9 @@ def test_calculate_coupon_payment():
     assert result["net_payment"] == calculated_net
 
 
-def test_calculate_purchase_breakdown():
+def test_calculate_purchase_breakdown(purchase_date):
     """Test complete purchase breakdown calculation."""
     bond_shares = Decimal("10000")
-    purchase_date = date(2024, 1, 1)
     maturity_years = 2
     discount_rate = Decimal("0.10")
 
@@ -136,8 +135,17 @@ def test_rounding_precision():
 
     # All monetary values should have exactly 2 decimal places
     for key, value in result.items():
-        # Convert to string and check decimal places
-        str_value = str(value)
-        if "." in str_value:
-            decimal_places = len(str_value.split(".")[1])
-            assert decimal_places == 2, f"{key} should have 2 decimal places, has {decimal_places}"
+        # The exponent is the negated number of decimal places
+        exponent = value.as_tuple().exponent
+        assert exponent in (0, -2), f"{key} should have 2 decimal places, has {-exponent}"
+
+
+def test_calculate_coupon_payment_with_rate_days(face_value):
+    """Test that a precomputed rate × days gives the same breakdown."""
+    daily_rate = Decimal("0.000247")
+    calendar_days = 183
+
+    rate_days = BondCalculator.calculate_rate_days(daily_rate, calendar_days)
+    result = BondCalculator.calculate_coupon_payment_with_rate_days(face_value, rate_days)
+
+    assert result == BondCalculator.calculate_coupon_payment(face_value, daily_rate, calendar_days)
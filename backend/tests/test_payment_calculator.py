@@ -0,0 +1,69 @@
+"""
+Tests for the Payment Calculator service.
+"""
+import pytest
+from decimal import Decimal
+from types import SimpleNamespace
+from app.models import EventType
+from app.services.payment_calculator import (
+    PaymentCalculatorService, VECTORIZE_THRESHOLD, _RESULT_DECIMAL_FIELDS
+)
+
+
+RATES = dict(
+    effective_rate=Decimal("0.205"),
+    coupon_rate_period=Decimal("0.0925"),
+    wht_rate=Decimal("0.15"),
+    boz_fee_rate=Decimal("0.01"),
+    coop_fee_rate=Decimal("0.02")
+)
+
+
+def _holdings(shares):
+    return [
+        SimpleNamespace(
+            bond_shares=value, member_face_value=value, user_id=index,
+            username=f"M{index:04d}", first_name="First", last_name="Last"
+        )
+        for index, value in enumerate(shares, start=1)
+    ]
+
+
+def _both_paths(event_type, shares, total_boz_award):
+    event = SimpleNamespace(event_type=event_type, calculation_period="Jan-Jun")
+    holdings = _holdings(shares)
+    total_shares = sum(shares)
+    decimal_results = PaymentCalculatorService._calculate_payments_decimal(
+        event, holdings, total_shares, total_boz_award, **RATES
+    )
+    vectorized_results = PaymentCalculatorService._calculate_payments_vectorized(
+        event, holdings, total_boz_award, **RATES
+    )
+    assert vectorized_results is not None
+    return decimal_results, vectorized_results
+
+
+def _assert_same(decimal_results, vectorized_results):
+    assert len(decimal_results) == len(vectorized_results)
+    for expected, actual in zip(decimal_results, vectorized_results):
+        for name in _RESULT_DECIMAL_FIELDS:
+            assert getattr(actual, name) == getattr(expected, name), (expected.member_id, name)
+
+
+def test_boz_award_rounds_exact_quotient():
+    """5 of 1100 shares of an 18.70 award is exactly 0.085, which rounds up to 0.09."""
+    shares = [Decimal("5")] + [Decimal("1")] * (VECTORIZE_THRESHOLD - 1)
+    shares[-1] += Decimal("1100") - sum(shares)
+    decimal_results, vectorized_results = _both_paths(
+        EventType.DISCOUNT_MATURITY, shares, Decimal("18.70")
+    )
+    assert decimal_results[0].boz_award_value == Decimal("0.09")
+    _assert_same(decimal_results, vectorized_results)
+
+
+@pytest.mark.parametrize("event_type", [EventType.DISCOUNT_MATURITY, EventType.COUPON_SEMI_ANNUAL])
+@pytest.mark.parametrize("count", [VECTORIZE_THRESHOLD - 1, VECTORIZE_THRESHOLD, VECTORIZE_THRESHOLD + 1])
+def test_vectorized_matches_decimal_loop(event_type, count):
+    """Both calculation paths give identical amounts around the vectorize threshold."""
+    shares = [Decimal(5 + (index * 37) % 400) + Decimal("0.50") * (index % 2) for index in range(count)]
+    _assert_same(*_both_paths(event_type, shares, Decimal("123456.78")))